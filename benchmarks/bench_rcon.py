@@ -0,0 +1,394 @@
+"""
+RCON 경로 부하 측정
+가짜 RCON 서버(fake_rcon.py)를 띄우고 실제 MinecraftCommands Cog의 선택 메뉴 / 입력 창 핸들러에
+Discord 상호작용 대역(stub)을 넣어 N개의 상호작용을 동시에 실행
+
+- 처리량 (상호작용/초), 지연 시간 p50/p95/p99 (선택부터 최종 응답까지)
+- 이벤트 루프 지연 (주기적으로 잠든 태스크가 늦게 깨어난 시간)
+- RCON 명령어 지연 분위수 (봇 지표 레지스트리)
+
+결과는 JSON으로 저장되며 --compare로 이전 결과와 비교
+
+사용법:
+    python benchmarks/bench_rcon.py --interactions 2000 --concurrency 100 --latency 0.005
+    python benchmarks/bench_rcon.py --label after --compare benchmarks/results/rcon-before.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.fake_rcon import FakeRconOptions, FakeRconServer
+from command.minecraft import MENU_ACTIONS, MinecraftCommands
+from utils.metrics import MetricsRegistry
+from utils.permissions import EVERYONE, Authorizer
+
+DEFAULT_MIX = {
+    "server_status": 30,
+    "list_players": 20,
+    "whitelist_list": 20,
+    "whitelist_add": 10,
+    "server_command": 10,
+    "say_message": 10,
+}
+MODAL_INPUTS = {
+    "whitelist_add": lambda n: f"Bench{n}",
+    "whitelist_remove": lambda n: f"Bench{n}",
+    "op_add": lambda n: f"Bench{n}",
+    "op_remove": lambda n: f"Bench{n}",
+    "kill_player": lambda n: f"Bench{n}",
+    "server_command": lambda n: "data get storage bench:result",
+    "say_message": lambda n: f"benchmark message {n}",
+}
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+
+# ==================== Discord 대역 ====================
+
+class StubBot:
+    """Cog가 사용하는 봇 속성만 갖춘 대역 (게이트웨이 연결 없음)"""
+
+    def __init__(self, config: dict):
+        self.config = config
+        self.metrics = MetricsRegistry()
+        self.authorizer = Authorizer(config)
+        self.presence_player_count = None
+        self.cogs: dict[str, object] = {}
+
+    def get_cog(self, name: str):
+        return self.cogs.get(name)
+
+    def dispatch(self, event_name: str, *args) -> None:
+        pass
+
+    async def _set_presence(self, player_count: Optional[int] = None) -> None:
+        self.presence_player_count = player_count
+
+
+class StubResponse:
+    def __init__(self, interaction: "StubInteraction"):
+        self._interaction = interaction
+        self._done = False
+
+    def is_done(self) -> bool:
+        return self._done
+
+    async def _respond(self) -> None:
+        self._done = True
+        self._interaction.responded_at = time.perf_counter()
+
+    async def defer(self, **kwargs) -> None:
+        await self._respond()
+
+    async def send_message(self, *args, **kwargs) -> None:
+        await self._respond()
+        self._interaction.finished_at = time.perf_counter()
+
+    async def edit_message(self, **kwargs) -> None:
+        await self._respond()
+        self._interaction.finished_at = time.perf_counter()
+
+    async def send_modal(self, modal) -> None:
+        await self._respond()
+        self._interaction.modal = modal
+
+
+class StubFollowup:
+    def __init__(self, interaction: "StubInteraction"):
+        self._interaction = interaction
+
+    async def send(self, *args, **kwargs) -> None:
+        self._interaction.finished_at = time.perf_counter()
+        self._interaction.messages.append(kwargs.get("embed") or (args[0] if args else None))
+
+
+class StubUser:
+    """역할이 없는 사용자 대역 (권한 판정과 감사 기록에 필요한 속성만)"""
+
+    def __init__(self, user_id: int = 0, name: str = "bench"):
+        self.id = user_id
+        self.name = name
+
+    def __str__(self) -> str:
+        return self.name
+
+
+class StubInteraction:
+    """선택 메뉴 / 입력 창 핸들러가 사용하는 상호작용 속성만 갖춘 대역"""
+
+    def __init__(self, client: StubBot):
+        self.client = client
+        self.created_at = datetime.now(timezone.utc)
+        self.user = StubUser()
+        self.response = StubResponse(self)
+        self.followup = StubFollowup(self)
+        self.modal = None
+        self.messages: list = []
+        self.responded_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+
+
+# ==================== 측정 ====================
+
+def percentile(values: list[float], q: float) -> Optional[float]:
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(q * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def summarize(values: list[float]) -> dict:
+    return {
+        "count": len(values),
+        "mean_ms": round(sum(values) / len(values) * 1000, 3) if values else None,
+        **{
+            f"p{int(q * 100)}_ms": round(percentile(values, q) * 1000, 3) if values else None
+            for q in (0.5, 0.95, 0.99)
+        },
+        "max_ms": round(max(values) * 1000, 3) if values else None,
+    }
+
+
+async def monitor_loop_lag(interval: float, samples: list[float], stop: asyncio.Event) -> None:
+    """interval마다 잠들었다가 예정보다 늦게 깨어난 시간을 기록"""
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected = loop.time() + interval
+        await asyncio.sleep(interval)
+        samples.append(max(0.0, loop.time() - expected))
+
+
+async def simulate(cog: MinecraftCommands, bot: StubBot, value: str, target: str, number: int) -> tuple[float, float, bool]:
+    """
+    메뉴 선택 하나를 실행 (입력 창이 뜨면 바로 제출)
+
+    Returns:
+        tuple[float, float, bool]: (첫 응답까지 시간, 최종 응답까지 시간, 성공 여부)
+    """
+    started = time.perf_counter()
+    interaction = StubInteraction(bot)
+    view = cog.ServerManagementView(cog, interaction.user)
+    view.target = target
+    select = view.children[-1]
+    select._values = [value]
+    await select.callback(interaction)
+    first = interaction.responded_at
+
+    if interaction.modal is not None:
+        modal = interaction.modal
+        modal.input._value = MODAL_INPUTS[value](number)
+        interaction = StubInteraction(bot)
+        await modal.on_submit(interaction)
+    view.stop()
+
+    finished = interaction.finished_at
+    if first is None or finished is None:
+        return (time.perf_counter() - started, time.perf_counter() - started, False)
+    return (first - started, finished - started, True)
+
+
+async def run_benchmark(args: argparse.Namespace, mix: dict[str, int]) -> dict:
+    options = FakeRconOptions(
+        password="bench",
+        latency=args.latency,
+        jitter=args.jitter,
+        response_size=args.response_size,
+        auth_failure_rate=args.auth_failure_rate,
+        drop_rate=args.drop_rate,
+        seed=args.seed
+    )
+    fake_servers = [await FakeRconServer(options=options).start() for _ in range(args.servers)]
+    config = {
+        "minecraft_rcon": {
+            "password": "bench",
+            "pool_size": args.pool_size,
+            "rate_limit": args.rate_limit,
+            "rate_burst": args.rate_limit,
+            "queue_size": args.queue_size,
+            "status_backend": "rcon",
+            "timeout": args.timeout,
+            "broadcast_timeout": args.timeout * 2,
+        },
+        "minecraft_servers": [
+            {"name": f"bench{index}", "host": server.host, "port": server.port}
+            for index, server in enumerate(fake_servers)
+        ],
+        # 대역 사용자는 역할이 없으므로 모든 메뉴 작업을 허용
+        "permissions": {"commands": {action: EVERYONE for action in MENU_ACTIONS}},
+    }
+    bot = StubBot(config)
+    cog = MinecraftCommands(bot)
+    bot.cogs["MinecraftCommands"] = cog
+    target = "*" if args.servers > 1 and args.broadcast else next(iter(cog.servers))
+
+    rng = random.Random(args.seed)
+    plan = rng.choices(list(mix), weights=list(mix.values()), k=args.interactions)
+    semaphore = asyncio.Semaphore(args.concurrency)
+    first_responses: list[float] = []
+    totals: dict[str, list[float]] = {}
+    failures = 0
+
+    async def worker(number: int, value: str) -> None:
+        nonlocal failures
+        async with semaphore:
+            try:
+                first, total, ok = await simulate(cog, bot, value, target, number)
+            except Exception:
+                failures += 1
+                return
+        if not ok:
+            failures += 1
+        first_responses.append(first)
+        totals.setdefault(value, []).append(total)
+
+    lag_samples: list[float] = []
+    stop = asyncio.Event()
+    monitor = asyncio.create_task(monitor_loop_lag(args.lag_interval, lag_samples, stop))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(number, value) for number, value in enumerate(plan)))
+    elapsed = time.perf_counter() - started
+
+    stop.set()
+    await monitor
+    await cog.cog_unload()
+    for server in fake_servers:
+        await server.stop()
+
+    all_totals = [value for values in totals.values() for value in values]
+    rcon_latency = bot.metrics.get("rcon_command_duration_seconds")
+    rcon_errors = bot.metrics.get("rcon_command_errors_total")
+    return {
+        "label": args.label,
+        "created_at": time.time(),
+        "parameters": {
+            "interactions": args.interactions,
+            "concurrency": args.concurrency,
+            "servers": args.servers,
+            "broadcast": bool(args.broadcast and args.servers > 1),
+            "pool_size": args.pool_size,
+            "rate_limit": args.rate_limit,
+            "queue_size": args.queue_size,
+            "latency": args.latency,
+            "jitter": args.jitter,
+            "response_size": args.response_size,
+            "auth_failure_rate": args.auth_failure_rate,
+            "drop_rate": args.drop_rate,
+            "mix": mix,
+        },
+        "elapsed_seconds": round(elapsed, 4),
+        "throughput_per_second": round(len(plan) / elapsed, 2) if elapsed else None,
+        "failures": failures,
+        "first_response": summarize(first_responses),
+        "total": summarize(all_totals),
+        "by_action": {value: summarize(values) for value, values in sorted(totals.items())},
+        "event_loop_lag": summarize(lag_samples),
+        "rcon": {
+            "commands": sum(series.count for series in rcon_latency.series().values()) if rcon_latency else 0,
+            "errors": int(sum(rcon_errors._values.values())) if rcon_errors else 0,
+            "server_commands": sum(server.stats["commands"] for server in fake_servers),
+            "connections": sum(server.stats["connections"] for server in fake_servers),
+        },
+    }
+
+
+# ==================== 출력 ====================
+
+def print_report(result: dict) -> None:
+    print(f"상호작용 {result['parameters']['interactions']}개 · 동시 {result['parameters']['concurrency']}개 "
+          f"· {result['elapsed_seconds']}s · {result['throughput_per_second']}/s · 실패 {result['failures']}")
+    print(f"{'구분':<16}{'n':>7}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    rows = [("첫 응답", result["first_response"]), ("전체", result["total"])]
+    rows += list(result["by_action"].items())
+    rows.append(("루프 지연", result["event_loop_lag"]))
+    for name, stats in rows:
+        print(f"{name:<16}{stats['count']:>7}{str(stats['p50_ms']):>10}{str(stats['p95_ms']):>10}"
+              f"{str(stats['p99_ms']):>10}{str(stats['max_ms']):>10}")
+    rcon = result["rcon"]
+    print(f"RCON 명령어 {rcon['commands']}개 (서버 도달 {rcon['server_commands']}) · 오류 {rcon['errors']} · 연결 {rcon['connections']}")
+
+
+def print_comparison(before: dict, after: dict) -> None:
+    def delta(old, new) -> str:
+        if old in (None, 0) or new is None:
+            return "-"
+        return f"{(new - old) / old * 100:+.1f}%"
+
+    print(f"\n비교: {before.get('label') or '이전'} → {after.get('label') or '현재'}")
+    print(f"{'항목':<22}{'이전':>12}{'현재':>12}{'변화':>10}")
+    rows = [("처리량 /s", before["throughput_per_second"], after["throughput_per_second"])]
+    for section, name in (("total", "전체"), ("first_response", "첫 응답"), ("event_loop_lag", "루프 지연")):
+        for key in ("p50_ms", "p95_ms", "p99_ms"):
+            rows.append((f"{name} {key}", before[section][key], after[section][key]))
+    for name, old, new in rows:
+        print(f"{name:<22}{str(old):>12}{str(new):>12}{delta(old, new):>10}")
+
+
+def parse_mix(text: Optional[str]) -> dict[str, int]:
+    """"server_status=3,whitelist_add=1" 형식의 작업 비율 파싱"""
+    if not text:
+        return dict(DEFAULT_MIX)
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        mix[name.strip()] = int(weight or 1)
+    return mix
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="RCON 경로 부하 측정 (가짜 RCON 서버 사용)")
+    parser.add_argument("--interactions", type=int, default=1000, help="실행할 상호작용 수")
+    parser.add_argument("--concurrency", type=int, default=50, help="동시에 실행할 상호작용 수")
+    parser.add_argument("--mix", help="작업 비율 (예: server_status=3,whitelist_list=1,say_message=1)")
+    parser.add_argument("--servers", type=int, default=1, help="가짜 서버 수")
+    parser.add_argument("--broadcast", action="store_true", help="서버가 여러 개일 때 전체 서버 대상으로 실행")
+    parser.add_argument("--pool-size", type=int, default=2, help="서버당 RCON 연결 풀 크기")
+    parser.add_argument("--rate-limit", type=float, default=50.0, help="서버당 초당 명령어 수 (0이면 제한 없음)")
+    parser.add_argument("--queue-size", type=int, default=100, help="서버당 명령어 대기열 길이")
+    parser.add_argument("--timeout", type=float, default=5.0, help="RCON 제한 시간 (초)")
+    parser.add_argument("--latency", type=float, default=0.002, help="가짜 서버 명령어 처리 시간 (초)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="가짜 서버 무작위 추가 지연 (초)")
+    parser.add_argument("--response-size", type=int, default=0, help="서버 명령어 응답 크기 (바이트)")
+    parser.add_argument("--auth-failure-rate", type=float, default=0.0)
+    parser.add_argument("--drop-rate", type=float, default=0.0)
+    parser.add_argument("--lag-interval", type=float, default=0.01, help="이벤트 루프 지연 측정 주기 (초)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--label", help="결과 이름 (저장 파일명에 사용)")
+    parser.add_argument("--output", help="결과 JSON 저장 경로 (기본값: benchmarks/results/rcon-<label>.json)")
+    parser.add_argument("--no-save", action="store_true", help="결과를 저장하지 않음")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON 경로")
+    args = parser.parse_args()
+
+    mix = parse_mix(args.mix)
+    unknown = [name for name in mix if name not in MODAL_INPUTS and name not in DEFAULT_MIX]
+    if unknown:
+        parser.error(f"알 수 없는 작업: {', '.join(unknown)}")
+
+    result = asyncio.run(run_benchmark(args, mix))
+    print_report(result)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as compare_file:
+            print_comparison(json.load(compare_file), result)
+
+    if not args.no_save:
+        output = args.output or os.path.join(
+            RESULTS_DIR, f"rcon-{args.label or time.strftime('%Y%m%d-%H%M%S')}.json"
+        )
+        os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+        with open(output, "w", encoding="utf-8") as output_file:
+            json.dump(result, output_file, ensure_ascii=False, indent=2)
+        print(f"\n✅ 결과 저장: {output}")
+
+
+if __name__ == "__main__":
+    main()
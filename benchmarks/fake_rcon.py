@@ -0,0 +1,209 @@
+"""
+테스트용 가짜 RCON 서버
+바닐라 마인크래프트 RCON 동작을 흉내내며 지연 시간, 응답 크기, 인증 실패, 연결 끊김을 설정할 수 있음
+
+- 명령어는 서버 메인 스레드처럼 전역 락으로 하나씩 처리 (latency만큼 지연)
+- 4096바이트를 넘는 응답은 여러 패킷으로 나눠 전송
+- 알 수 없는 패킷 타입에는 "Unknown request" 응답
+
+사용법:
+    python benchmarks/fake_rcon.py --port 25575 --password test --latency 0.02
+"""
+
+import argparse
+import asyncio
+import random
+import struct
+from dataclasses import dataclass, field
+from typing import Optional
+
+PACKET_TYPE_RESPONSE = 0
+PACKET_TYPE_COMMAND = 2
+PACKET_TYPE_AUTH = 3
+MAX_RESPONSE_PACKET = 4096
+
+
+@dataclass
+class FakeRconOptions:
+    """
+    가짜 서버 동작 설정
+
+    Attributes:
+        password: RCON 비밀번호
+        latency: 명령어당 처리 시간 (초)
+        jitter: 처리 시간에 더할 무작위 지연 최대값 (초)
+        response_size: 일반 명령어 응답 크기 (바이트, 0이면 짧은 응답)
+        auth_failure_rate: 올바른 비밀번호여도 인증을 거부할 확률
+        drop_rate: 명령어마다 응답 없이 연결을 끊을 확률
+        players: `list` 응답에 포함할 플레이어 이름
+        whitelist: `whitelist list` 응답에 포함할 플레이어 이름
+        seed: 난수 시드
+    """
+    password: str = "test"
+    latency: float = 0.0
+    jitter: float = 0.0
+    response_size: int = 0
+    auth_failure_rate: float = 0.0
+    drop_rate: float = 0.0
+    players: list[str] = field(default_factory=lambda: [f"Player{i}" for i in range(5)])
+    whitelist: list[str] = field(default_factory=lambda: [f"Player{i}" for i in range(50)])
+    max_players: int = 20
+    seed: Optional[int] = None
+
+
+class FakeRconServer:
+    """asyncio 기반 가짜 RCON 서버"""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, options: Optional[FakeRconOptions] = None):
+        self.host = host
+        self.port = port
+        self.options = options or FakeRconOptions()
+        self.random = random.Random(self.options.seed)
+        self.main_thread = asyncio.Lock()  # 서버 메인 스레드
+        self.stats = {"connections": 0, "auth_failures": 0, "commands": 0, "dropped": 0}
+        self._server: Optional[asyncio.base_events.Server] = None
+        self._writers: set[asyncio.StreamWriter] = set()
+        self._handlers: set[asyncio.Task] = set()
+
+    async def start(self) -> "FakeRconServer":
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def stop(self) -> None:
+        """리스너와 열린 연결을 모두 닫음 (서버 재시작 흉내)"""
+        for writer in list(self._writers):
+            writer.close()
+        await asyncio.gather(*self._handlers, return_exceptions=True)
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self) -> "FakeRconServer":
+        return await self.start()
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
+
+    # ==================== 프로토콜 ====================
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.stats["connections"] += 1
+        self._writers.add(writer)
+        self._handlers.add(asyncio.current_task())
+        authenticated = False
+        try:
+            while True:
+                (length,) = struct.unpack("<i", await reader.readexactly(4))
+                data = await reader.readexactly(length)
+                request_id, packet_type = struct.unpack_from("<ii", data)
+                payload = data[8:-2].decode("utf-8", errors="replace")
+
+                if packet_type == PACKET_TYPE_AUTH:
+                    ok = payload == self.options.password and self.random.random() >= self.options.auth_failure_rate
+                    if not ok:
+                        self.stats["auth_failures"] += 1
+                    authenticated = ok
+                    self._write(writer, request_id if ok else -1, PACKET_TYPE_COMMAND, "")
+                elif not authenticated:
+                    break
+                elif packet_type == PACKET_TYPE_COMMAND:
+                    if self.random.random() < self.options.drop_rate:
+                        self.stats["dropped"] += 1
+                        break
+                    response = await self._execute(payload)
+                    for offset in range(0, max(len(response), 1), MAX_RESPONSE_PACKET):
+                        self._write(writer, request_id, PACKET_TYPE_RESPONSE, response[offset:offset + MAX_RESPONSE_PACKET])
+                else:
+                    self._write(writer, request_id, PACKET_TYPE_RESPONSE, f"Unknown request {packet_type:x}".encode())
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self._writers.discard(writer)
+            self._handlers.discard(asyncio.current_task())
+            writer.close()
+
+    def _write(self, writer: asyncio.StreamWriter, request_id: int, packet_type: int, body) -> None:
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        writer.write(struct.pack("<iii", len(body) + 10, request_id, packet_type) + body + b"\x00\x00")
+
+    async def _execute(self, command: str) -> bytes:
+        async with self.main_thread:
+            delay = self.options.latency + self.random.uniform(0, self.options.jitter)
+            if delay:
+                await asyncio.sleep(delay)
+            self.stats["commands"] += 1
+            return self._respond(command.lstrip("/")).encode("utf-8")
+
+    def _respond(self, command: str) -> str:
+        options = self.options
+        words = command.split()
+        if command == "list":
+            return (
+                f"There are {len(options.players)} of a max of {options.max_players} players online: "
+                + ", ".join(options.players)
+            )
+        if command == "whitelist list":
+            if not options.whitelist:
+                return "There are no whitelisted players"
+            return f"There are {len(options.whitelist)} whitelisted player(s): " + ", ".join(options.whitelist)
+        if words[:2] == ["whitelist", "add"] and len(words) == 3:
+            if words[2] in options.whitelist:
+                return "Player is already whitelisted"
+            options.whitelist.append(words[2])
+            return f"Added {words[2]} to the whitelist"
+        if words[:2] == ["whitelist", "remove"] and len(words) == 3:
+            if words[2] not in options.whitelist:
+                return "Player is not whitelisted"
+            options.whitelist.remove(words[2])
+            return f"Removed {words[2]} from the whitelist"
+        if words[:1] == ["op"] and len(words) == 2:
+            return f"Made {words[1]} a server operator"
+        if words[:1] == ["deop"] and len(words) == 2:
+            return f"Made {words[1]} no longer a server operator"
+        if words[:1] == ["say"]:
+            return ""
+        if options.response_size:
+            return ("x" * 63 + "\n") * (options.response_size // 64) + "x" * (options.response_size % 64)
+        return f"Executed: {command}"
+
+
+async def _serve(args: argparse.Namespace) -> None:
+    options = FakeRconOptions(
+        password=args.password,
+        latency=args.latency,
+        jitter=args.jitter,
+        response_size=args.response_size,
+        auth_failure_rate=args.auth_failure_rate,
+        drop_rate=args.drop_rate,
+        seed=args.seed
+    )
+    async with FakeRconServer(args.host, args.port, options) as server:
+        print(f"🧪 가짜 RCON 서버 실행 중: {server.host}:{server.port} (비밀번호: {options.password})")
+        await asyncio.Event().wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="테스트용 가짜 RCON 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=25575)
+    parser.add_argument("--password", default="test")
+    parser.add_argument("--latency", type=float, default=0.0, help="명령어당 처리 시간 (초)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="무작위 추가 지연 최대값 (초)")
+    parser.add_argument("--response-size", type=int, default=0, help="일반 명령어 응답 크기 (바이트)")
+    parser.add_argument("--auth-failure-rate", type=float, default=0.0)
+    parser.add_argument("--drop-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(_serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+"""
+게이트웨이 프로필별 메모리 / 시작 비용 측정
+실제 Discord 연결 없이 GUILD_CREATE / GUILD_MEMBERS_CHUNK 페이로드를 합성해
+discord.py 내부 상태(ConnectionState)에 직접 주입하고 캐시에 남는 메모리를 측정
+
+사용법:
+    python benchmarks/gateway_memory.py --guilds 200 --members 2000
+    python benchmarks/gateway_memory.py --profiles lean full --output benchmarks/results/gateway.json
+"""
+
+import argparse
+import gc
+import json
+import math
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import discord
+from discord.ext import commands
+
+from main import GATEWAY_PROFILES, build_gateway_options
+
+BOT_USER_ID = 1
+LARGE_THRESHOLD = 250    # 프레즌스 인텐트가 있을 때 GUILD_CREATE에 포함되는 최대 멤버 수
+CHUNK_SIZE = 1000        # GUILD_MEMBERS_CHUNK 하나에 포함되는 최대 멤버 수
+ROLES_PER_GUILD = 20
+CHANNELS_PER_GUILD = 10
+
+
+# ==================== 페이로드 생성 ====================
+
+def member_payload(user_id: int, role_ids: list[str]) -> dict:
+    return {
+        "user": {
+            "id": str(user_id),
+            "username": f"user{user_id}",
+            "discriminator": "0",
+            "global_name": None,
+            "avatar": None,
+        },
+        "roles": role_ids,
+        "joined_at": "2024-01-01T00:00:00+00:00",
+        "deaf": False,
+        "mute": False,
+        "flags": 0,
+    }
+
+
+def presence_payload(user_id: int) -> dict:
+    return {
+        "user": {"id": str(user_id)},
+        "status": "online",
+        "activities": [{"name": "Minecraft", "type": 0}],
+        "client_status": {"desktop": "online"},
+    }
+
+
+def guild_payload(index: int, members: int, intents: discord.Intents) -> tuple[dict, list[dict]]:
+    """
+    게이트웨이가 보내는 것과 같은 규칙으로 GUILD_CREATE와 청크 멤버 목록 생성
+
+    - presences 인텐트가 없으면 GUILD_CREATE에는 봇 자신만 포함
+    - presences 인텐트가 있으면 최대 LARGE_THRESHOLD명과 그 프레즌스 포함
+
+    Returns:
+        tuple[dict, list[dict]]: (GUILD_CREATE 페이로드, 청킹으로 받게 될 전체 멤버)
+    """
+    guild_id = 10_000_000 + index
+    base_user = 100_000_000 + index * members
+    role_ids = [str(guild_id * 100 + r) for r in range(ROLES_PER_GUILD)]
+    roles = [
+        {"id": role_id, "name": f"role{n}", "permissions": "0", "position": n, "color": 0,
+         "hoist": False, "managed": False, "mentionable": False, "flags": 0}
+        for n, role_id in enumerate(role_ids)
+    ]
+    roles[0]["id"] = str(guild_id)  # @everyone
+    channels = [
+        {"id": str(guild_id * 1000 + c), "type": 0, "name": f"channel{c}", "position": c,
+         "permission_overwrites": [], "nsfw": False, "parent_id": None}
+        for c in range(CHANNELS_PER_GUILD)
+    ]
+    all_members = [
+        member_payload(base_user + m, role_ids[1 + m % 3: 2 + m % 3])
+        for m in range(members)
+    ]
+
+    initial_members = [member_payload(BOT_USER_ID, [])]
+    presences = []
+    if intents.presences:
+        initial_members += all_members[:LARGE_THRESHOLD]
+        presences = [presence_payload(base_user + m) for m in range(min(members, LARGE_THRESHOLD))]
+
+    payload = {
+        "id": str(guild_id),
+        "name": f"guild{index}",
+        "owner_id": str(base_user),
+        "member_count": members + 1,
+        "large": members + 1 > LARGE_THRESHOLD,
+        "roles": roles,
+        "channels": channels,
+        "members": initial_members,
+        "presences": presences,
+        "emojis": [],
+        "stickers": [],
+        "features": [],
+        "voice_states": [],
+        "threads": [],
+        "verification_level": 0,
+        "default_message_notifications": 0,
+        "explicit_content_filter": 0,
+        "mfa_level": 0,
+        "premium_tier": 0,
+        "nsfw_level": 0,
+        "preferred_locale": "ko",
+    }
+    return payload, all_members
+
+
+# ==================== 측정 ====================
+
+def measure_profile(profile: str, guild_count: int, members: int) -> dict:
+    """
+    프로필 하나로 봇 상태를 만들고 합성 게이트웨이 이벤트를 주입해 측정
+
+    Returns:
+        dict: 측정 결과
+    """
+    options = build_gateway_options({"gateway": {"profile": profile}})
+    intents = options["intents"]
+
+    gc.collect()
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    started = time.perf_counter()
+
+    bot = commands.Bot(command_prefix="!", **options)
+    state = bot._connection
+    state.user = discord.ClientUser(
+        state=state,
+        data={"id": str(BOT_USER_ID), "username": "bot", "discriminator": "0", "avatar": None, "bot": True},
+    )
+
+    chunk_payloads = 0
+    for index in range(guild_count):
+        payload, all_members = guild_payload(index, members, intents)
+        guild = state._add_guild_from_data(payload)
+
+        # 시작 시 청킹: 전체 멤버를 CHUNK_SIZE 단위로 받아 캐시 (프레즌스 포함 시 함께 적용)
+        if state._guild_needs_chunking(guild):
+            chunk_payloads += math.ceil(len(all_members) / CHUNK_SIZE)
+            if state.member_cache_flags.joined:
+                for data in all_members:
+                    guild._add_member(discord.Member(data=data, guild=guild, state=state))
+        del payload, all_members
+
+    elapsed = time.perf_counter() - started
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    cached_members = sum(len(guild._members) for guild in state._guilds.values())
+    result = {
+        "profile": profile,
+        "intents": intents.value,
+        "member_cache_flags": options["member_cache_flags"].value,
+        "chunk_guilds_at_startup": options["chunk_guilds_at_startup"],
+        "max_messages": options["max_messages"],
+        "guilds": guild_count,
+        "members_per_guild": members,
+        "cached_members": cached_members,
+        "chunk_payloads": chunk_payloads,
+        "retained_mb": round((current - baseline) / 1024 / 1024, 2),
+        "peak_mb": round((peak - baseline) / 1024 / 1024, 2),
+        "processing_seconds": round(elapsed, 3),
+    }
+    del bot, state
+    gc.collect()
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="게이트웨이 프로필별 메모리 / 시작 비용 측정")
+    parser.add_argument("--guilds", type=int, default=100, help="길드 수")
+    parser.add_argument("--members", type=int, default=1000, help="길드당 멤버 수")
+    parser.add_argument("--profiles", nargs="+", default=list(GATEWAY_PROFILES), help="측정할 프로필")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    results = [measure_profile(profile, args.guilds, args.members) for profile in args.profiles]
+
+    print(f"{'프로필':<8}{'캐시 멤버':>12}{'청크':>8}{'유지 MB':>10}{'최대 MB':>10}{'처리 s':>10}")
+    for r in results:
+        print(
+            f"{r['profile']:<8}{r['cached_members']:>12}{r['chunk_payloads']:>8}"
+            f"{r['retained_mb']:>10}{r['peak_mb']:>10}{r['processing_seconds']:>10}"
+        )
+
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as output_file:
+            json.dump({"created_at": time.time(), "results": results}, output_file, ensure_ascii=False, indent=2)
+        print(f"\n✅ 결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
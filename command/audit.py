@@ -0,0 +1,189 @@
+import discord
+from discord import app_commands, Interaction, Embed
+from discord.ext import commands
+import asyncio
+import datetime
+from typing import Any, Optional
+
+from command.minecraft import ALL_SERVERS, MENU_ACTIONS, truncate
+from utils.audit import AuditEntry, AuditLog
+from utils.ipc import IpcError
+from utils.metrics import instrument_interaction, mark_first_response
+from utils.permissions import EVERYONE, has_permission
+
+# 기록하는 관리 작업: 작업 이름 → 표시 이름
+AUDITED_ACTIONS = {
+    value: label for value, (label, _, tier) in MENU_ACTIONS.items()
+    if tier != EVERYONE and value != "whitelist_list"
+}
+
+class AuditTrail(commands.Cog):
+    """
+    관리 작업 감사 기록 Cog
+    `minecraft_audit` 이벤트를 JSON Lines 파일에 기록하고 최근 기록을 사용자/플레이어/작업별로 조회한다.
+
+    여러 워커 프로세스로 실행하면 첫 번째 워커만 파일에 쓰고,
+    나머지 워커는 기록과 조회를 Unix 소켓으로 첫 번째 워커에 보낸다.
+    """
+
+    def __init__(self, bot: commands.Bot) -> None:
+        self.bot = bot
+        self.audit_config = bot.config.get('audit', {}) or {}
+        self.client = getattr(bot, 'ipc_client', None)
+        self.log: Optional[AuditLog] = None
+        if self.client is None and self.audit_config.get('enabled', True):
+            self.log = AuditLog(
+                self.audit_config.get('path', 'data/audit.jsonl'),
+                max_bytes=self.audit_config.get('max_bytes', 10 * 1024 * 1024),
+                backup_count=self.audit_config.get('backup_count', 5),
+                batch_size=self.audit_config.get('batch_size', 200),
+                flush_interval=self.audit_config.get('flush_interval', 1.0),
+                fsync_interval=self.audit_config.get('fsync_interval', 5.0),
+                index_size=self.audit_config.get('index_size', 5000)
+            )
+        self._forwarding: set[asyncio.Task] = set()
+
+    async def cog_load(self) -> None:
+        if self.log is not None:
+            loaded = await self.log.open()
+            print(f"📜 감사 기록: {self.log.path} (최근 {loaded}건 색인)")
+        ipc_server = getattr(self.bot, 'ipc_server', None)
+        if ipc_server is not None:
+            ipc_server.register("audit_record", self.ipc_record)
+            ipc_server.register("audit_query", self.ipc_query)
+
+    async def cog_unload(self) -> None:
+        ipc_server = getattr(self.bot, 'ipc_server', None)
+        if ipc_server is not None:
+            ipc_server.unregister("audit_record")
+            ipc_server.unregister("audit_query")
+        await asyncio.gather(*self._forwarding, return_exceptions=True)
+        if self.log is not None:
+            await self.log.close()
+
+    # ==================== 기록 ====================
+
+    @commands.Cog.listener()
+    async def on_minecraft_audit(self, entry: AuditEntry) -> None:
+        print(
+            f"📜 {entry.user} ({entry.user_id}) {entry.action} @ {entry.server}: "
+            f"{entry.command} → {'성공' if entry.success else '실패'}"
+        )
+        if self.log is not None:
+            self.log.record(entry)
+        elif self.client is not None:
+            task = asyncio.create_task(self._forward(entry))
+            self._forwarding.add(task)
+            task.add_done_callback(self._forwarding.discard)
+
+    async def _forward(self, entry: AuditEntry) -> None:
+        try:
+            await self.client.request("audit_record", entry=entry.to_dict())
+        except IpcError as e:
+            print(f"⚠️  감사 기록 전달 실패 ({entry.action}): {e}")
+
+    async def query(
+        self,
+        user_id: Optional[int] = None,
+        player: Optional[str] = None,
+        action: Optional[str] = None,
+        limit: int = 10
+    ) -> list[AuditEntry]:
+        """최근 기록 조회 (기록을 맡지 않은 워커는 첫 번째 워커에 요청)"""
+        if self.log is not None:
+            return self.log.query(user_id=user_id, player=player, action=action, limit=limit)
+        if self.client is None:
+            return []
+        rows = await self.client.request("audit_query", user_id=user_id, player=player, action=action, limit=limit)
+        return [AuditEntry.from_dict(row) for row in rows]
+
+    # ==================== 워커 간 공유 ====================
+
+    async def ipc_record(self, entry: dict[str, Any]) -> None:
+        """다른 워커의 기록 요청"""
+        if self.log is not None:
+            self.log.record(AuditEntry.from_dict(entry))
+
+    async def ipc_query(
+        self,
+        user_id: Optional[int] = None,
+        player: Optional[str] = None,
+        action: Optional[str] = None,
+        limit: int = 10
+    ) -> list[dict[str, Any]]:
+        """다른 워커의 조회 요청"""
+        return [entry.to_dict() for entry in await self.query(user_id, player, action, limit)]
+
+    # ==================== 명령어 ====================
+
+    @has_permission()
+    @app_commands.command(name="감사로그", description="관리 명령어 실행 기록을 조회합니다")
+    @app_commands.rename(user="사용자", player="플레이어", action="작업", limit="개수")
+    @app_commands.describe(
+        user="실행한 사용자",
+        player="대상 플레이어",
+        action="작업 종류",
+        limit="표시할 기록 수 (기본값: 10)"
+    )
+    @app_commands.choices(action=[
+        app_commands.Choice(name=label, value=value) for value, label in AUDITED_ACTIONS.items()
+    ])
+    @instrument_interaction("감사로그")
+    async def audit_log(
+        self,
+        interaction: Interaction,
+        user: Optional[discord.User] = None,
+        player: Optional[str] = None,
+        action: Optional[app_commands.Choice[str]] = None,
+        limit: app_commands.Range[int, 1, 25] = 10
+    ) -> None:
+        """조건에 맞는 최근 관리 작업 표시"""
+        try:
+            entries = await self.query(
+                user_id=user.id if user else None,
+                player=player,
+                action=action.value if action else None,
+                limit=limit
+            )
+        except IpcError as e:
+            await interaction.response.send_message(f"❌ 감사 기록을 조회할 수 없습니다: {e}", ephemeral=True)
+            mark_first_response(interaction, "감사로그")
+            return
+
+        filters = [
+            f"사용자: {user.mention}" if user else None,
+            f"플레이어: {discord.utils.escape_markdown(player)}" if player else None,
+            f"작업: {action.name}" if action else None,
+        ]
+        embed = Embed(title="📜 감사 기록", color=discord.Color.dark_gold())
+        lines = []
+        for entry in entries:
+            at = datetime.datetime.fromtimestamp(entry.at, tz=datetime.timezone.utc)
+            server = "전체 서버" if entry.server == ALL_SERVERS else entry.server
+            command = truncate(entry.command.replace("`", "'"), 200)
+            lines.append(
+                f"{'✅' if entry.success else '❌'} {discord.utils.format_dt(at, 'f')} <@{entry.user_id}> · "
+                f"{AUDITED_ACTIONS.get(entry.action, entry.action)} · {server}\n"
+                f"`{command}`"
+            )
+        header = " · ".join(line for line in filters if line)
+        body = "\n".join(lines) if lines else "조건에 맞는 기록이 없습니다."
+        embed.description = truncate(f"{header}\n\n{body}" if header else body, 4000)
+        embed.set_footer(text=f"최신순 {len(entries)}건")
+
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+        mark_first_response(interaction, "감사로그")
+
+    async def cog_app_command_error(self, interaction: Interaction, error: app_commands.AppCommandError):
+        if isinstance(error, app_commands.CheckFailure):
+            await interaction.response.send_message("❌ 이 명령어를 사용할 권한이 없습니다.", ephemeral=True)
+        else:
+            print(f"감사 기록 명령어에서 오류 발생: {error}")
+            if not interaction.response.is_done():
+                await interaction.response.send_message("❌ 명령어 실행 중 오류가 발생했습니다.", ephemeral=True)
+            else:
+                await interaction.followup.send("❌ 명령어 실행 중 오류가 발생했습니다.", ephemeral=True)
+
+async def setup(bot: commands.Bot) -> None:
+    await bot.add_cog(AuditTrail(bot))
+    print("AuditTrail cog가 성공적으로 로드되었습니다.")
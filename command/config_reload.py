@@ -0,0 +1,151 @@
+import discord
+from discord import app_commands, Interaction, Embed
+from discord.ext import commands, tasks
+import asyncio
+import os
+from typing import Optional
+
+from command.minecraft import truncate
+from utils.config import RESTART_KEYS, ConfigError, diff_config, read_config, validate_config
+from utils.metrics import instrument_interaction, mark_first_response
+from utils.permissions import has_permission
+
+class ConfigReloader(commands.Cog):
+    """
+    config.yml 변경 감지 및 재시작 없이 적용하는 Cog
+
+    파일의 수정 시각/크기/inode를 주기적으로 확인하고, 두 번 연속 같은 값이면(저장이 끝나면) 다시 읽는다.
+    새 설정은 validate_config를 통과해야만 bot.config와 한 번에 교체되고,
+    `reload_config(old, new)` 메서드가 있는 Cog에 전달되어 필요한 부분만 다시 만든다.
+    """
+
+    def __init__(self, bot: commands.Bot) -> None:
+        self.bot = bot
+        self.path = getattr(bot, 'config_path', 'config.yml')
+        self.reload_settings = bot.config.get('config_reload', {}) or {}
+        self._lock = asyncio.Lock()
+        self._loaded_signature = self._signature()
+        self._seen_signature = self._loaded_signature
+        self.watch_config.change_interval(seconds=self.reload_settings.get('interval', 2.0))
+
+    async def cog_load(self) -> None:
+        if self.reload_settings.get('enabled', True):
+            self.watch_config.start()
+
+    async def cog_unload(self) -> None:
+        self.watch_config.cancel()
+
+    def _signature(self) -> Optional[tuple[int, int, int]]:
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    # ==================== 변경 감지 ====================
+
+    @tasks.loop(seconds=2)
+    async def watch_config(self) -> None:
+        signature = self._signature()
+        if signature is None or signature == self._loaded_signature:
+            self._seen_signature = signature
+            return
+        if signature != self._seen_signature:
+            # 저장 중일 수 있으므로 다음 확인까지 바뀌지 않으면 읽는다
+            self._seen_signature = signature
+            return
+
+        self._loaded_signature = signature
+        _, lines = await self.reload()
+        for line in lines:
+            print(f"   {line}")
+
+    @watch_config.before_loop
+    async def before_watch_config(self) -> None:
+        await self.bot.wait_until_ready()
+
+    # ==================== 적용 ====================
+
+    async def reload(self) -> tuple[bool, list[str]]:
+        """
+        설정 파일을 다시 읽어 적용
+
+        Returns:
+            tuple[bool, list[str]]: (적용 여부, 보고 내용)
+        """
+        async with self._lock:
+            self._loaded_signature = self._signature()
+            try:
+                new = await asyncio.to_thread(read_config, self.path)
+            except ConfigError as e:
+                print(f"❌ 설정 다시 읽기 실패: {e}")
+                return False, [f"❌ {e}"]
+            if not validate_config(new):
+                print("❌ 설정 다시 읽기 실패: 검증을 통과하지 못해 이전 설정을 유지합니다")
+                return False, ["❌ 검증을 통과하지 못해 이전 설정을 유지합니다 (콘솔 확인)"]
+
+            old = self.bot.config
+            changes = diff_config(old, new)
+            if not changes:
+                return True, []
+
+            # 검증된 설정으로 한 번에 교체한 뒤 각 Cog에 적용
+            self.bot.config = new
+            self.bot.administrator_role_ids = new.get("administrator_role_ids", [])
+            admin_only = self.bot.authorizer.admin_only_commands(self.bot.tree)
+            self.bot.authorizer.configure(new)
+            # Discord 기본 권한(관리자만 표시)은 동기화해야 바뀌므로 관리자 전용 여부가 바뀐 명령어가 있으면 다시 동기화
+            moved = admin_only ^ self.bot.authorizer.admin_only_commands(self.bot.tree)
+            self.reload_settings = new.get('config_reload', {}) or {}
+            self.watch_config.change_interval(seconds=self.reload_settings.get('interval', 2.0))
+
+            notes = []
+            for name, cog in list(self.bot.cogs.items()):
+                handler = getattr(cog, 'reload_config', None)
+                if cog is self or handler is None:
+                    continue
+                try:
+                    notes.extend(await handler(old, new))
+                except Exception as e:
+                    notes.append(f"⚠️ {name} 적용 실패: {e}")
+
+            if moved and getattr(self.bot, 'is_primary', True):
+                await self.bot._sync_commands()
+                notes.append(f"🔁 관리자 전용 여부가 바뀐 명령어를 다시 동기화했습니다: {', '.join(sorted(moved))}")
+
+            restart = [path for path in changes if path.split(".", 1)[0] in RESTART_KEYS]
+            lines = [f"🔧 바뀐 항목: {', '.join(changes)}", *notes]
+            if restart:
+                lines.append(f"⚠️ 재시작해야 적용되는 항목: {', '.join(restart)}")
+            print(f"🔄 설정 다시 읽기 완료 ({len(changes)}개 항목)")
+            return True, lines
+
+    @has_permission()
+    @app_commands.command(name="설정리로드", description="config.yml을 다시 읽어 재시작 없이 적용합니다")
+    @instrument_interaction("설정리로드")
+    async def reload_command(self, interaction: Interaction) -> None:
+        """설정 파일 다시 읽기"""
+        await interaction.response.defer(ephemeral=True, thinking=True)
+        mark_first_response(interaction, "설정리로드")
+
+        success, lines = await self.reload()
+        embed = Embed(
+            title="🔄 설정 다시 읽기",
+            color=discord.Color.green() if success else discord.Color.red()
+        )
+        embed.description = truncate("\n".join(lines), 4000) if lines else "바뀐 항목이 없습니다."
+        await interaction.followup.send(embed=embed, ephemeral=True)
+
+    async def cog_app_command_error(self, interaction: Interaction, error: app_commands.AppCommandError):
+        if isinstance(error, app_commands.CheckFailure):
+            await interaction.response.send_message("❌ 이 명령어를 사용할 권한이 없습니다.", ephemeral=True)
+        else:
+            print(f"설정 다시 읽기 명령어에서 오류 발생: {error}")
+            if not interaction.response.is_done():
+                await interaction.response.send_message("❌ 명령어 실행 중 오류가 발생했습니다.", ephemeral=True)
+            else:
+                await interaction.followup.send("❌ 명령어 실행 중 오류가 발생했습니다.", ephemeral=True)
+
+async def setup(bot: commands.Bot) -> None:
+    await bot.add_cog(ConfigReloader(bot))
+    print("ConfigReloader cog가 성공적으로 로드되었습니다.")
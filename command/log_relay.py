@@ -0,0 +1,207 @@
+import discord
+from discord.ext import commands, tasks
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Optional
+
+from command.minecraft import server_settings
+from utils.logtail import CHAT, EVENT_KINDS, JOIN, LEAVE, LogEvent, LogTailer
+
+MAX_MESSAGE_LENGTH = 2000
+
+@dataclass
+class RelayTarget:
+    """
+    로그를 중계할 서버 하나
+
+    Attributes:
+        name: 서버 이름
+        tailer: 로그 파일 추적기
+        channel_id: 중계할 디스코드 채널 ID
+        pending: 아직 보내지 않은 줄 (가득 차면 가장 오래된 줄부터 버림)
+        dropped: 대기열이 가득 차 버린 줄 수
+        last_message: 마지막으로 보낸 메시지 (짧은 시간 안에는 새 메시지 대신 이어서 수정)
+    """
+    name: str
+    tailer: LogTailer
+    channel_id: int
+    pending: deque = field(default_factory=deque)
+    dropped: int = 0
+    last_message: Optional[discord.Message] = None
+    last_sent_at: float = 0.0
+
+def format_event(event: LogEvent) -> str:
+    """이벤트를 디스코드 메시지 한 줄로 변환 (마크다운/멘션 무력화)"""
+    player = discord.utils.escape_markdown(event.player)
+    if event.kind == CHAT:
+        text = discord.utils.escape_mentions(discord.utils.escape_markdown(event.text))
+        return f"💬 **{player}**: {text}"
+    if event.kind == JOIN:
+        return f"📥 **{player}** 님이 접속했습니다"
+    if event.kind == LEAVE:
+        return f"📤 **{player}** 님이 나갔습니다"
+    return f"💀 {discord.utils.escape_markdown(event.text)}"
+
+class LogRelay(commands.Cog):
+    """
+    서버 로그(logs/latest.log)를 추적해 채팅/접속/퇴장/사망을 디스코드 채널로 중계하는 Cog
+    읽은 이벤트는 flush_interval마다 모아서 보내고, 직전 메시지가 최근이면 새 메시지 대신 이어서 수정한다.
+    파싱한 이벤트는 `minecraft_log_event` 이벤트(server_name, LogEvent)로도 전달된다.
+    """
+
+    def __init__(self, bot: commands.Bot) -> None:
+        self.bot = bot
+        # 여러 워커 프로세스로 실행하면 첫 번째 워커만 중계 (같은 줄을 여러 번 보내지 않도록)
+        self.enabled = getattr(bot, 'is_primary', True)
+        self.targets: list[RelayTarget] = []
+        self._retired: list[LogTailer] = []  # 다음 읽기 전에 닫을 추적기 (읽는 도중 닫지 않도록)
+        self.configure(bot.config)
+
+    def configure(self, config: dict) -> None:
+        """설정 적용 (로그 경로가 같은 서버는 기존 추적기와 대기열을 그대로 사용)"""
+        self.relay_config = config.get('log_relay', {}) or {}
+        self.events = set(self.relay_config.get('events', EVENT_KINDS))
+        self.edit_window = self.relay_config.get('edit_window', 10.0)
+        max_pending = self.relay_config.get('max_pending', 200)
+
+        existing = {(target.name, target.tailer.path): target for target in self.targets}
+        targets = []
+        for name, settings in server_settings(config).items():
+            if not settings.get('log_path'):
+                continue
+            channel_id = int(settings.get('relay_channel_id') or self.relay_config.get('channel_id') or 0)
+            target = existing.pop((name, settings['log_path']), None)
+            if target is None:
+                target = RelayTarget(
+                    name=name,
+                    tailer=LogTailer(settings['log_path'], from_start=self.relay_config.get('from_start', False)),
+                    channel_id=channel_id
+                )
+            target.channel_id = channel_id
+            target.pending = deque(target.pending, maxlen=max_pending)
+            targets.append(target)
+        self._retired.extend(target.tailer for target in existing.values())
+        self.targets = targets
+
+        self.tail_logs.change_interval(seconds=self.relay_config.get('poll_interval', 1.0))
+        self.flush_relay.change_interval(seconds=self.relay_config.get('flush_interval', 2.0))
+
+    async def reload_config(self, old: dict, new: dict) -> list[str]:
+        """설정 다시 읽기 적용"""
+        before = {target.name: target.tailer.path for target in self.targets}
+        self.configure(new)
+        after = {target.name: target.tailer.path for target in self.targets}
+        if self.enabled and self.targets and not self.tail_logs.is_running():
+            self.tail_logs.start()
+            self.flush_relay.start()
+        if before == after:
+            return []
+        return [f"📜 로그 중계 대상: {', '.join(after) or '없음'}"]
+
+    async def cog_load(self) -> None:
+        if self.enabled and self.targets:
+            self.tail_logs.start()
+            self.flush_relay.start()
+
+    async def cog_unload(self) -> None:
+        self.tail_logs.cancel()
+        self.flush_relay.cancel()
+        for target in self.targets:
+            target.tailer.close()
+        for tailer in self._retired:
+            tailer.close()
+
+    # ==================== 로그 읽기 ====================
+
+    @tasks.loop(seconds=1)
+    async def tail_logs(self) -> None:
+        """모든 서버 로그의 새 줄을 읽어 이벤트 전달 및 중계 대기열에 추가"""
+        while self._retired:
+            self._retired.pop().close()
+        targets = self.targets
+        polled = await asyncio.gather(*(asyncio.to_thread(target.tailer.poll) for target in targets))
+        prefix_names = len(targets) > 1
+        for target, events in zip(targets, polled):
+            for event in events:
+                self.bot.dispatch("minecraft_log_event", target.name, event)
+                if event.kind not in self.events or not target.channel_id:
+                    continue
+                if len(target.pending) == target.pending.maxlen:
+                    target.dropped += 1
+                line = format_event(event)
+                target.pending.append(f"[{target.name}] {line}" if prefix_names else line)
+
+    @tail_logs.before_loop
+    async def before_tail_logs(self) -> None:
+        await self.bot.wait_until_ready()
+
+    # ==================== 중계 ====================
+
+    @tasks.loop(seconds=2)
+    async def flush_relay(self) -> None:
+        await asyncio.gather(*(self.flush(target) for target in self.targets))
+
+    @flush_relay.before_loop
+    async def before_flush_relay(self) -> None:
+        await self.bot.wait_until_ready()
+
+    async def flush(self, target: RelayTarget) -> None:
+        """대기 중인 줄을 2000자 이하 메시지로 묶어 전송"""
+        if not target.pending:
+            return
+
+        lines = list(target.pending)
+        target.pending.clear()
+        if target.dropped:
+            lines.insert(0, f"⚠️ 이벤트가 너무 많아 {target.dropped}개를 생략했습니다")
+            target.dropped = 0
+
+        channel = self.bot.get_channel(target.channel_id)
+        if channel is None:
+            try:
+                channel = await self.bot.fetch_channel(target.channel_id)
+            except discord.HTTPException as e:
+                print(f"⚠️  로그 중계 채널을 찾을 수 없습니다 ({target.name}, {target.channel_id}): {e}")
+                return
+
+        # 직전 메시지가 최근이고 여유가 있으면 이어서 수정
+        content = ""
+        editing = (
+            target.last_message is not None
+            and time.monotonic() - target.last_sent_at < self.edit_window
+        )
+        if editing:
+            content = target.last_message.content
+
+        allowed_mentions = discord.AllowedMentions.none()
+        try:
+            for line in lines:
+                line = line[:MAX_MESSAGE_LENGTH]
+                if content and len(content) + 1 + len(line) > MAX_MESSAGE_LENGTH:
+                    await self._deliver(target, channel, content, editing, allowed_mentions)
+                    content, editing = "", False
+                content = f"{content}\n{line}" if content else line
+            await self._deliver(target, channel, content, editing, allowed_mentions)
+        except discord.HTTPException as e:
+            print(f"⚠️  로그 중계 실패 ({target.name}): {e}")
+            target.last_message = None
+
+    async def _deliver(
+        self,
+        target: RelayTarget,
+        channel: discord.abc.Messageable,
+        content: str,
+        editing: bool,
+        allowed_mentions: discord.AllowedMentions
+    ) -> None:
+        if editing:
+            target.last_message = await target.last_message.edit(content=content, allowed_mentions=allowed_mentions)
+        else:
+            target.last_message = await channel.send(content, allowed_mentions=allowed_mentions)
+            target.last_sent_at = time.monotonic()
+
+async def setup(bot: commands.Bot) -> None:
+    await bot.add_cog(LogRelay(bot))
+    print("LogRelay cog가 성공적으로 로드되었습니다.")
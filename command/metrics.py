@@ -0,0 +1,99 @@
+import discord
+from discord import app_commands, Interaction, Embed
+from discord.ext import commands
+from aiohttp import web
+from typing import Optional
+
+from utils.metrics import MetricsRegistry
+from utils.permissions import has_permission
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+def format_seconds(seconds: Optional[float]) -> str:
+    """초 단위 값을 ms/s 문자열로 표시"""
+    if seconds is None:
+        return "-"
+    return f"{seconds * 1000:.0f}ms" if seconds < 1 else f"{seconds:.2f}s"
+
+class MetricsCommands(commands.Cog):
+    """성능 지표 조회 Cog (Prometheus 텍스트 엔드포인트 + 관리자 명령어)"""
+
+    def __init__(self, bot: commands.Bot) -> None:
+        self.bot = bot
+        self.metrics_config = bot.config.get('metrics', {}) or {}
+        if getattr(bot, 'metrics', None) is None:
+            bot.metrics = MetricsRegistry()
+        self._runner: Optional[web.AppRunner] = None
+
+    async def cog_load(self) -> None:
+        if self.metrics_config.get('enabled', True):
+            await self.start_server()
+
+    async def cog_unload(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def start_server(self) -> None:
+        """로컬 지표 엔드포인트 시작 (GET /metrics)"""
+        host = self.metrics_config.get('host', '127.0.0.1')
+        # 워커 프로세스로 나눠 실행하면 워커 번호만큼 포트를 밀어 겹치지 않게 함
+        port = self.metrics_config.get('port', 9108) + (getattr(self.bot, 'worker_index', None) or 0)
+
+        app = web.Application()
+        app.router.add_get("/metrics", self.handle_metrics)
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        try:
+            await web.TCPSite(runner, host, port).start()
+        except OSError as e:
+            await runner.cleanup()
+            print(f"⚠️  지표 엔드포인트 시작 실패 ({host}:{port}): {e}")
+            return
+
+        self._runner = runner
+        print(f"📈 지표 엔드포인트: http://{host}:{port}/metrics")
+
+    async def handle_metrics(self, request: web.Request) -> web.Response:
+        return web.Response(
+            text=self.bot.metrics.render(),
+            headers={"Content-Type": "text/plain; version=0.0.4; charset=utf-8"}
+        )
+
+    @has_permission()
+    @app_commands.command(name="지표", description="RCON 지연 시간과 상호작용 응답 시간 분위수를 확인합니다")
+    async def show_metrics(self, interaction: Interaction) -> None:
+        """히스토그램별 p50/p95/p99 표시"""
+        embed = Embed(title="📈 성능 지표", color=discord.Color.blue())
+
+        shard_latencies = getattr(self.bot, 'shard_latencies', None)
+        if shard_latencies is not None and shard_latencies():
+            embed.add_field(
+                name="게이트웨이 지연 시간 (샤드별)",
+                value=" · ".join(
+                    f"#{shard_id} {format_seconds(latency)}" for shard_id, latency in sorted(shard_latencies().items())
+                )[:1024],
+                inline=False
+            )
+
+        for histogram in self.bot.metrics.histograms():
+            for key, series in sorted(histogram.series().items()):
+                if len(embed.fields) >= 25:
+                    break
+                labels = ", ".join(f"{name}={value}" for name, value in zip(histogram.labels, key))
+                quantiles = " · ".join(
+                    f"p{int(q * 100)} {format_seconds(histogram.quantile(q, key))}" for q in QUANTILES
+                )
+                embed.add_field(
+                    name=f"{histogram.name} ({labels})"[:256],
+                    value=f"{quantiles} · n={series.count}",
+                    inline=False
+                )
+
+        if not embed.fields:
+            embed.description = "아직 수집된 지표가 없습니다."
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+async def setup(bot: commands.Bot) -> None:
+    await bot.add_cog(MetricsCommands(bot))
+    print("MetricsCommands cog가 성공적으로 로드되었습니다.")
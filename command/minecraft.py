@@ -1,91 +1,911 @@
 import discord
 from discord import app_commands, Interaction, Embed
-from discord.ext import commands
+from discord.ext import commands, tasks
 from discord.ui import Select, View
-from mcrcon import MCRcon
 import asyncio
-from typing import Optional
+import csv
+import io
 import re
+import time
+import dataclasses
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Coroutine, Optional, TypeVar, Union
 
-def has_admin_role():
-    """관리자 역할을 가진 사용자만 명령어를 실행할 수 있도록 확인하는 데코레이터"""
-    async def predicate(interaction: Interaction) -> bool:
-        admin_role_ids = interaction.client.config.get('administrator_role_ids', [])
-        return any(role.id in admin_role_ids for role in interaction.user.roles)
-   
-    check = app_commands.check(predicate)
-   
-    def wrapper(func):
-        func = check(func)
-        func.default_permissions = discord.Permissions(administrator=True)
-        return func
-   
-    return wrapper
+from utils.audit import AuditEntry
+from utils.cache import QueryCache, normalize_command
+from utils.health import CLOSED, STATE_VALUES, CircuitBreaker, CircuitOpenError
+from utils.ipc import IpcError, RemotePool
+from utils.metrics import MetricsRegistry, instrument_interaction, mark_first_response
+from utils.permissions import ADMIN as ADMIN_TIER, EVERYONE, has_permission
+from utils.ping import StatusError, fetch_status
+from utils.rcon import MAX_PAYLOAD_SIZE, RconAuthError, RconError, RconPayloadError, RconPool, check_payload
+from utils.scheduler import ADMIN, PRIORITY_NAMES, CommandScheduler, QueueFullError, command_priority
+from utils.status import ServerSnapshot, parse_list_response, parse_whitelist_response
+
+ALL_SERVERS = "*"  # 서버 선택 메뉴의 "전체 서버" 값
+REMOVED_SERVER_MESSAGE = "설정 다시 읽기로 제거된 서버입니다. 메뉴를 다시 열어주세요."
+
+# 일괄 작업: 작업 이름 → (명령어 템플릿, 임베드 제목)
+BULK_ACTIONS = {
+    "whitelist_add": ("whitelist add {}", "🎮 화이트리스트 일괄 추가"),
+    "whitelist_remove": ("whitelist remove {}", "🎮 화이트리스트 일괄 제거"),
+    "op_add": ("op {}", "⭐ OP 권한 일괄 부여"),
+    "op_remove": ("deop {}", "⭐ OP 권한 일괄 제거"),
+}
+# 서버 관리 메뉴: 작업 이름 → (표시 이름, 설명, 설정에 없을 때 필요한 권한 등급)
+# 작업 이름은 config.yml의 permissions.commands 키로 사용
+MENU_ACTIONS = {
+    "list_players": ("온라인 플레이어", "현재 접속 중인 플레이어 목록 확인", EVERYONE),
+    "server_status": ("서버인원 확인", "현재 서버 인원 수 확인", EVERYONE),
+    "whitelist_add": ("화이트리스트 추가", "플레이어를 화이트리스트에 추가", ADMIN_TIER),
+    "whitelist_remove": ("화이트리스트 제거", "플레이어를 화이트리스트에서 제거", ADMIN_TIER),
+    "whitelist_list": ("화이트리스트 목록", "화이트리스트에 등록된 플레이어 목록 확인", ADMIN_TIER),
+    "server_command": ("서버 명령어", "직접 서버 명령어 실행", ADMIN_TIER),
+    "op_add": ("OP 추가", "플레이어에게 OP 권한 부여", ADMIN_TIER),
+    "op_remove": ("OP 제거", "플레이어의 OP 권한 제거", ADMIN_TIER),
+    "kill_player": ("플레이어 킬", "특정 플레이어 킬", ADMIN_TIER),
+    "say_message": ("서버 공지", "서버에 공지 메시지 전송", ADMIN_TIER),
+}
+MAX_BULK_FILE_SIZE = 1024 * 1024  # 일괄 등록 첨부 파일 최대 크기 (1MB)
+PLAYER_NAME_PATTERN = re.compile(r"\.?[A-Za-z0-9_]{1,16}")  # Java 닉네임 (+ Floodgate 접두사)
+CSV_HEADERS = {"name", "player", "username", "nickname", "이름", "닉네임", "플레이어"}
+
+T = TypeVar("T")
+
+def server_settings(config: dict) -> dict[str, dict]:
+    """
+    서버 이름별 설정
+    minecraft_servers의 각 항목은 minecraft_rcon의 공통 설정을 덮어쓴다.
+    minecraft_servers가 없으면 minecraft_rcon 하나를 단일 서버로 사용한다.
+    """
+    rcon_config = config.get('minecraft_rcon', {}) or {}
+    settings = {}
+    for entry in config.get('minecraft_servers') or [{}]:
+        merged = {**rcon_config, **entry}
+        name = str(merged.get('name') or f"{merged.get('host', 'localhost')}:{merged.get('port', 25575)}")
+        settings[name] = merged
+    return settings
+
+def truncate(text: str, limit: int = 1024) -> str:
+    """임베드 필드 길이 제한에 맞게 문자열 자르기"""
+    return text if len(text) <= limit else text[:limit - 1] + "…"
+
+def add_result_fields(embed: Embed, results: dict[str, tuple[bool, str]], code_block: bool = False) -> None:
+    """
+    RCON 실행 결과를 임베드 필드로 추가
+    단일 서버면 결과/응답 필드, 여러 서버면 서버별 필드를 하나씩 추가
+    """
+    def format_response(response: str) -> str:
+        if not response:
+            return "응답 없음"
+        return f"```{truncate(response, 1018)}```" if code_block else truncate(response)
+
+    if len(results) == 1:
+        success, response = next(iter(results.values()))
+        embed.add_field(name="결과", value="✅ 성공" if success else "❌ 실패", inline=True)
+        embed.add_field(name="응답", value=format_response(response), inline=False)
+        return
+
+    for name, (success, response) in results.items():
+        embed.add_field(name=f"{'✅' if success else '❌'} {name}", value=format_response(response), inline=False)
+
+def split_pages(text: str, limit: int = 1000) -> list[tuple[int, int]]:
+    """
+    긴 응답을 limit 이하 구간으로 나눔 (줄바꿈 > 쉼표 > 공백 위치에서 자름)
+    문자열을 복사하지 않고 (시작, 끝) 구간만 계산한다.
+
+    Args:
+        text: 응답 문자열
+        limit: 구간 최대 길이
+
+    Returns:
+        list[tuple[int, int]]: (시작, 끝) 구간 목록 (빈 문자열이면 [(0, 0)])
+    """
+    spans = []
+    start = 0
+    while len(text) - start > limit:
+        end = start + limit
+        cut = text.rfind("\n", start, end) + 1
+        if cut <= start:
+            cut = text.rfind(", ", start, end) + 2
+        if cut <= start + 1:
+            cut = text.rfind(" ", start, end) + 1
+        if cut <= start:
+            cut = end
+        spans.append((start, cut))
+        start = cut
+    spans.append((start, len(text)))
+    return spans
+
+def paginate_results(results: dict[str, tuple[bool, str]], limit: int = 1000, page_size: int = 4000) -> list[list[tuple[str, bool, str, int, int]]]:
+    """
+    서버별 응답을 임베드 페이지로 묶음
+    각 응답을 필드 길이(limit) 이하 조각으로 나누고, 조각 길이 합이 page_size를 넘지 않게 페이지에 채운다.
+
+    Returns:
+        list[list[tuple[str, bool, str, int, int]]]: 페이지별 (서버 이름, 성공 여부, 응답, 시작, 끝) 목록
+    """
+    pages: list[list[tuple[str, bool, str, int, int]]] = [[]]
+    used = 0
+    for name, (success, response) in results.items():
+        for start, end in split_pages(response, limit):
+            if pages[-1] and (used + end - start > page_size or len(pages[-1]) >= 10):
+                pages.append([])
+                used = 0
+            pages[-1].append((name, success, response, start, end))
+            used += end - start
+    return pages
+
+def command_type(command: str) -> str:
+    """지표 레이블용 명령어 종류 (첫 단어)"""
+    return normalize_command(command).split(" ", 1)[0] or "empty"
+
+def parse_player_names(text: str, from_csv: bool = False) -> tuple[list[str], list[str]]:
+    """
+    일괄 등록 입력에서 플레이어 이름 추출
+
+    Args:
+        text: 입력 텍스트 (줄바꿈/쉼표/공백 구분, CSV는 첫 번째 열 사용)
+        from_csv: CSV 형식 여부
+
+    Returns:
+        tuple[list[str], list[str]]: (중복 제거된 올바른 이름, 잘못된 항목)
+    """
+    if from_csv:
+        entries = [row[0] for row in csv.reader(io.StringIO(text)) if row]
+        if entries and entries[0].strip().lower() in CSV_HEADERS:
+            entries = entries[1:]
+    else:
+        entries = re.split(r"[\s,;]+", text)
+
+    names, invalid, seen = [], [], set()
+    for entry in entries:
+        entry = entry.strip()
+        if not entry:
+            continue
+        if not PLAYER_NAME_PATTERN.fullmatch(entry):
+            invalid.append(entry)
+            continue
+        if entry.lower() not in seen:
+            seen.add(entry.lower())
+            names.append(entry)
+    return names, invalid
+
+@dataclass
+class BulkResult:
+    """서버 하나에 대한 일괄 작업 결과"""
+    server: str
+    succeeded: list[str] = field(default_factory=list)
+    skipped: list[str] = field(default_factory=list)
+    failed: list[tuple[str, str]] = field(default_factory=list)
+
+# 바뀌면 연결 풀 / 대기열 / 회로 차단기를 새로 만들어야 하는 서버 설정 (나머지는 그 자리에서 적용)
+REBUILD_KEYS = (
+    "host", "port", "password", "pool_size", "timeout", "idle_timeout", "keepalive_interval",
+    "rate_limit", "rate_burst", "queue_size",
+    "circuit_failure_threshold", "circuit_base_delay", "circuit_max_delay",
+)
+
+class MinecraftServer:
+    """
+    RCON 대상 서버
+
+    Attributes:
+        name: 서버 이름
+        config: 서버 설정 (minecraft_rcon 공통 설정 + 서버별 설정)
+        pool: RCON 연결 풀 (다른 워커의 연결을 공유하면 RemotePool)
+        cache: 조회 명령어 캐시
+        health: 회로 차단기 (서버가 꺼져 있으면 연결 제한 시간을 기다리지 않고 즉시 실패)
+        scheduler: 우선순위 명령어 대기열 (속도 제한, 대기열 길이 제한)
+        status_backend: 상태 조회 방식 ("ping": Server List Ping, "query": GS4 Query, "rcon": `list`)
+        snapshot: 마지막 상태 스냅샷
+        status_error: 마지막 상태 조회 실패 사유
+    """
+
+    def __init__(self, name: str, config: dict, pool: Optional[Union[RconPool, RemotePool]] = None) -> None:
+        self.name = name
+        self.config = config
+        self.host = config.get('host', 'localhost')
+        self.port = config.get('port', 25575)
+        self.pool = pool or RconPool(
+            host=self.host,
+            port=self.port,
+            password=config.get('password', ''),
+            max_size=config.get('pool_size', 2),
+            timeout=config.get('timeout', 5.0),
+            idle_timeout=config.get('idle_timeout', 300.0),
+            keepalive_interval=config.get('keepalive_interval', 30.0)
+        )
+        self.cache = QueryCache(config.get('cache_ttl'))
+        self.health = CircuitBreaker(
+            failure_threshold=config.get('circuit_failure_threshold', 2),
+            base_delay=config.get('circuit_base_delay', 2.0),
+            max_delay=config.get('circuit_max_delay', 60.0)
+        )
+        self.scheduler = CommandScheduler(
+            concurrency=config.get('pool_size', 2),
+            rate=config.get('rate_limit', 50.0),
+            burst=config.get('rate_burst', 50.0),
+            max_depth=config.get('queue_size', 100)
+        )
+        self._apply_status_settings(config)
+        self.snapshot: Optional[ServerSnapshot] = None
+        self.status_error: Optional[str] = None
+        self._probe_task: Optional[asyncio.Task] = None
+        self._closed = False
+
+    def _apply_status_settings(self, config: dict) -> None:
+        self.status_backend = config.get('status_backend', 'ping')
+        self.status_port = config.get('status_port', 25565)
+        self.status_timeout = config.get('status_timeout', 3.0)
+
+    def needs_rebuild(self, config: dict) -> bool:
+        """새 설정을 적용하려면 연결 풀부터 새로 만들어야 하는지 여부 (REBUILD_KEYS 비교)"""
+        return any(self.config.get(key) != config.get(key) for key in REBUILD_KEYS)
+
+    def apply_config(self, config: dict) -> None:
+        """연결과 무관한 설정을 그 자리에서 적용 (캐시 유지 시간, 상태 조회 방식, 제한 시간 등)"""
+        if config.get('cache_ttl') != self.config.get('cache_ttl'):
+            self.cache = QueryCache(config.get('cache_ttl'))
+        self._apply_status_settings(config)
+        self.config = config
+
+    @property
+    def remote(self) -> bool:
+        """다른 워커의 연결 풀과 상태 스냅샷을 공유하는지 여부"""
+        return isinstance(self.pool, RemotePool)
+
+    async def execute(self, command: str) -> str:
+        """명령어 실행 (조회 명령어는 캐시, 변경 명령어는 관련 캐시 무효화)"""
+        check_payload(command)  # 보낼 수 없는 명령어는 대기열과 회로 차단기를 거치지 않고 실패
+        if self.cache.is_cacheable(command):
+            return await self.cache.get(command, lambda: self._schedule(command_priority(command), lambda: self.pool.command(command)))
+        response = await self._schedule(command_priority(command), lambda: self.pool.command(command))
+        self.cache.invalidate_for(command)
+        return response
+
+    async def execute_many(self, commands: list[str]) -> list[str]:
+        """여러 명령어를 한 연결에서 파이프라인 실행 (관련 캐시 무효화)"""
+        for command in commands:
+            check_payload(command)
+        window = self.config.get('pipeline_window', 16)
+        responses = await self._schedule(ADMIN, lambda: self.pool.command_many(commands, window), cost=len(commands))
+        for command in commands:
+            self.cache.invalidate_for(command)
+        return responses
+
+    async def _schedule(self, priority: int, request: Callable[[], Coroutine[None, None, T]], cost: float = 1.0) -> T:
+        """회로가 열려 있으면 바로 실패하고, 아니면 대기열을 거쳐 회로 차단기 안에서 실행"""
+        self.health.check()
+        return await self.scheduler.submit(priority, lambda: self._guarded(request()), cost)
+
+    async def _guarded(self, request: Coroutine[None, None, T]) -> T:
+        """
+        회로 차단기를 거쳐 요청 실행
+        인증 실패는 서버가 응답한 것이므로 정상으로 기록하고,
+        잘못된 명령어(RconPayloadError)와 취소된 요청은 서버 상태와 무관하므로 기록하지 않는다.
+
+        Raises:
+            CircuitOpenError: 회로가 열려 있는 경우 (요청을 보내지 않음)
+        """
+        try:
+            self.health.before_request()
+        except CircuitOpenError:
+            request.close()
+            raise
+        try:
+            result = await request
+        except RconAuthError:
+            self.health.record_success()
+            raise
+        except (RconPayloadError, asyncio.CancelledError):
+            # 보내지 않았거나(잘못된 명령어) 종료/교체로 취소된 요청은 서버 상태와 무관
+            self.health.release()
+            raise
+        except Exception as e:
+            self.health.record_failure(e)
+            if self.health.state != CLOSED:
+                self._ensure_probe()
+            raise
+        self.health.record_success()
+        return result
+
+    def _ensure_probe(self) -> None:
+        if self._closed:
+            return
+        if self._probe_task is None or self._probe_task.done():
+            self._probe_task = asyncio.create_task(self._probe_loop())
+
+    async def _probe_loop(self) -> None:
+        """회로가 열려 있는 동안 재확인 간격마다 `list`로 복구 확인 (RCON으로 상태를 조회하면 스냅샷도 갱신)"""
+        while self.health.state != CLOSED and not self._closed:
+            await asyncio.sleep(self.health.retry_in)
+            try:
+                response = await self._guarded(self.pool.command("list"))
+            except Exception:
+                continue
+            if self.status_backend == "rcon":
+                self.snapshot = parse_list_response(response)
+                self.status_error = None if self.snapshot else "응답을 파싱할 수 없습니다."
+
+    async def fetch_status(self) -> ServerSnapshot:
+        """
+        RCON 없이 상태 조회 (Server List Ping / GS4 Query)
+
+        Raises:
+            StatusError / OSError / asyncio.TimeoutError: 조회 실패
+        """
+        port = self.config.get('query_port', self.status_port) if self.status_backend == "query" else self.status_port
+        return await fetch_status(self.status_backend, self.host, port, self.status_timeout)
+
+    async def drain(self, timeout: float = 10.0) -> None:
+        """새 명령어를 받지 않고 대기/실행 중인 명령어를 마친 뒤 닫기 (설정이 바뀌어 교체될 때)"""
+        if not await self.scheduler.drain(timeout):
+            print(f"⚠️  {self.name}: {timeout:.0f}초 안에 끝나지 않은 명령어를 취소합니다")
+        await self.close()
+
+    async def close(self) -> None:
+        self._closed = True  # 닫는 중 취소된 요청이 복구 확인 작업을 다시 시작하지 않도록
+        if self._probe_task is not None:
+            self._probe_task.cancel()
+        await self.scheduler.close()
+        await self.pool.close()
 
 class MinecraftCommands(commands.Cog):
     """마인크래프트 RCON 명령어 관리 Cog"""
-   
+
     def __init__(self, bot: commands.Bot) -> None:
         self.bot = bot
-        self.rcon_config = bot.config.get('minecraft_rcon', {})
-   
-    def get_rcon_connection(self):
-        """RCON 연결 반환"""
-        host = self.rcon_config.get('host', 'localhost')
-        port = self.rcon_config.get('port', 25575)
-        password = self.rcon_config.get('password', '')
-        return MCRcon(host, password, port)
-   
-    async def execute_rcon_command(self, command: str) -> tuple[bool, str]:
-        """RCON 명령어 실행 (비동기)"""
+        self.rcon_config = bot.config.get('minecraft_rcon', {}) or {}
+        self.servers = self.load_servers()
+
+        # 지표: RCON 지연 시간 / 오류 수 / 연결 풀 사용량
+        self.metrics: MetricsRegistry = getattr(bot, 'metrics', None) or MetricsRegistry()
+        self.rcon_latency = self.metrics.histogram(
+            "rcon_command_duration_seconds", "RCON 명령어 실행 시간", ("server", "command")
+        )
+        self.rcon_errors = self.metrics.counter(
+            "rcon_command_errors_total", "RCON 명령어 실패 수", ("server", "command")
+        )
+        self.status_latency = self.metrics.histogram(
+            "status_query_duration_seconds", "RCON 없이 상태를 조회하는 데 걸린 시간", ("server", "backend")
+        )
+        self.circuit_rejections = self.metrics.counter(
+            "rcon_circuit_rejections_total", "회로가 열려 있어 즉시 실패한 RCON 명령어 수", ("server",)
+        )
+        self.queue_rejections = self.metrics.counter(
+            "rcon_queue_rejections_total", "대기열이 가득 차 거절된 RCON 명령어 수", ("server", "priority")
+        )
+        self.metrics.gauge(
+            "rcon_pool_connections", "RCON 연결 풀 연결 수", ("server", "state"), callback=self.pool_occupancy
+        )
+        self.metrics.gauge(
+            "rcon_queue_depth", "RCON 명령어 대기열 길이", ("server", "priority"), callback=self.queue_depths
+        )
+        self.metrics.gauge(
+            "rcon_circuit_state", "RCON 회로 상태 (0=정상, 1=복구 확인 중, 2=차단)", ("server",), callback=self.circuit_states
+        )
+        self.status_poller.change_interval(seconds=self.rcon_config.get('status_interval', 15))
+
+    def load_servers(self) -> dict[str, MinecraftServer]:
+        """설정에서 서버 목록 생성"""
+        return {name: self.create_server(name, settings) for name, settings in server_settings(self.bot.config).items()}
+
+    def create_server(self, name: str, settings: dict) -> MinecraftServer:
+        """서버 생성 (공유 연결 서버에 연결된 워커면 RCON 대신 원격 풀 사용)"""
+        ipc_client = getattr(self.bot, 'ipc_client', None)
+        pool = RemotePool(ipc_client, name) if ipc_client is not None else None
+        return MinecraftServer(name, settings, pool)
+
+    async def reload_config(self, old: dict, new: dict) -> list[str]:
+        """
+        설정 다시 읽기 적용
+        연결 설정(REBUILD_KEYS)이 바뀐 서버만 새 연결 풀로 교체하고, 이전 서버는 진행 중인 명령어를 마친 뒤 닫는다.
+        그 밖의 설정은 기존 서버에 그 자리에서 적용한다.
+
+        Returns:
+            list[str]: 적용 내역
+        """
+        settings = server_settings(new)
+        if not settings:
+            return ["⚠️ 서버 설정이 비어 있어 서버 목록을 유지합니다"]
+
+        servers: dict[str, MinecraftServer] = {}
+        retired: list[MinecraftServer] = []
+        notes = []
+        for name, server_config in settings.items():
+            current = self.servers.get(name)
+            if current is not None and not current.needs_rebuild(server_config):
+                if current.config != server_config:
+                    current.apply_config(server_config)
+                    notes.append(f"🔧 {name}: 설정 적용 (연결 유지)")
+                servers[name] = current
+                continue
+            servers[name] = self.create_server(name, server_config)
+            if current is None:
+                notes.append(f"➕ {name}: 서버 추가")
+            else:
+                retired.append(current)
+                notes.append(f"🔄 {name}: 연결 풀 재생성")
+        for name, server in self.servers.items():
+            if name not in settings:
+                retired.append(server)
+                notes.append(f"➖ {name}: 서버 제거")
+
+        # 새 명령어는 바로 새 서버로 가도록 한 번에 교체
+        self.servers = servers
+        self.rcon_config = new.get('minecraft_rcon', {}) or {}
+        interval = self.rcon_config.get('status_interval', 15)
+        if interval != self.status_poller.seconds:
+            self.status_poller.change_interval(seconds=interval)
+            notes.append(f"⏱️ 상태 조회 주기: {interval}초")
+
+        drain_timeout = self.rcon_config.get('drain_timeout', 10.0)
+        await asyncio.gather(*(server.drain(drain_timeout) for server in retired))
+        return notes
+
+    def get_server(self, name: Optional[str] = None) -> MinecraftServer:
+        """
+        이름으로 서버 조회 (None이면 첫 번째 서버)
+
+        Raises:
+            RconError: 설정 다시 읽기로 제거된 서버인 경우 (열려 있던 메뉴에서 선택한 서버 등)
+        """
+        if name is None:
+            return next(iter(self.servers.values()))
+        if name not in self.servers:
+            raise RconError(REMOVED_SERVER_MESSAGE)
+        return self.servers[name]
+
+    def pool_occupancy(self) -> dict[tuple[str, ...], float]:
+        """서버별 연결 풀 사용 중 / 유휴 연결 수"""
+        occupancy = {}
+        for name, server in self.servers.items():
+            occupancy[(name, "in_use")] = server.pool.in_use
+            occupancy[(name, "idle")] = server.pool.idle_count
+        return occupancy
+
+    def queue_depths(self) -> dict[tuple[str, ...], float]:
+        """서버별 / 우선순위별 대기 중인 명령어 수"""
+        return {
+            (name, PRIORITY_NAMES[priority]): depth
+            for name, server in self.servers.items()
+            for priority, depth in server.scheduler.depth.items()
+        }
+
+    def circuit_states(self) -> dict[tuple[str, ...], float]:
+        """서버별 회로 상태"""
+        return {(name,): STATE_VALUES[server.health.state] for name, server in self.servers.items()}
+
+    async def execute_rcon_command(self, command: str, server: Optional[str] = None) -> tuple[bool, str]:
+        """RCON 명령어 실행 (비동기, 인증된 연결 재사용, 조회 명령어는 캐시)"""
+        try:
+            target = self.get_server(server)
+        except RconError as e:
+            return False, f"오류: {e}"
+        labels = {"server": target.name, "command": command_type(command)}
+        started = time.perf_counter()
+        try:
+            response = await target.execute(command)
+            return True, response
+        except CircuitOpenError as e:
+            # 요청을 보내지 않았으므로 지연 시간에 포함하지 않음
+            self.circuit_rejections.inc(server=target.name)
+            started = None
+            return False, f"오류: {e}"
+        except QueueFullError as e:
+            self.queue_rejections.inc(server=target.name, priority=PRIORITY_NAMES[command_priority(command)])
+            started = None
+            return False, f"오류: {e}"
+        except RconPayloadError as e:
+            # 보내지 않은 명령어이므로 서버 오류/지연 시간에 포함하지 않음
+            started = None
+            return False, f"오류: {e}"
+        except Exception as e:
+            self.rcon_errors.inc(**labels)
+            return False, f"오류: {str(e) or type(e).__name__}"
+        finally:
+            if started is not None:
+                self.rcon_latency.observe(time.perf_counter() - started, **labels)
+
+    async def broadcast_rcon_command(self, command: str, servers: Optional[list[str]] = None) -> dict[str, tuple[bool, str]]:
+        """
+        여러 서버에 동시에 명령어 실행
+        서버별 제한 시간(broadcast_timeout)을 적용하므로 전체 소요 시간은 가장 느린 서버 기준
+
+        Args:
+            command: 실행할 명령어
+            servers: 대상 서버 이름 목록 (None이면 전체)
+
+        Returns:
+            dict[str, tuple[bool, str]]: 서버 이름별 (성공 여부, 응답)
+        """
+        names = list(self.servers) if servers is None else servers
+
+        async def run(name: str) -> tuple[bool, str]:
+            if name not in self.servers:
+                return False, f"오류: {REMOVED_SERVER_MESSAGE}"
+            timeout = self.servers[name].config.get('broadcast_timeout', 10.0)
+            try:
+                return await asyncio.wait_for(self.execute_rcon_command(command, name), timeout=timeout)
+            except asyncio.TimeoutError:
+                return False, f"오류: {timeout}초 내에 응답이 없습니다."
+
+        results = await asyncio.gather(*(run(name) for name in names))
+        return dict(zip(names, results))
+
+    async def run_on_target(self, target: str, command: str) -> dict[str, tuple[bool, str]]:
+        """선택한 대상(서버 이름 또는 ALL_SERVERS)에 명령어 실행"""
+        if target == ALL_SERVERS:
+            return await self.broadcast_rcon_command(command)
+        return {target: await self.execute_rcon_command(command, target)}
+
+    def audit(
+        self,
+        user: discord.abc.User,
+        action: str,
+        target: str,
+        command: str,
+        results: dict[str, tuple[bool, str]],
+        players: Optional[list[str]] = None
+    ) -> None:
+        """관리 작업 기록 이벤트 발생 (`minecraft_audit`, 저장은 AuditTrail Cog가 백그라운드에서 처리)"""
+        self.bot.dispatch("minecraft_audit", AuditEntry(
+            at=time.time(),
+            user_id=user.id,
+            user=str(user),
+            action=action,
+            server=target,
+            command=command,
+            players=list(players or []),
+            results={name: ok for name, (ok, _) in results.items()}
+        ))
+
+    async def cog_load(self) -> None:
+        self.status_poller.start()
+        ipc_server = getattr(self.bot, 'ipc_server', None)
+        if ipc_server is not None:
+            ipc_server.register("execute", self.ipc_execute)
+            ipc_server.register("execute_many", self.ipc_execute_many)
+            ipc_server.register("status", self.ipc_status)
+
+    async def cog_unload(self) -> None:
+        self.status_poller.cancel()
+        ipc_server = getattr(self.bot, 'ipc_server', None)
+        if ipc_server is not None:
+            for op in ("execute", "execute_many", "status"):
+                ipc_server.unregister(op)
+        self.metrics.unregister("rcon_pool_connections")
+        self.metrics.unregister("rcon_queue_depth")
+        self.metrics.unregister("rcon_circuit_state")
+        await asyncio.gather(*(server.close() for server in self.servers.values()))
+
+    # ==================== 워커 간 공유 ====================
+
+    async def ipc_execute(self, server: str, command: str) -> str:
+        """다른 워커의 명령어 실행 요청 (이 워커의 캐시/대기열/회로 차단기를 거침)"""
+        return await self.get_server(server).execute(command)
+
+    async def ipc_execute_many(self, server: str, commands: list[str]) -> list[str]:
+        return await self.get_server(server).execute_many(commands)
+
+    async def ipc_status(self, server: str) -> dict[str, Any]:
+        """다른 워커의 상태 조회 요청 (이 워커가 폴링한 스냅샷 반환)"""
+        target = self.get_server(server)
+        snapshot = await self.get_status(target)
+        return {
+            "snapshot": dataclasses.asdict(snapshot) if snapshot is not None else None,
+            "error": target.status_error if target.health.is_closed else target.health.describe()
+        }
+
+    # ==================== 서버 상태 ====================
+
+    @tasks.loop(seconds=15)
+    async def status_poller(self) -> None:
+        """모든 서버의 상태를 주기적으로 조회해 메모리 스냅샷 갱신"""
+        # 한 서버의 예상하지 못한 오류로 폴링 루프 전체가 멈추지 않도록 서버별로 받아서 기록
+        servers = list(self.servers.values())
+        results = await asyncio.gather(*(self.refresh_status(server) for server in servers), return_exceptions=True)
+        for server, result in zip(servers, results):
+            if isinstance(result, Exception):
+                print(f"⚠️  {server.name} 상태 조회 중 오류: {result!r}")
+
+        # 전체 접속 인원이 바뀌었을 때만 봇 상태 메시지 갱신
+        snapshots = [server.snapshot for server in self.servers.values() if server.snapshot]
+        if snapshots and self.rcon_config.get('status_presence', True):
+            player_count = sum(snapshot.player_count for snapshot in snapshots)
+            if player_count != getattr(self.bot, 'presence_player_count', None):
+                await self.bot._set_presence(player_count)
+
+    @status_poller.before_loop
+    async def before_status_poller(self) -> None:
+        await self.bot.wait_until_ready()
+
+    async def refresh_status(self, server: MinecraftServer) -> Optional[ServerSnapshot]:
+        """
+        서버 스냅샷 갱신 (실패 시 status_error 설정)
+        status_backend가 "rcon"이면 `list`를 실행하고, 아니면 RCON 없이 Server List Ping / Query로 조회한다.
+        성공하면 `minecraft_status` 이벤트(server_name, ServerSnapshot)로도 전달된다.
+        다른 워커의 연결을 공유하는 서버는 직접 조회하지 않고 그 워커가 폴링한 스냅샷을 받아온다.
+        """
+        if server.remote:
+            try:
+                shared = await server.pool.client.request("status", server=server.name)
+                snapshot = ServerSnapshot(**shared["snapshot"]) if shared["snapshot"] else None
+                error = shared["error"] or "서버에 연결할 수 없습니다."
+            except IpcError as e:
+                snapshot, error = None, str(e)
+        elif server.status_backend == "rcon":
+            success, response = await self.execute_rcon_command("list", server.name)
+            snapshot = parse_list_response(response) if success else None
+            error = "서버에 연결할 수 없습니다." if not success else "응답을 파싱할 수 없습니다."
+        else:
+            started = time.perf_counter()
+            try:
+                snapshot = await server.fetch_status()
+                error = None
+            except (OSError, EOFError, asyncio.TimeoutError, StatusError) as e:
+                snapshot = None
+                error = f"서버에 연결할 수 없습니다. ({str(e) or type(e).__name__})"
+            except Exception as e:
+                snapshot = None
+                error = f"상태를 조회할 수 없습니다. ({str(e) or type(e).__name__})"
+            self.status_latency.observe(time.perf_counter() - started, server=server.name, backend=server.status_backend)
+
+        server.snapshot = snapshot
+        server.status_error = error if snapshot is None else None
+        if snapshot is not None:
+            self.bot.dispatch("minecraft_status", server.name, snapshot)
+        return snapshot
+
+    async def get_status(self, server: MinecraftServer) -> Optional[ServerSnapshot]:
+        """메모리 스냅샷 반환 (첫 폴링 전이면 즉시 조회)"""
+        if server.snapshot is None and server.status_error is None:
+            return await self.refresh_status(server)
+        return server.snapshot
+
+    def target_servers(self, target: str) -> list[MinecraftServer]:
+        """선택한 대상에 해당하는 서버 목록 (설정 다시 읽기로 제거된 서버면 빈 목록)"""
+        if target == ALL_SERVERS:
+            return list(self.servers.values())
+        return [self.servers[target]] if target in self.servers else []
+
+    # ==================== 일괄 작업 ====================
+
+    async def bulk_apply(self, server: MinecraftServer, action: str, players: list[str]) -> BulkResult:
+        """
+        서버 하나에 일괄 작업 실행
+        화이트리스트 추가는 현재 목록과 비교해 이미 등록된 플레이어를 건너뛴다.
+
+        Args:
+            server: 대상 서버
+            action: BULK_ACTIONS의 작업 이름
+            players: 플레이어 이름 목록
+
+        Returns:
+            BulkResult: 작업 결과
+        """
+        result = BulkResult(server.name)
+        targets = players
         try:
-            loop = asyncio.get_event_loop()
-            with self.get_rcon_connection() as mcr:
-                mcr.connect()
-                response = await loop.run_in_executor(None, mcr.command, command)
-                return True, response
+            if action == "whitelist_add":
+                whitelisted = {name.lower() for name in parse_whitelist_response(await server.execute("whitelist list"))}
+                result.skipped = [player for player in players if player.lower() in whitelisted]
+                targets = [player for player in players if player.lower() not in whitelisted]
+
+            template = BULK_ACTIONS[action][0]
+            responses = await server.execute_many([template.format(player) for player in targets]) if targets else []
         except Exception as e:
-            return False, f"오류: {str(e)}"
-   
+            result.failed = [(player, f"오류: {str(e) or type(e).__name__}") for player in targets]
+            return result
+
+        for player, response in zip(targets, responses):
+            if response.startswith(("Added", "Removed", "Made")):
+                result.succeeded.append(player)
+            elif "already" in response or response.startswith("Nothing changed"):
+                result.skipped.append(player)
+            else:
+                result.failed.append((player, response or "응답 없음"))
+        return result
+
+    async def send_bulk_result(self, interaction: Interaction, action: str, target: str, players: list[str], invalid: list[str]) -> None:
+        """일괄 작업을 대상 서버에 동시 실행하고 요약 임베드 전송 (응답이 defer된 상태에서 호출)"""
+        if not players:
+            await interaction.followup.send("❌ 올바른 플레이어 이름이 없습니다.", ephemeral=True)
+            return
+
+        servers = self.target_servers(target)
+        if not servers:
+            await interaction.followup.send(f"❌ {REMOVED_SERVER_MESSAGE}", ephemeral=True)
+            return
+        results = await asyncio.gather(*(self.bulk_apply(server, action, players) for server in servers))
+        self.audit(
+            interaction.user, action, target, BULK_ACTIONS[action][0].format(f"<{len(players)}명>"),
+            {result.server: (not result.failed, "") for result in results}, players
+        )
+
+        failed = any(result.failed for result in results)
+        embed = Embed(
+            title=BULK_ACTIONS[action][1],
+            description=f"요청 {len(players)}명 · 대상 서버 {len(servers)}개",
+            color=discord.Color.orange() if failed else discord.Color.green()
+        )
+        for result in results:
+            lines = [f"✅ 성공 {len(result.succeeded)} · ⏭️ 건너뜀 {len(result.skipped)} · ❌ 실패 {len(result.failed)}"]
+            lines.extend(f"• {player}: {reason}" for player, reason in result.failed)
+            embed.add_field(name=result.server, value=truncate("\n".join(lines)), inline=False)
+        if invalid:
+            embed.add_field(name=f"잘못된 이름 ({len(invalid)})", value=truncate(", ".join(invalid)), inline=False)
+        await interaction.followup.send(embed=embed, ephemeral=True)
+
+    async def send_paginated_results(
+        self,
+        interaction: Interaction,
+        make_embed: Callable[[], Embed],
+        results: dict[str, tuple[bool, str]],
+        field_name: str = "응답",
+        empty_text: str = "응답 없음",
+        code_block: bool = False
+    ) -> None:
+        """
+        RCON 실행 결과 전송 (응답이 defer된 상태에서 호출)
+        응답이 임베드 필드 길이를 넘으면 페이지 버튼을 붙이고, 각 페이지 임베드는 버튼을 누를 때 만든다.
+
+        Args:
+            interaction: 상호작용
+            make_embed: 페이지마다 호출할 기본 임베드 생성 함수 (제목, 색상, 공통 필드)
+            results: 서버 이름별 (성공 여부, 응답)
+            field_name: 단일 서버일 때 응답 필드 이름
+            empty_text: 응답이 비어 있을 때 표시할 문구
+            code_block: 응답을 코드 블록으로 표시
+        """
+        pages = paginate_results(results, limit=1000 if code_block else 1024)
+
+        def render(index: int) -> Embed:
+            embed = make_embed()
+            for name, success, response, start, end in pages[index]:
+                chunk = response[start:end] or empty_text
+                if len(results) == 1:
+                    label = field_name if start == 0 else f"{field_name} (이어서)"
+                else:
+                    label = f"{'✅' if success else '❌'} {name}" + (" (이어서)" if start else "")
+                embed.add_field(name=label, value=f"```{chunk}```" if code_block and response else chunk, inline=False)
+            if len(pages) > 1:
+                embed.set_footer(text=f"페이지 {index + 1}/{len(pages)}")
+            return embed
+
+        if len(pages) == 1:
+            await interaction.followup.send(embed=render(0), ephemeral=True)
+        else:
+            await interaction.followup.send(embed=render(0), view=self.PaginatedView(len(pages), render), ephemeral=True)
+
+    class PaginatedView(View):
+        """
+        페이지 넘김 버튼
+        모든 페이지를 미리 만들지 않고 버튼을 누를 때 render로 해당 페이지 임베드만 만든다.
+        """
+        def __init__(self, page_count: int, render: Callable[[int], Embed]):
+            super().__init__(timeout=300.0)
+            self.page_count = page_count
+            self.render = render
+            self.page = 0
+            self._update_buttons()
+
+        def _update_buttons(self) -> None:
+            self.previous_page.disabled = self.page == 0
+            self.next_page.disabled = self.page >= self.page_count - 1
+            self.page_indicator.label = f"{self.page + 1}/{self.page_count}"
+
+        async def _show(self, interaction: Interaction) -> None:
+            self._update_buttons()
+            await interaction.response.edit_message(embed=self.render(self.page), view=self)
+
+        @discord.ui.button(label="◀", style=discord.ButtonStyle.secondary)
+        async def previous_page(self, interaction: Interaction, button: discord.ui.Button):
+            self.page = max(0, self.page - 1)
+            await self._show(interaction)
+
+        @discord.ui.button(label="1/1", style=discord.ButtonStyle.secondary, disabled=True)
+        async def page_indicator(self, interaction: Interaction, button: discord.ui.Button):
+            pass
+
+        @discord.ui.button(label="▶", style=discord.ButtonStyle.secondary)
+        async def next_page(self, interaction: Interaction, button: discord.ui.Button):
+            self.page = min(self.page_count - 1, self.page + 1)
+            await self._show(interaction)
+
+    class TextInputModal(discord.ui.Modal):
+        """
+        텍스트 입력 창
+        메시지 리스너(wait_for) 없이 상호작용 한 번으로 입력을 받아 handler에 전달
+        """
+        def __init__(
+            self,
+            title: str,
+            label: str,
+            handler: Callable[[Interaction, str], Awaitable[None]],
+            style: discord.TextStyle = discord.TextStyle.short,
+            max_length: int = 256,
+            max_bytes: Optional[int] = None
+        ):
+            super().__init__(title=title, timeout=300.0)
+            self.input = discord.ui.TextInput(label=label, style=style, max_length=max_length)
+            self.add_item(self.input)
+            self.handler = handler
+            self.max_bytes = max_bytes  # Discord 입력 창은 글자 수만 제한하므로 UTF-8 크기는 제출 시 확인
+
+        @instrument_interaction("modal_submit")
+        async def on_submit(self, interaction: Interaction):
+            await interaction.response.defer(ephemeral=True, thinking=True)
+            mark_first_response(interaction, "modal_submit")
+            value = self.input.value.strip()
+            size = len(value.encode("utf-8"))
+            if self.max_bytes is not None and size > self.max_bytes:
+                await interaction.followup.send(
+                    f"❌ 입력이 너무 깁니다 ({size}/{self.max_bytes}바이트, 한글은 한 글자에 3바이트)",
+                    ephemeral=True
+                )
+                return
+            await self.handler(interaction, value)
+
+    class ServerSelect(Select):
+        """대상 서버 선택 메뉴"""
+        def __init__(self, servers: dict[str, MinecraftServer]):
+            # 선택 메뉴 옵션은 최대 25개 ("전체 서버" 포함)
+            options = [
+                discord.SelectOption(label=name, description=f"{server.host}:{server.port}", value=name, default=index == 0)
+                for index, (name, server) in enumerate(list(servers.items())[:24])
+            ]
+            options.append(discord.SelectOption(label="전체 서버", description="모든 서버에 동시에 실행", value=ALL_SERVERS, emoji="🌐"))
+            super().__init__(placeholder="대상 서버를 선택하세요...", min_values=1, max_values=1, options=options)
+
+        @instrument_interaction("server_select")
+        async def callback(self, interaction: Interaction):
+            self.view.target = self.values[0]
+            for option in self.options:
+                option.default = option.value == self.view.target
+            await interaction.response.edit_message(view=self.view)
+            mark_first_response(interaction, "server_select")
+
     class MinecraftSelect(Select):
-        """마인크래프트 명령어 선택 메뉴"""
-        def __init__(self, bot: commands.Bot, is_admin: bool):
-            options = []
-            # 모든 사용자에게 표시되는 명령어
-            options.extend([
-                discord.SelectOption(label="온라인 플레이어", description="현재 접속 중인 플레이어 목록 확인", value="list_players"),
-                discord.SelectOption(label="서버인원 확인", description="현재 서버 인원 수 확인", value="server_status"),
-            ])
-            # 관리자에게만 표시되는 명령어
-            if is_admin:
-                options.extend([
-                    discord.SelectOption(label="화이트리스트 추가", description="플레이어를 화이트리스트에 추가", value="whitelist_add"),
-                    discord.SelectOption(label="화이트리스트 제거", description="플레이어를 화이트리스트에서 제거", value="whitelist_remove"),
-                    discord.SelectOption(label="화이트리스트 목록", description="화이트리스트에 등록된 플레이어 목록 확인", value="whitelist_list"),
-                    discord.SelectOption(label="서버 명령어", description="직접 서버 명령어 실행", value="server_command"),
-                    discord.SelectOption(label="OP 추가", description="플레이어에게 OP 권한 부여", value="op_add"),
-                    discord.SelectOption(label="OP 제거", description="플레이어의 OP 권한 제거", value="op_remove"),
-                    discord.SelectOption(label="플레이어 킬", description="특정 플레이어 킬", value="kill_player"),
-                    discord.SelectOption(label="서버 공지", description="서버에 공지 메시지 전송", value="say_message"),
-                ])
+        """마인크래프트 명령어 선택 메뉴 (권한이 있는 명령어만 표시)"""
+        def __init__(self, bot: commands.Bot, user: discord.abc.User):
+            authorizer = bot.authorizer
+            options = [
+                discord.SelectOption(label=label, description=description, value=value)
+                for value, (label, description, default_tier) in MENU_ACTIONS.items()
+                if authorizer.allowed(user, value, default_tier)
+            ]
             super().__init__(placeholder="명령어를 선택하세요...", min_values=1, max_values=1, options=options)
             self.bot = bot
 
+        @instrument_interaction("command_select")
         async def callback(self, interaction: Interaction):
             value = self.values[0]
-            await interaction.response.defer(ephemeral=True)
+            cog = self.bot.get_cog("MinecraftCommands")
+            target = self.view.target
+
+            if not self.bot.authorizer.allowed(interaction.user, value, MENU_ACTIONS[value][2]):
+                await interaction.response.send_message("❌ 이 명령어를 사용할 권한이 없습니다.", ephemeral=True)
+                mark_first_response(interaction, "command_select")
+                return
 
+            if not cog.target_servers(target):
+                await interaction.response.send_message(f"❌ {REMOVED_SERVER_MESSAGE}", ephemeral=True)
+                mark_first_response(interaction, "command_select")
+                return
+
+            # 입력이 필요한 명령어는 입력 창(Modal)을 첫 응답으로 띄운다
             if value in ["whitelist_add", "whitelist_remove", "op_add", "op_remove", "kill_player"]:
-                # 플레이어 이름을 입력받아야 하는 명령어
-                await interaction.followup.send("플레이어 이름을 입력해주세요:", ephemeral=True)
-                try:
-                    msg = await self.bot.wait_for(
-                        "message",
-                        check=lambda m: m.author == interaction.user and m.channel == interaction.channel,
-                        timeout=30.0
-                    )
-                    player = msg.content.strip()
-                    await msg.delete()  # 입력 메시지 삭제
+                title = {
+                    "whitelist_add": "🎮 화이트리스트 추가",
+                    "whitelist_remove": "🎮 화이트리스트 제거",
+                    "op_add": "⭐ OP 권한 부여",
+                    "op_remove": "⭐ OP 권한 제거",
+                    "kill_player": "💀 플레이어 킬",
+                }[value]
+
+                async def run_player_command(modal_interaction: Interaction, player: str) -> None:
                     command = {
                         "whitelist_add": f"whitelist add {player}",
                         "whitelist_remove": f"whitelist remove {player}",
@@ -93,141 +913,257 @@ class MinecraftCommands(commands.Cog):
                         "op_remove": f"deop {player}",
                         "kill_player": f"kill {player}",
                     }[value]
-                    success, response = await self.bot.get_cog("MinecraftCommands").execute_rcon_command(command)
-                    title = {
-                        "whitelist_add": "🎮 화이트리스트 추가",
-                        "whitelist_remove": "🎮 화이트리스트 제거",
-                        "op_add": "⭐ OP 권한 부여",
-                        "op_remove": "⭐ OP 권한 제거",
-                        "kill_player": "💀 플레이어 킬",
-                    }[value]
+                    results = await cog.run_on_target(target, command)
+                    cog.audit(modal_interaction.user, value, target, command, results, [player])
+                    success = all(ok for ok, _ in results.values())
                     embed = Embed(
                         title=title,
                         color=discord.Color.green() if success else discord.Color.red()
                     )
                     embed.add_field(name="플레이어", value=player, inline=True)
-                    embed.add_field(name="결과", value="✅ 성공" if success else "❌ 실패", inline=True)
-                    embed.add_field(name="응답", value=response, inline=False)
-                    await interaction.followup.send(embed=embed, ephemeral=True)
-
-                except asyncio.TimeoutError:
-                    await interaction.followup.send("⏰ 입력 시간이 초과되었습니다.", ephemeral=True)
-
-            elif value == "server_command":
-                # 서버 명령어 입력
-                await interaction.followup.send("실행할 명령어를 입력해주세요:", ephemeral=True)
-                try:
-                    msg = await self.bot.wait_for(
-                        "message",
-                        check=lambda m: m.author == interaction.user and m.channel == interaction.channel,
-                        timeout=30.0
-                    )
-                    command = msg.content.strip()
-                    await msg.delete()  # 입력 메시지 삭제
-                    success, response = await self.bot.get_cog("MinecraftCommands").execute_rcon_command(command)
-                    embed = Embed(
+                    add_result_fields(embed, results)
+                    await modal_interaction.followup.send(embed=embed, ephemeral=True)
+
+                await interaction.response.send_modal(
+                    cog.TextInputModal(title=title, label="플레이어 이름", handler=run_player_command, max_length=64)
+                )
+                mark_first_response(interaction, "command_select")
+                return
+
+            if value == "server_command":
+                async def run_server_command(modal_interaction: Interaction, command: str) -> None:
+                    results = await cog.run_on_target(target, command)
+                    cog.audit(modal_interaction.user, value, target, command, results)
+                    success = all(ok for ok, _ in results.values())
+
+                    def make_embed() -> Embed:
+                        embed = Embed(
+                            title="⚙️ 서버 명령어 실행",
+                            color=discord.Color.green() if success else discord.Color.red()
+                        )
+                        embed.add_field(name="명령어", value=f"`{truncate(command, 1000)}`", inline=False)
+                        if len(results) == 1:
+                            embed.add_field(name="결과", value="✅ 성공" if success else "❌ 실패", inline=True)
+                        return embed
+
+                    await cog.send_paginated_results(modal_interaction, make_embed, results, code_block=True)
+
+                await interaction.response.send_modal(
+                    cog.TextInputModal(
                         title="⚙️ 서버 명령어 실행",
-                        color=discord.Color.green() if success else discord.Color.red()
+                        label="실행할 명령어",
+                        handler=run_server_command,
+                        max_length=1000,
+                        max_bytes=MAX_PAYLOAD_SIZE
                     )
-                    embed.add_field(name="명령어", value=f"`{command}`", inline=False)
-                    embed.add_field(name="결과", value="✅ 성공" if success else "❌ 실패", inline=True)
-                    embed.add_field(name="응답", value=f"```{response}```" if response else "응답 없음", inline=False)
-                    await interaction.followup.send(embed=embed, ephemeral=True)
-
-                except asyncio.TimeoutError:
-                    await interaction.followup.send("⏰ 입력 시간이 초과되었습니다.", ephemeral=True)
-
-            elif value == "say_message":
-                # 공지 메시지 입력
-                await interaction.followup.send("전송할 공지 메시지를 입력해주세요:", ephemeral=True)
-                try:
-                    msg = await self.bot.wait_for(
-                        "message",
-                        check=lambda m: m.author == interaction.user and m.channel == interaction.channel,
-                        timeout=30.0
-                    )
-                    message = msg.content.strip()
-                    await msg.delete()  # 입력 메시지 삭제
-                    success, response = await self.bot.get_cog("MinecraftCommands").execute_rcon_command(f"say {message}")
+                )
+                mark_first_response(interaction, "command_select")
+                return
+
+            if value == "say_message":
+                async def run_say_message(modal_interaction: Interaction, message: str) -> None:
+                    results = await cog.run_on_target(target, f"say {message}")
+                    cog.audit(modal_interaction.user, value, target, f"say {message}", results)
+                    success = all(ok for ok, _ in results.values())
                     embed = Embed(
                         title="📢 서버 공지",
                         color=discord.Color.green() if success else discord.Color.red()
                     )
                     embed.add_field(name="메시지", value=message, inline=False)
-                    embed.add_field(name="결과", value="✅ 전송 성공" if success else "❌ 전송 실패", inline=True)
-                    await interaction.followup.send(embed=embed, ephemeral=True)
+                    if len(results) == 1:
+                        embed.add_field(name="결과", value="✅ 전송 성공" if success else "❌ 전송 실패", inline=True)
+                    else:
+                        for name, (ok, _) in results.items():
+                            embed.add_field(name=name, value="✅ 전송 성공" if ok else "❌ 전송 실패", inline=True)
+                    await modal_interaction.followup.send(embed=embed, ephemeral=True)
+
+                await interaction.response.send_modal(
+                    cog.TextInputModal(
+                        title="📢 서버 공지",
+                        label="공지 메시지",
+                        handler=run_say_message,
+                        style=discord.TextStyle.paragraph,
+                        max_length=1000,
+                        max_bytes=MAX_PAYLOAD_SIZE - len("say ")
+                    )
+                )
+                mark_first_response(interaction, "command_select")
+                return
 
-                except asyncio.TimeoutError:
-                    await interaction.followup.send("⏰ 입력 시간이 초과되었습니다.", ephemeral=True)
+            await interaction.response.defer(ephemeral=True)
+            mark_first_response(interaction, "command_select")
 
-            elif value == "server_status":
-                # 서버인원 확인
-                success, response = await self.bot.get_cog("MinecraftCommands").execute_rcon_command("list")
+            if value in ["server_status", "list_players"]:
+                # 서버인원 확인 / 온라인 플레이어 (메모리 스냅샷 사용)
+                servers = cog.target_servers(target)
+                snapshots = await asyncio.gather(*(cog.get_status(server) for server in servers))
                 embed = Embed(
-                    title="📊 서버인원 확인",
-                    color=discord.Color.blue() if success else discord.Color.red()
+                    title="📊 서버인원 확인" if value == "server_status" else "👥 온라인 플레이어",
+                    color=discord.Color.blue() if any(snapshots) else discord.Color.red()
                 )
-                if success:
-                    # 응답 형식 예: "There are 2 of a max of 20 players online: player1, player2"
-                    match = re.match(r"There are (\d+) of a max of (\d+) players online: (.*)", response)
-                    if match:
-                        current_players, max_players, player_list = match.groups()
-                        embed.add_field(name="현재 인원", value=current_players, inline=True)
-                        embed.add_field(name="최대 인원", value=max_players, inline=True)
-                        embed.add_field(name="접속 중인 플레이어", value=player_list if player_list else "없음", inline=False)
+                for server, snapshot in zip(servers, snapshots):
+                    prefix = f"[{server.name}] " if len(servers) > 1 else ""
+                    if snapshot is None:
+                        if server.status_backend != "rcon" or server.health.is_closed:
+                            status = server.status_error or "서버에 연결할 수 없습니다."
+                        else:
+                            status = server.health.describe()
+                        embed.add_field(name=f"{prefix}상태", value=status, inline=False)
+                        continue
+
+                    player_list = ", ".join(snapshot.players) if snapshot.players else "없음"
+                    if snapshot.players and snapshot.player_count > len(snapshot.players):
+                        # Server List Ping은 일부 플레이어만 샘플로 알려준다
+                        player_list += f" 외 {snapshot.player_count - len(snapshot.players)}명"
+                    player_list = truncate(player_list)
+                    if value == "server_status":
+                        embed.add_field(name=f"{prefix}현재 인원", value=str(snapshot.player_count), inline=True)
+                        embed.add_field(name=f"{prefix}최대 인원", value=str(snapshot.max_players), inline=True)
+                        if snapshot.latency is not None:
+                            embed.add_field(name=f"{prefix}핑", value=f"{snapshot.latency * 1000:.0f}ms", inline=True)
+                        if snapshot.motd or snapshot.version:
+                            info = [line for line in (snapshot.motd, snapshot.version and f"버전 {snapshot.version}") if line]
+                            embed.add_field(name=f"{prefix}서버 정보", value=truncate("\n".join(info)), inline=False)
+                        embed.add_field(name=f"{prefix}접속 중인 플레이어", value=player_list, inline=False)
                     else:
-                        embed.add_field(name="상태", value="응답을 파싱할 수 없습니다.", inline=False)
-                else:
-                    embed.add_field(name="상태", value="서버에 연결할 수 없습니다.", inline=False)
+                        embed.add_field(
+                            name=f"{prefix}플레이어 ({snapshot.player_count}/{snapshot.max_players})",
+                            value=player_list,
+                            inline=False
+                        )
+                ages = [snapshot.age for snapshot in snapshots if snapshot]
+                if ages:
+                    embed.set_footer(text=f"{int(max(ages))}초 전 갱신")
                 await interaction.followup.send(embed=embed, ephemeral=True)
 
             else:
-                # 입력이 필요 없는 명령어 (whitelist_list, list_players)
-                command = "whitelist list" if value == "whitelist_list" else "list"
-                success, response = await self.bot.get_cog("MinecraftCommands").execute_rcon_command(command)
-                embed = Embed(
-                    title="📋 화이트리스트 목록" if value == "whitelist_list" else "👥 온라인 플레이어",
-                    color=discord.Color.blue() if success else discord.Color.red()
-                )
-                embed.add_field(
-                    name="목록" if value == "whitelist_list" else "플레이어",
-                    value=response if response else ("플레이어 없음" if value == "whitelist_list" else "서버에 연결할 수 없습니다."),
-                    inline=False
+                # 화이트리스트 목록
+                results = await cog.run_on_target(target, "whitelist list")
+                success = all(ok for ok, _ in results.values())
+                await cog.send_paginated_results(
+                    interaction,
+                    lambda: Embed(title="📋 화이트리스트 목록", color=discord.Color.blue() if success else discord.Color.red()),
+                    results,
+                    field_name="목록",
+                    empty_text="플레이어 없음"
                 )
-                await interaction.followup.send(embed=embed, ephemeral=True)
+
+    class ServerManagementView(View):
+        """서버 관리 메뉴 (대상 서버 선택 + 명령어 선택)"""
+        def __init__(self, cog: "MinecraftCommands", user: discord.abc.User):
+            super().__init__(timeout=60.0)
+            self.target = next(iter(cog.servers))
+            if len(cog.servers) > 1:
+                self.add_item(MinecraftCommands.ServerSelect(cog.servers))
+            self.add_item(MinecraftCommands.MinecraftSelect(cog.bot, user))
 
     @app_commands.command(name="서버관리", description="마인크래프트 서버 관리 명령어를 실행합니다")
+    @instrument_interaction("서버관리")
     async def server_management(self, interaction: Interaction) -> None:
         """마인크래프트 서버 관리 명령어 메뉴"""
-        is_admin = await self.has_admin_role_check(interaction)
-        
+        authorizer = self.bot.authorizer
+        managed = {value: tier for value, (_, _, tier) in MENU_ACTIONS.items() if tier != EVERYONE}
+        permitted = [value for value, tier in managed.items() if authorizer.allowed(interaction.user, value, tier)]
+        if len(permitted) == len(managed):
+            access = '관리자 권한으로 모든 관리 명령어를 사용할 수 있습니다.'
+        elif permitted:
+            access = '권한이 있는 관리 명령어와 서버 상태 확인 명령어를 사용할 수 있습니다.'
+        else:
+            access = '일반 사용자는 서버 상태 확인 명령어만 사용할 수 있습니다.'
+
         # 임베드 생성
         embed = Embed(
             title="🎮 마인크래프트 서버 관리",
             description=(
                 "아래 메뉴에서 원하는 명령어를 선택하세요.\n"
-                f"{'관리자 권한으로 모든 관리 명령어를 사용할 수 있습니다.' if is_admin else '일반 사용자는 서버 상태 확인 명령어만 사용할 수 있습니다.'}"
+                f"{access}"
             ),
             color=discord.Color.blue()
         )
-        embed.add_field(
-            name="서버 정보",
-            value=(
-                f"**호스트**: {self.rcon_config.get('host', 'localhost')}\n"
-                f"**포트**: {self.rcon_config.get('port', 25575)}"
-            ),
-            inline=False
-        )
+        if len(self.servers) == 1:
+            server = self.get_server()
+            server_info = f"**호스트**: {server.host}\n**포트**: {server.port}"
+        else:
+            server_info = "\n".join(f"**{name}**: {server.host}:{server.port}" for name, server in self.servers.items())
+        embed.add_field(name="서버 정보", value=truncate(server_info), inline=False)
         embed.set_footer(text="60초 내에 선택해주세요.")
 
-        view = View(timeout=60.0)
-        view.add_item(self.MinecraftSelect(self.bot, is_admin))
+        view = self.ServerManagementView(self, interaction.user)
         await interaction.response.send_message(embed=embed, view=view, ephemeral=True)
+        mark_first_response(interaction, "서버관리")
+
+    @has_permission()
+    @app_commands.command(name="일괄등록", description="여러 플레이어의 화이트리스트/OP를 한 번에 처리합니다")
+    @app_commands.rename(action="작업", file="파일", server="서버")
+    @app_commands.describe(
+        action="실행할 작업",
+        file="플레이어 이름이 담긴 텍스트/CSV 파일 (없으면 입력 창 표시)",
+        server="대상 서버 (기본값: 첫 번째 서버)"
+    )
+    @app_commands.choices(action=[
+        app_commands.Choice(name="화이트리스트 추가", value="whitelist_add"),
+        app_commands.Choice(name="화이트리스트 제거", value="whitelist_remove"),
+        app_commands.Choice(name="OP 추가", value="op_add"),
+        app_commands.Choice(name="OP 제거", value="op_remove"),
+    ])
+    @instrument_interaction("일괄등록")
+    async def bulk_import(
+        self,
+        interaction: Interaction,
+        action: app_commands.Choice[str],
+        file: Optional[discord.Attachment] = None,
+        server: Optional[str] = None
+    ) -> None:
+        """플레이어 일괄 화이트리스트/OP 처리"""
+        # 명령어 권한과 별도로, 선택한 작업도 메뉴와 같은 등급이 필요함
+        if not self.bot.authorizer.allowed(interaction.user, action.value, MENU_ACTIONS[action.value][2]):
+            await interaction.response.send_message("❌ 이 작업을 사용할 권한이 없습니다.", ephemeral=True)
+            mark_first_response(interaction, "일괄등록")
+            return
+
+        target = server or next(iter(self.servers))
+        if target != ALL_SERVERS and target not in self.servers:
+            await interaction.response.send_message(f"❌ 알 수 없는 서버입니다: {target}", ephemeral=True)
+            mark_first_response(interaction, "일괄등록")
+            return
+
+        if file is None:
+            async def handle_input(modal_interaction: Interaction, text: str) -> None:
+                # 입력 창을 띄운 뒤 역할이 바뀌었을 수 있으므로 제출 시 다시 확인
+                if not self.bot.authorizer.allowed(modal_interaction.user, action.value, MENU_ACTIONS[action.value][2]):
+                    await modal_interaction.followup.send("❌ 이 작업을 사용할 권한이 없습니다.", ephemeral=True)
+                    return
+                players, invalid = parse_player_names(text)
+                await self.send_bulk_result(modal_interaction, action.value, target, players, invalid)
+
+            await interaction.response.send_modal(self.TextInputModal(
+                title="플레이어 일괄 입력",
+                label="플레이어 이름 (줄바꿈 또는 쉼표로 구분)",
+                handler=handle_input,
+                style=discord.TextStyle.paragraph,
+                max_length=4000
+            ))
+            mark_first_response(interaction, "일괄등록")
+            return
+
+        if file.size > MAX_BULK_FILE_SIZE:
+            await interaction.response.send_message("❌ 파일이 너무 큽니다. (최대 1MB)", ephemeral=True)
+            mark_first_response(interaction, "일괄등록")
+            return
+
+        await interaction.response.defer(ephemeral=True, thinking=True)
+        mark_first_response(interaction, "일괄등록")
+        text = (await file.read()).decode("utf-8-sig", errors="replace")
+        players, invalid = parse_player_names(text, from_csv=file.filename.lower().endswith(".csv"))
+        await self.send_bulk_result(interaction, action.value, target, players, invalid)
 
-    async def has_admin_role_check(self, interaction: Interaction) -> bool:
-        """관리자 역할 확인"""
-        admin_role_ids = self.bot.config.get('administrator_role_ids', [])
-        return any(role.id in admin_role_ids for role in interaction.user.roles)
+    @bulk_import.autocomplete("server")
+    async def server_autocomplete(self, interaction: Interaction, current: str) -> list[app_commands.Choice[str]]:
+        """서버 이름 자동완성"""
+        choices = [app_commands.Choice(name=name, value=name) for name in self.servers if current.lower() in name.lower()]
+        if len(self.servers) > 1:
+            choices.append(app_commands.Choice(name="전체 서버", value=ALL_SERVERS))
+        return choices[:25]
 
     # 에러 핸들러
     async def cog_app_command_error(self, interaction: Interaction, error: app_commands.AppCommandError):
@@ -251,4 +1187,4 @@ class MinecraftCommands(commands.Cog):
 
 async def setup(bot: commands.Bot) -> None:
     await bot.add_cog(MinecraftCommands(bot))
-    print("MinecraftCommands cog가 성공적으로 로드되었습니다.")
\ No newline at end of file
+    print("MinecraftCommands cog가 성공적으로 로드되었습니다.")
@@ -0,0 +1,172 @@
+import discord
+from discord import app_commands, Interaction, Embed
+from discord.ext import commands
+import datetime
+import time
+from typing import Optional
+
+from command.minecraft import server_settings
+from utils.logtail import JOIN as LOG_JOIN, LEAVE as LOG_LEAVE, LogEvent
+from utils.metrics import instrument_interaction, mark_first_response
+from utils.sessions import JOIN, LEAVE, SessionStore, SessionTracker
+from utils.status import ServerSnapshot
+
+# 순위 기간: 값 → 표시 이름
+PERIODS = {
+    "all": "전체",
+    "today": "오늘",
+    "week": "최근 7일",
+    "month": "최근 30일",
+}
+
+def period_start(period: str) -> Optional[float]:
+    """기간 값의 시작 시각 (UNIX time, 전체 기간이면 None)"""
+    now = datetime.datetime.now().astimezone()
+    if period == "today":
+        return now.replace(hour=0, minute=0, second=0, microsecond=0).timestamp()
+    if period == "week":
+        return (now - datetime.timedelta(days=7)).timestamp()
+    if period == "month":
+        return (now - datetime.timedelta(days=30)).timestamp()
+    return None
+
+def format_duration(seconds: float) -> str:
+    """초 단위 시간을 "N시간 N분" 형식으로 표시"""
+    minutes = int(seconds // 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours:
+        return f"{hours}시간 {minutes}분"
+    return f"{minutes}분" if minutes else "1분 미만"
+
+class PlayerSessions(commands.Cog):
+    """
+    플레이어 접속 기록 Cog
+    상태 폴링 스냅샷(`minecraft_status`)과 로그 이벤트(`minecraft_log_event`)를 접속/퇴장으로 변환해 SQLite에 저장하고
+    플레이 시간 순위와 마지막 접속을 조회한다.
+    """
+
+    def __init__(self, bot: commands.Bot) -> None:
+        self.bot = bot
+        self.sessions_config = bot.config.get('sessions', {}) or {}
+        self.server_names = list(server_settings(bot.config))
+        # 여러 워커 프로세스로 실행하면 첫 번째 워커만 기록하고 나머지는 조회만 함
+        self.recording = getattr(bot, 'is_primary', True)
+        self.tracker = SessionTracker()
+        self.store = SessionStore(
+            self.sessions_config.get('database', 'data/sessions.db'),
+            batch_size=self.sessions_config.get('batch_size', 500),
+            flush_interval=self.sessions_config.get('flush_interval', 2.0),
+            heartbeat_interval=self.sessions_config.get('heartbeat_interval', 60.0),
+            writable=self.recording
+        )
+
+    async def reload_config(self, old: dict, new: dict) -> list[str]:
+        """설정 다시 읽기 적용 (저장소 설정은 재시작 후 적용)"""
+        self.server_names = list(server_settings(new))
+        return []
+
+    async def cog_load(self) -> None:
+        recovered = await self.store.open()
+        if recovered:
+            print(f"⚠️  지난 실행에서 닫히지 않은 접속 기록 {recovered}개를 마지막 기록 시각으로 정리했습니다")
+
+    async def cog_unload(self) -> None:
+        if self.recording:
+            self.store.record(self.tracker.close_all(time.time()))
+        await self.store.close()
+
+    # ==================== 이벤트 ====================
+
+    @commands.Cog.listener()
+    async def on_minecraft_status(self, server_name: str, snapshot: ServerSnapshot) -> None:
+        """전체 플레이어 목록이 담긴 스냅샷만 이전 스냅샷과 비교 (Server List Ping 샘플은 일부만 담길 수 있음)"""
+        if not self.recording or len(snapshot.players) != snapshot.player_count:
+            return
+        self.store.record(self.tracker.apply_snapshot(server_name, snapshot.players, snapshot.updated_at))
+
+    @commands.Cog.listener()
+    async def on_minecraft_log_event(self, server_name: str, event: LogEvent) -> None:
+        if not self.recording:
+            return
+        if event.kind == LOG_JOIN:
+            self.store.record(self.tracker.apply_event(server_name, JOIN, event.player, event.received_at))
+        elif event.kind == LOG_LEAVE:
+            self.store.record(self.tracker.apply_event(server_name, LEAVE, event.player, event.received_at))
+
+    # ==================== 명령어 ====================
+
+    @app_commands.command(name="플레이시간", description="플레이 시간 순위를 확인합니다")
+    @app_commands.rename(period="기간", server="서버")
+    @app_commands.describe(period="집계 기간 (기본값: 전체)", server="서버 (기본값: 모든 서버 합계)")
+    @app_commands.choices(period=[app_commands.Choice(name=name, value=value) for value, name in PERIODS.items()])
+    @instrument_interaction("플레이시간")
+    async def playtime(
+        self,
+        interaction: Interaction,
+        period: Optional[app_commands.Choice[str]] = None,
+        server: Optional[str] = None
+    ) -> None:
+        """플레이 시간 상위 10명 표시"""
+        period_value = period.value if period else "all"
+        if server is not None and server not in self.server_names:
+            await interaction.response.send_message(f"❌ 알 수 없는 서버입니다: {server}", ephemeral=True)
+            mark_first_response(interaction, "플레이시간")
+            return
+
+        ranking = await self.store.leaderboard(server, period_start(period_value), limit=10)
+        embed = Embed(
+            title=f"⏱️ 플레이 시간 순위 ({PERIODS[period_value]})",
+            color=discord.Color.gold()
+        )
+        if server is not None and len(self.server_names) > 1:
+            embed.description = f"서버: {server}"
+        if ranking:
+            medals = ["🥇", "🥈", "🥉"]
+            lines = [
+                f"{medals[rank] if rank < len(medals) else f'{rank + 1}.'} "
+                f"**{discord.utils.escape_markdown(player)}** - {format_duration(seconds)}"
+                for rank, (player, seconds) in enumerate(ranking)
+            ]
+            embed.add_field(name="순위", value="\n".join(lines), inline=False)
+        else:
+            embed.add_field(name="순위", value="아직 기록이 없습니다.", inline=False)
+
+        await interaction.response.send_message(embed=embed)
+        mark_first_response(interaction, "플레이시간")
+
+    @playtime.autocomplete("server")
+    async def server_autocomplete(self, interaction: Interaction, current: str) -> list[app_commands.Choice[str]]:
+        """서버 이름 자동완성"""
+        return [
+            app_commands.Choice(name=name, value=name)
+            for name in self.server_names if current.lower() in name.lower()
+        ][:25]
+
+    @app_commands.command(name="마지막접속", description="플레이어가 마지막으로 접속한 시각을 확인합니다")
+    @app_commands.rename(player="플레이어")
+    @app_commands.describe(player="플레이어 이름")
+    @instrument_interaction("마지막접속")
+    async def last_seen(self, interaction: Interaction, player: str) -> None:
+        """서버별 마지막 접속 시각 표시"""
+        records = await self.store.last_seen(player)
+        name = discord.utils.escape_markdown(player)
+        if not records:
+            await interaction.response.send_message(f"❓ **{name}** 님의 접속 기록이 없습니다.", ephemeral=True)
+            mark_first_response(interaction, "마지막접속")
+            return
+
+        embed = Embed(title=f"👤 {name} 님의 접속 기록", color=discord.Color.blue())
+        for server, seen_at, online in records[:25]:
+            if online:
+                value = "🟢 현재 접속 중"
+            else:
+                seen = datetime.datetime.fromtimestamp(seen_at, tz=datetime.timezone.utc)
+                value = f"{discord.utils.format_dt(seen, 'f')} ({discord.utils.format_dt(seen, 'R')})"
+            embed.add_field(name=server, value=value, inline=False)
+
+        await interaction.response.send_message(embed=embed)
+        mark_first_response(interaction, "마지막접속")
+
+async def setup(bot: commands.Bot) -> None:
+    await bot.add_cog(PlayerSessions(bot))
+    print("PlayerSessions cog가 성공적으로 로드되었습니다.")
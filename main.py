@@ -6,14 +6,30 @@ Author: DoubleLatte
 License: MIT
 """
 
+import time
+_IMPORT_STARTED = time.perf_counter()  # 시작 시간 보고서의 imports 단계 기준점
+
 import sys
 import os
+import json
+import asyncio
+import argparse
+import hashlib
+import math
+import subprocess
 from typing import Optional
-import yaml
 import discord
 from discord.ext import commands
 from discord import Game, Status
 
+from utils.config import ConfigError, read_config, validate_config
+from utils.ipc import IpcClient, IpcServer
+from utils.metrics import MetricsRegistry
+from utils.permissions import Authorizer
+from utils.timing import StartupTimer
+
+_IMPORT_SECONDS = time.perf_counter() - _IMPORT_STARTED
+
 
 # ==================== 유틸리티 함수 ====================
 
@@ -52,19 +68,161 @@ def load_config(config_path: str = "config.yml") -> dict:
         SystemExit: 파일을 찾을 수 없거나 읽기 실패 시
     """
     try:
-        with open(config_path, "r", encoding="utf-8") as config_file:
-            config = yaml.safe_load(config_file)
-            print(f"✅ 설정 파일 로드 완료: {config_path}")
-            return config
-            
+        config = read_config(config_path)
+    except ConfigError as e:
+        sys.exit(f"❌ 오류: {e}")
+    
+    print(f"✅ 설정 파일 로드 완료: {config_path}")
+    return config
+
+
+def discover_extensions(directory: str = "command") -> list[str]:
+    """
+    확장 디렉토리에 실제로 존재하는 모듈 목록 반환
+    
+    Args:
+        directory: 확장 모듈 디렉토리 (패키지 경로와 동일)
+        
+    Returns:
+        list[str]: 확장 이름 목록 (예: command.minecraft)
+    """
+    path = resource_path(directory)
+    try:
+        filenames = sorted(os.listdir(path))
     except FileNotFoundError:
-        sys.exit(f"❌ 오류: {config_path} 파일을 찾을 수 없습니다.")
+        print(f"⚠️  확장 디렉토리를 찾을 수 없습니다: {path}")
+        return []
+    
+    return [
+        f"{directory}.{filename[:-3]}"
+        for filename in filenames
+        if filename.endswith(".py") and not filename.startswith("_")
+    ]
+
+
+def compute_command_hash(tree: discord.app_commands.CommandTree, guild: Optional[discord.abc.Snowflake] = None) -> str:
+    """
+    명령어 트리의 직렬화 결과로 안정적인 해시 계산
+    Discord에 동기화되는 페이로드와 같은 내용이므로 해시가 같으면 동기화할 필요가 없음
+    
+    Args:
+        tree: 명령어 트리
+        guild: 대상 길드 (None이면 전역 명령어)
         
-    except yaml.YAMLError as e:
-        sys.exit(f"❌ 오류: {config_path} 파일 파싱 실패 - {e}")
+    Returns:
+        str: SHA-256 해시
+    """
+    payload = []
+    for command in tree.get_commands(guild=guild):
+        try:
+            payload.append(command.to_dict(tree))
+        except TypeError:
+            payload.append(command.to_dict())  # discord.py 2.4 미만
+    
+    payload.sort(key=lambda data: (data.get("type", 1), data["name"]))
+    serialized = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+# 게이트웨이 프로필: 인텐트 / 멤버 캐시 / 청킹 / 메시지 캐시 기본값
+# - lean: 상호작용과 길드·역할 캐시만 사용 (관리자 역할 확인에 충분)
+# - full: 모든 인텐트와 멤버 캐시, 시작 시 전체 멤버 청킹
+GATEWAY_PROFILES = {
+    "lean": {
+        "intents": {"guilds": True},
+        "member_cache": "none",
+        "chunk_guilds_at_startup": False,
+        "message_cache_size": 0,
+    },
+    "full": {
+        "intents": "all",
+        "member_cache": "all",
+        "chunk_guilds_at_startup": True,
+        "message_cache_size": 1000,
+    },
+}
+
+
+def build_gateway_options(config: dict) -> dict:
+    """
+    config.yml의 gateway 설정으로 discord.py 클라이언트 옵션 생성
+    
+    Args:
+        config: 설정 딕셔너리
         
-    except Exception as e:
-        sys.exit(f"❌ 오류: 설정 파일 로드 중 예상치 못한 오류 - {e}")
+    Returns:
+        dict: intents, member_cache_flags, chunk_guilds_at_startup, max_messages
+    """
+    gateway = config.get("gateway") or {}
+    profile_name = gateway.get("profile", "lean")
+    if profile_name not in GATEWAY_PROFILES:
+        print(f"⚠️  알 수 없는 gateway.profile: {profile_name} (lean 사용)")
+        profile_name = "lean"
+    profile = GATEWAY_PROFILES[profile_name]
+    
+    # 인텐트: 프로필 기본값 위에 gateway.intents 항목을 덮어씀
+    if profile["intents"] == "all":
+        intents = discord.Intents.all()
+    else:
+        intents = discord.Intents.none()
+        for name, enabled in profile["intents"].items():
+            setattr(intents, name, enabled)
+    for name, enabled in (gateway.get("intents") or {}).items():
+        setattr(intents, name, bool(enabled))
+    
+    # 멤버 캐시: none이면 상호작용 페이로드의 멤버 정보만 사용
+    member_cache = gateway.get("member_cache", profile["member_cache"])
+    if member_cache == "all":
+        member_cache_flags = discord.MemberCacheFlags.from_intents(intents)
+    else:
+        member_cache_flags = discord.MemberCacheFlags.none()
+    
+    # 시작 시 청킹은 members 인텐트가 있어야 가능
+    chunk_guilds = bool(gateway.get("chunk_guilds_at_startup", profile["chunk_guilds_at_startup"]))
+    if chunk_guilds and not intents.members:
+        print("⚠️  chunk_guilds_at_startup은 members 인텐트가 필요합니다 (비활성화)")
+        chunk_guilds = False
+    
+    # 메시지 캐시: 0이면 비활성화 (discord.py는 0 이하를 기본값 1000으로 취급하므로 None 전달)
+    message_cache_size = gateway.get("message_cache_size", profile["message_cache_size"])
+    
+    return {
+        "intents": intents,
+        "member_cache_flags": member_cache_flags,
+        "chunk_guilds_at_startup": chunk_guilds,
+        "max_messages": message_cache_size if message_cache_size and message_cache_size > 0 else None,
+    }
+
+
+def build_shard_options(config: dict, worker_index: Optional[int] = None) -> dict:
+    """
+    config.yml의 sharding 설정으로 AutoShardedBot 옵션 생성
+    
+    Args:
+        config: 설정 딕셔너리
+        worker_index: 워커 프로세스 번호 (워커로 나눠 실행할 때 이 워커가 맡을 샤드만 지정)
+        
+    Returns:
+        dict: shard_count, shard_ids (샤딩을 사용하지 않으면 빈 딕셔너리)
+    """
+    sharding = config.get("sharding") or {}
+    if not sharding.get("enabled"):
+        return {}
+    
+    shard_count = sharding.get("shard_count")  # None이면 Discord 권장 값
+    shard_ids = sharding.get("shard_ids")
+    if worker_index is not None:
+        # 샤드를 워커 수로 나눠 번갈아 배정 (0, N, 2N, ... / 1, N+1, ...)
+        shard_ids = list(range(worker_index, shard_count, shard_workers(config)))
+    return {"shard_count": shard_count, "shard_ids": shard_ids}
+
+
+def shard_workers(config: dict) -> int:
+    """샤드 그룹을 나눠 실행할 워커 프로세스 수 (샤딩을 사용하지 않으면 1)"""
+    sharding = config.get("sharding") or {}
+    if not sharding.get("enabled"):
+        return 1
+    return max(1, int(sharding.get("workers", 1)))
 
 
 # ==================== 봇 클래스 ====================
@@ -75,94 +233,280 @@ class MinecraftBot(commands.Bot):
     
     Attributes:
         config: 설정 딕셔너리
+        config_path: 설정 파일 경로
         administrator_role_ids: 관리자 역할 ID 리스트
-        extensions_list: 로드할 확장 기능 리스트
+        metrics: 성능 지표 레지스트리
+        authorizer: 명령어 권한 판정 (역할 집합 / 멤버별 캐시)
+        extensions_list: 시작 시 로드할 확장 기능 리스트
+        lazy_extensions: 준비 완료 후 백그라운드에서 로드할 확장 기능 리스트
+        startup_timer: 시작 단계별 소요 시간 측정
+        worker_index: 워커 프로세스 번호 (한 프로세스로 실행하면 None)
+        ipc_server: 다른 워커에 RCON 연결 풀과 상태를 공유하는 서버 (첫 번째 워커)
+        ipc_client: 첫 번째 워커의 RCON 연결 풀과 상태를 사용하는 클라이언트 (나머지 워커)
     """
     
-    def __init__(self, config: dict):
+    def __init__(
+        self,
+        config: dict,
+        startup_timer: Optional[StartupTimer] = None,
+        config_path: str = "config.yml",
+        worker_index: Optional[int] = None
+    ):
         """
         봇 초기화
         
         Args:
             config: 설정 딕셔너리
+            startup_timer: 시작 단계 타이머 (없으면 새로 생성)
+            config_path: 설정 파일 경로 (핫 리로드 시 다시 읽음)
+            worker_index: 워커 프로세스 번호 (샤드 그룹을 여러 프로세스로 나눠 실행할 때)
         """
-        # 모든 인텐트 활성화
-        intents = discord.Intents.all()
+        # 인텐트 및 캐시 정책 (config.yml의 gateway 설정)
+        gateway_options = build_gateway_options(config)
+        shard_options = build_shard_options(config, worker_index) if isinstance(self, commands.AutoShardedBot) else {}
         
         # Bot 부모 클래스 초기화
         super().__init__(
             command_prefix="!",  # 텍스트 명령어 접두사 (슬래시 명령어 사용 시 불필요)
-            intents=intents,
-            application_id=config.get("application_id")
+            application_id=config.get("application_id"),
+            **gateway_options,
+            **shard_options
         )
         
         # 설정 저장
         self.config = config
+        self.config_path = config_path
         self.administrator_role_ids = config.get("administrator_role_ids", [])
+        self.presence_player_count: Optional[int] = None  # 상태 메시지에 표시 중인 접속 인원
+        self.metrics = MetricsRegistry()  # 성능 지표 (Cog를 다시 로드해도 유지)
+        self.authorizer = Authorizer(config)
+        for listener, event_name in self.authorizer.listeners():
+            self.add_listener(listener, event_name)
+        self.metrics.gauge(
+            "discord_gateway_latency_seconds", "샤드별 게이트웨이 하트비트 지연 시간", ("shard",),
+            callback=lambda: {(str(shard_id),): latency for shard_id, latency in self.shard_latencies().items()}
+        )
+        
+        # 워커 프로세스: 첫 번째 워커가 RCON 연결 풀과 상태를 들고 나머지는 Unix 소켓으로 요청
+        self.worker_index = worker_index
+        self.ipc_server: Optional[IpcServer] = None
+        self.ipc_client: Optional[IpcClient] = None
+        if worker_index is not None:
+            sharding = config.get("sharding") or {}
+            socket_path = sharding.get("socket", "minecraft-bot.sock")
+            if worker_index == 0:
+                self.ipc_server = IpcServer(socket_path)
+            else:
+                self.ipc_client = IpcClient(socket_path, timeout=sharding.get("ipc_timeout", 30.0))
         
-        # 로드할 확장 기능 목록
-        self.extensions_list = [
-            "command.example",      # 예시 명령어
-            "command.dev",          # 개발자 도구
-            "command.minecraft"     # 마인크래프트 관리
-        ]
+        self.startup_timer = startup_timer or StartupTimer()
+        self._ready_recorded = False
+        self._gateway_started = time.perf_counter()
+        self._lazy_load_task: Optional[asyncio.Task] = None
         
-        print(f"✅ 봇 초기화 완료: {len(self.extensions_list)}개 확장 대기 중")
+        # 로드할 확장 기능 목록: command/ 디렉토리에 실제로 있는 모듈만 사용
+        # extensions.lazy에 지정한 확장은 준비 완료 후 백그라운드에서 로드
+        extensions_config = config.get("extensions") or {}
+        disabled = set(extensions_config.get("disabled") or [])
+        lazy = set(extensions_config.get("lazy") or [])
+        discovered = [ext for ext in discover_extensions() if ext not in disabled]
+        self.extensions_list = [ext for ext in discovered if ext not in lazy]
+        self.lazy_extensions = [ext for ext in discovered if ext in lazy]
+        
+        print(f"✅ 봇 초기화 완료: {len(self.extensions_list)}개 확장 대기 중 (지연 로드 {len(self.lazy_extensions)}개)")
+        if shard_options:
+            print(
+                f"   샤딩: 전체 {shard_options['shard_count'] or '자동'}개 중 "
+                f"{shard_options['shard_ids'] if shard_options['shard_ids'] is not None else '전체'}"
+                + (f" (워커 {worker_index})" if worker_index is not None else "")
+            )
+        print(
+            f"   게이트웨이: 인텐트 {gateway_options['intents'].value}, "
+            f"멤버 캐시 {'사용' if gateway_options['member_cache_flags'].value else '미사용'}, "
+            f"청킹 {'사용' if gateway_options['chunk_guilds_at_startup'] else '미사용'}, "
+            f"메시지 캐시 {gateway_options['max_messages'] or 0}개"
+        )
     
     async def setup_hook(self):
         """
         봇 초기 설정 및 확장 기능 로드
         discord.py의 setup_hook을 오버라이드하여 봇 시작 시 자동 실행
         """
+        # 다른 워커가 연결하기 전에 공유 서버 시작 (확장이 처리 함수를 등록함)
+        if self.ipc_server is not None:
+            await self.ipc_server.start()
+            print(f"🔗 워커 공유 소켓: {self.ipc_server.path}")
+        
         print("\n" + "="*50)
         print("🔧 확장 기능 로드 중...")
         print("="*50)
         
-        # 확장 기능 로드
-        loaded_count = 0
-        failed_count = 0
-        
-        for ext in self.extensions_list:
-            try:
-                await self.load_extension(ext)
-                print(f"  ✅ {ext}")
-                loaded_count += 1
-                
-            except commands.ExtensionNotFound:
-                print(f"  ❌ {ext} - 확장 파일을 찾을 수 없습니다")
-                failed_count += 1
-                
-            except commands.ExtensionAlreadyLoaded:
-                print(f"  ⚠️  {ext} - 이미 로드되어 있습니다")
-                
-            except commands.ExtensionFailed as e:
-                print(f"  ❌ {ext} - 로드 실패: {e.original}")
-                failed_count += 1
-                
-            except Exception as e:
-                print(f"  ❌ {ext} - 예상치 못한 오류: {e}")
-                failed_count += 1
+        # 확장 기능 동시 로드
+        with self.startup_timer.phase("extensions"):
+            results = await asyncio.gather(*(self._load_extension(ext) for ext in self.extensions_list))
+        loaded_count = sum(1 for result in results if result is True)
+        failed_count = sum(1 for result in results if result is False)
         
         print("="*50)
         print(f"📦 로드 완료: {loaded_count}개 성공, {failed_count}개 실패")
         print("="*50 + "\n")
         
-        # 슬래시 명령어 동기화
-        await self._sync_commands()
+        # 슬래시 명령어 동기화 (워커로 나눠 실행하면 첫 번째 워커만)
+        # 지연 로드 확장이 있으면 그 명령어까지 포함해 로드 후 한 번만 동기화
+        if not self.lazy_extensions and self.is_primary:
+            with self.startup_timer.phase("command_sync"):
+                await self._sync_commands()
+        
+        self._gateway_started = time.perf_counter()
     
-    async def _sync_commands(self):
-        """슬래시 명령어를 Discord와 동기화"""
-        print("🔄 슬래시 명령어 동기화 중...")
+    @property
+    def is_primary(self) -> bool:
+        """한 번만 실행해야 하는 작업(명령어 동기화, 로그 중계, 접속 기록)을 맡는 프로세스인지 여부"""
+        return self.worker_index in (None, 0)
+    
+    def shard_latencies(self) -> dict[int, float]:
+        """
+        이 프로세스가 맡은 샤드별 게이트웨이 지연 시간 (연결 전인 샤드는 제외)
+        
+        Returns:
+            dict[int, float]: 샤드 ID → 지연 시간 (초)
+        """
+        if isinstance(self, discord.AutoShardedClient):
+            latencies = dict(self.latencies)
+        else:
+            latencies = {self.shard_id or 0: self.latency}
+        return {shard_id: latency for shard_id, latency in latencies.items() if math.isfinite(latency)}
+    
+    async def close(self):
+        """봇 종료 (확장을 내린 뒤 워커 공유 연결 정리)"""
+        await super().close()
+        if self.ipc_server is not None:
+            await self.ipc_server.close()
+        if self.ipc_client is not None:
+            await self.ipc_client.close()
+    
+    async def _load_extension(self, ext: str) -> Optional[bool]:
+        """
+        확장 기능 하나 로드 및 소요 시간 기록
         
+        Args:
+            ext: 확장 이름
+            
+        Returns:
+            Optional[bool]: 성공 True, 실패 False, 이미 로드됨 None
+        """
         try:
-            synced = await self.tree.sync()
-            print(f"✅ {len(synced)}개 명령어 동기화 완료\n")
+            with self.startup_timer.phase(f"extension:{ext}"):
+                await self.load_extension(ext)
+            print(f"  ✅ {ext}")
+            return True
             
-        except discord.HTTPException as e:
-            print(f"❌ 명령어 동기화 실패: {e}\n")
+        except commands.ExtensionNotFound:
+            print(f"  ❌ {ext} - 확장 파일을 찾을 수 없습니다")
+            
+        except commands.ExtensionAlreadyLoaded:
+            print(f"  ⚠️  {ext} - 이미 로드되어 있습니다")
+            return None
+            
+        except commands.NoEntryPointError:
+            print(f"  ❌ {ext} - setup 함수가 없습니다")
+            
+        except commands.ExtensionFailed as e:
+            print(f"  ❌ {ext} - 로드 실패: {e.original}")
             
         except Exception as e:
-            print(f"❌ 예상치 못한 동기화 오류: {e}\n")
+            print(f"  ❌ {ext} - 예상치 못한 오류: {e}")
+        
+        return False
+    
+    async def _load_lazy_extensions(self):
+        """준비 완료 후 지연 로드 확장 기능을 로드하고 명령어 동기화"""
+        print(f"🔧 지연 로드 확장 {len(self.lazy_extensions)}개 로드 중...")
+        with self.startup_timer.phase("lazy_extensions"):
+            await asyncio.gather(*(self._load_extension(ext) for ext in self.lazy_extensions))
+        
+        if self.is_primary:
+            with self.startup_timer.phase("command_sync"):
+                await self._sync_commands()
+        
+        self._write_startup_report()
+    
+    def _write_startup_report(self):
+        """시작 단계별 소요 시간 보고서 저장 및 출력"""
+        path = self.config.get("startup_report", "startup_timing.jsonl")
+        try:
+            report = self.startup_timer.write(path)
+        except OSError as e:
+            print(f"⚠️  시작 시간 보고서 저장 실패: {e}")
+            report = self.startup_timer.report()
+        
+        print("⏱️  시작 단계별 소요 시간")
+        for phase in report["phases"]:
+            print(f"  {phase['name']}: {phase['seconds']:.3f}초")
+        print(f"  전체: {report['total_seconds']:.3f}초\n")
+    
+    async def _sync_commands(self):
+        """
+        슬래시 명령어를 Discord와 동기화
+        명령어 트리 해시가 마지막 동기화와 같으면 건너뜀 (command_sync.guild_ids 설정 시 해당 길드에만 동기화)
+        """
+        sync_config = self.config.get("command_sync") or {}
+        state_path = sync_config.get("state_file", ".command_sync.json")
+        force = sync_config.get("force", False)
+        guilds = [discord.Object(id=int(guild_id)) for guild_id in sync_config.get("guild_ids") or []]
+        
+        state = self._load_sync_state(state_path)
+        self.authorizer.apply_default_permissions(self.tree)
+        
+        for guild in guilds or [None]:
+            target = "전역" if guild is None else f"길드 {guild.id}"
+            key = f"{self.application_id}:{'global' if guild is None else guild.id}"
+            
+            if guild is not None:
+                self.tree.copy_global_to(guild=guild)
+            command_hash = compute_command_hash(self.tree, guild=guild)
+            
+            if not force and state.get(key) == command_hash:
+                print(f"⏭️  {target} 명령어 변경 없음 - 동기화 건너뜀")
+                continue
+            
+            print(f"🔄 {target} 슬래시 명령어 동기화 중...")
+            started = time.perf_counter()
+            try:
+                synced = await self.tree.sync(guild=guild)
+                elapsed = time.perf_counter() - started
+                print(f"✅ {len(synced)}개 명령어 동기화 완료 ({elapsed:.2f}초)")
+                state[key] = command_hash
+                self._save_sync_state(state_path, state)
+                
+            except discord.HTTPException as e:
+                print(f"❌ 명령어 동기화 실패: {e}")
+                
+            except Exception as e:
+                print(f"❌ 예상치 못한 동기화 오류: {e}")
+        
+        print()
+    
+    @staticmethod
+    def _load_sync_state(path: str) -> dict:
+        """마지막 동기화 해시 로드 (파일이 없거나 손상되었으면 빈 상태)"""
+        try:
+            with open(path, "r", encoding="utf-8") as state_file:
+                state = json.load(state_file)
+            return state if isinstance(state, dict) else {}
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+    
+    @staticmethod
+    def _save_sync_state(path: str, state: dict):
+        """동기화 해시 저장 (임시 파일에 쓴 뒤 교체)"""
+        temp_path = f"{path}.tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as state_file:
+                json.dump(state, state_file, indent=2)
+            os.replace(temp_path, path)
+        except OSError as e:
+            print(f"⚠️  동기화 상태 저장 실패: {e}")
     
     async def on_ready(self):
         """
@@ -175,16 +519,43 @@ class MinecraftBot(commands.Bot):
         print(f"  봇 이름: {self.user.name}")
         print(f"  봇 ID: {self.user.id}")
         print(f"  서버 수: {len(self.guilds)}개")
+        if isinstance(self, discord.AutoShardedClient):
+            print(f"  샤드: {', '.join(str(shard_id) for shard_id in sorted(self.shards))} / 전체 {self.shard_count}개")
         print(f"  Discord.py 버전: {discord.__version__}")
         print("="*50 + "\n")
         
+        # 첫 준비 완료 시에만 시작 시간 기록 (재연결 시 on_ready가 다시 호출됨)
+        if not self._ready_recorded:
+            self._ready_recorded = True
+            self.startup_timer.record("gateway_ready", time.perf_counter() - self._gateway_started)
+            if self.lazy_extensions:
+                self._lazy_load_task = asyncio.create_task(self._load_lazy_extensions())
+            else:
+                self._write_startup_report()
+        
         # 봇 상태 메시지 설정
         await self._set_presence()
     
-    async def _set_presence(self):
-        """봇의 상태 메시지 및 활동 설정"""
+    async def on_shard_ready(self, shard_id: int):
+        """샤드 하나가 준비되었을 때 (자동 샤딩 모드)"""
+        latency = self.shard_latencies().get(shard_id)
+        print(f"🛰️  샤드 {shard_id} 준비 완료" + (f" (지연 {latency * 1000:.0f}ms)" if latency is not None else ""))
+    
+    async def _set_presence(self, player_count: Optional[int] = None):
+        """
+        봇의 상태 메시지 및 활동 설정
+        
+        Args:
+            player_count: 마인크래프트 서버 접속 인원 (None이면 마지막 값 유지)
+        """
+        if player_count is not None:
+            self.presence_player_count = player_count
+        
         try:
-            activity = Game(name="마인크래프트 서버 관리 중")
+            if self.presence_player_count is None:
+                activity = Game(name="마인크래프트 서버 관리 중")
+            else:
+                activity = Game(name=f"마인크래프트 {self.presence_player_count}명 접속 중")
             await self.change_presence(
                 status=Status.online,
                 activity=activity
@@ -208,51 +579,94 @@ class MinecraftBot(commands.Bot):
         print(f"⚠️  명령어 오류: {error}")
 
 
-# ==================== 메인 실행 함수 ====================
+class ShardedMinecraftBot(MinecraftBot, commands.AutoShardedBot):
+    """
+    자동 샤딩 모드 봇
+    샤드마다 게이트웨이 연결을 따로 유지하고 sharding.shard_count / shard_ids로 맡을 샤드를 지정
+    """
+
+
+def create_bot(config: dict, startup_timer: StartupTimer, worker_index: Optional[int] = None) -> MinecraftBot:
+    """sharding.enabled에 따라 일반 봇 또는 자동 샤딩 봇 생성"""
+    bot_class = ShardedMinecraftBot if (config.get("sharding") or {}).get("enabled") else MinecraftBot
+    return bot_class(config, startup_timer, worker_index=worker_index)
 
-def validate_config(config: dict) -> bool:
+
+def run_workers(workers: int) -> None:
     """
-    설정 파일의 필수 항목 검증
+    샤드 그룹별 워커 프로세스 실행 및 감시
+    비정상 종료된 워커는 잠시 뒤 다시 시작하고, Ctrl+C를 누르면 모든 워커를 종료
     
     Args:
-        config: 설정 딕셔너리
-        
-    Returns:
-        bool: 검증 통과 여부
+        workers: 워커 수
     """
-    required_keys = ["token", "application_id"]
-    missing_keys = [key for key in required_keys if not config.get(key)]
-    
-    if missing_keys:
-        print(f"❌ 오류: config.yml에 다음 항목이 누락되었습니다: {', '.join(missing_keys)}")
-        return False
+    # PyInstaller로 빌드한 실행 파일이면 자기 자신을, 아니면 이 스크립트를 다시 실행
+    command = [sys.executable] if getattr(sys, "frozen", False) else [sys.executable, os.path.abspath(__file__)]
     
-    # 관리자 역할 확인 (경고만)
-    if not config.get("administrator_role_ids"):
-        print("⚠️  경고: administrator_role_ids가 설정되지 않았습니다.")
-        print("   관리자 전용 명령어를 사용하려면 config.yml에 역할 ID를 추가하세요.\n")
+    def spawn(index: int) -> subprocess.Popen:
+        print(f"🚀 워커 {index} 시작")
+        return subprocess.Popen(command + ["--worker", str(index)])
     
-    return True
+    processes = {index: spawn(index) for index in range(workers)}
+    try:
+        while processes:
+            time.sleep(1)
+            for index, process in list(processes.items()):
+                code = process.poll()
+                if code is None:
+                    continue
+                if code == 0:
+                    print(f"👋 워커 {index} 종료")
+                    del processes[index]
+                else:
+                    print(f"⚠️  워커 {index}가 비정상 종료되었습니다 (코드 {code}) - 5초 뒤 다시 시작")
+                    time.sleep(5)
+                    processes[index] = spawn(index)
+    except KeyboardInterrupt:
+        print("\n👋 워커 종료 중...")
+        for process in processes.values():
+            process.terminate()
+        for process in processes.values():
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
 
+# ==================== 메인 실행 함수 ====================
 
 def main():
     """
     봇 메인 실행 함수
     설정 로드 → 검증 → 봇 시작
     """
+    parser = argparse.ArgumentParser(description="마인크래프트 서버 관리 디스코드 봇")
+    parser.add_argument("--worker", type=int, default=None, help="샤드 그룹 워커 번호 (워커 실행기가 지정)")
+    args = parser.parse_args()
+    
     print("\n" + "="*50)
-    print("🚀 Discord Bot 시작 중...")
+    print("🚀 Discord Bot 시작 중..." if args.worker is None else f"🚀 워커 {args.worker} 시작 중...")
     print("="*50 + "\n")
     
+    startup_timer = StartupTimer(started_at=_IMPORT_STARTED)
+    startup_timer.record("imports", _IMPORT_SECONDS)
+    
     # 설정 파일 로드
-    config = load_config()
+    with startup_timer.phase("config_load"):
+        config = load_config()
     
     # 설정 검증
     if not validate_config(config):
         sys.exit(1)
     
+    # 샤드 그룹을 여러 프로세스로 나눠 실행하면 이 프로세스는 워커 실행기 역할만 함
+    workers = shard_workers(config)
+    if workers > 1 and args.worker is None:
+        run_workers(workers)
+        return
+    
     # 봇 인스턴스 생성
-    bot = MinecraftBot(config)
+    bot = create_bot(config, startup_timer, worker_index=args.worker if workers > 1 else None)
     
     # 봇 실행
     try:
@@ -0,0 +1,320 @@
+"""
+관리 작업 감사 기록
+관리 명령어 실행 기록을 JSON Lines 파일에 추가만 하고(크기 기준 순환), 최근 기록은 메모리 색인으로 조회
+"""
+
+import asyncio
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from typing import IO, Any, Callable, Hashable, Iterable, Optional
+
+
+@dataclass
+class AuditEntry:
+    """
+    관리 작업 기록 한 건
+
+    Attributes:
+        at: 실행 시각 (UNIX time)
+        user_id: 실행한 디스코드 사용자 ID
+        user: 실행한 사용자 이름
+        action: 작업 이름 (MENU_ACTIONS / BULK_ACTIONS 키)
+        server: 대상 서버 이름 (전체 서버면 "*")
+        command: 실행한 RCON 명령어 (일괄 작업은 요약)
+        players: 대상 플레이어
+        results: 서버 이름별 성공 여부
+    """
+    at: float
+    user_id: int
+    user: str
+    action: str
+    server: str
+    command: str
+    players: list[str] = field(default_factory=list)
+    results: dict[str, bool] = field(default_factory=dict)
+
+    @property
+    def success(self) -> bool:
+        return all(self.results.values())
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "AuditEntry":
+        return cls(
+            at=float(data["at"]),
+            user_id=int(data["user_id"]),
+            user=str(data.get("user", "")),
+            action=str(data["action"]),
+            server=str(data.get("server", "")),
+            command=str(data.get("command", "")),
+            players=[str(player) for player in data.get("players") or []],
+            results={str(name): bool(ok) for name, ok in (data.get("results") or {}).items()},
+        )
+
+
+class AuditIndex:
+    """
+    최근 기록 메모리 색인
+
+    최근 max_entries건만 보관하고 사용자 / 플레이어(대소문자 무시) / 작업별로 기록 순서대로 색인한다.
+    가장 오래된 기록이 밀려나면 각 색인의 맨 앞 항목도 같은 기록이므로 함께 꺼낸다.
+    """
+
+    def __init__(self, max_entries: int = 5000):
+        self.entries: deque[AuditEntry] = deque()
+        self.max_entries = max(1, max_entries)
+        self._by_key: dict[Hashable, deque[AuditEntry]] = {}
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    @staticmethod
+    def _keys(entry: AuditEntry) -> set[Hashable]:
+        keys: set[Hashable] = {("user", entry.user_id), ("action", entry.action)}
+        keys.update(("player", player.lower()) for player in entry.players)
+        return keys
+
+    def add(self, entry: AuditEntry) -> None:
+        if len(self.entries) >= self.max_entries:
+            evicted = self.entries.popleft()
+            for key in self._keys(evicted):
+                bucket = self._by_key[key]
+                bucket.popleft()
+                if not bucket:
+                    del self._by_key[key]
+        self.entries.append(entry)
+        for key in self._keys(entry):
+            self._by_key.setdefault(key, deque()).append(entry)
+
+    def query(
+        self,
+        user_id: Optional[int] = None,
+        player: Optional[str] = None,
+        action: Optional[str] = None,
+        limit: int = 10
+    ) -> list[AuditEntry]:
+        """
+        조건에 맞는 최근 기록 (최신순)
+
+        가장 짧은 색인 하나만 거꾸로 훑으면서 나머지 조건을 확인한다.
+        """
+        keys = []
+        if user_id is not None:
+            keys.append(("user", user_id))
+        if player is not None:
+            keys.append(("player", player.lower()))
+        if action is not None:
+            keys.append(("action", action))
+
+        candidates: Iterable[AuditEntry] = self.entries
+        if keys:
+            buckets = [self._by_key.get(key) for key in keys]
+            if any(bucket is None for bucket in buckets):
+                return []
+            candidates = min(buckets, key=len)
+
+        wanted = player.lower() if player is not None else None
+        matches = []
+        for entry in reversed(candidates):
+            if user_id is not None and entry.user_id != user_id:
+                continue
+            if action is not None and entry.action != action:
+                continue
+            if wanted is not None and wanted not in (name.lower() for name in entry.players):
+                continue
+            matches.append(entry)
+            if len(matches) >= limit:
+                break
+        return matches
+
+
+class AuditLog:
+    """
+    추가 전용 감사 기록 파일
+
+    record()는 메모리 색인에 바로 넣고 쓰기 대기열에 추가만 하므로 상호작용 처리 시간에 영향이 없다.
+    쓰기 작업자 하나가 flush_interval 동안 모인 기록을 최대 batch_size건씩 한 번에 쓰고(그룹 커밋),
+    fsync는 fsync_interval마다 한 번만 한다. 파일이 max_bytes를 넘으면 path.1, path.2 ... 로 순환한다.
+    파일은 전용 스레드 하나에서만 다룬다.
+
+    Attributes:
+        path: 기록 파일 경로
+        max_bytes: 순환 기준 파일 크기
+        backup_count: 보관할 이전 파일 수
+        batch_size: 한 번에 쓸 최대 기록 수
+        flush_interval: 기록을 모으는 시간 (초)
+        fsync_interval: 디스크 동기화 주기 (초)
+        index: 최근 기록 색인
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = 10 * 1024 * 1024,
+        backup_count: int = 5,
+        batch_size: int = 200,
+        flush_interval: float = 1.0,
+        fsync_interval: float = 5.0,
+        index_size: int = 5000
+    ):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backup_count = max(0, backup_count)
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.fsync_interval = fsync_interval
+        self.index = AuditIndex(index_size)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="audit")
+        self._file: Optional[IO[bytes]] = None
+        self._size = 0
+        self._dirty = False
+        self._synced_at = 0.0
+        self._queue: asyncio.Queue[Optional[AuditEntry]] = asyncio.Queue()
+        self._writer: Optional[asyncio.Task] = None
+        self._closing = asyncio.Event()
+
+    async def _run(self, func: Callable[..., Any], *args) -> Any:
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    # ==================== 시작 / 종료 ====================
+
+    async def open(self) -> int:
+        """
+        이전 기록으로 색인을 다시 만들고 쓰기 작업자 시작
+
+        Returns:
+            int: 색인에 올린 기록 수
+        """
+        for entry in await self._run(self._open):
+            self.index.add(entry)
+        self._writer = asyncio.create_task(self._write_loop())
+        return len(self.index)
+
+    def _open(self) -> list[AuditEntry]:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # 오래된 파일부터 읽어 최근 기록만 남김 (비정상 종료로 잘린 마지막 줄은 건너뜀)
+        recent: deque[AuditEntry] = deque(maxlen=self.index.max_entries)
+        for path in [self._backup_path(n) for n in range(self.backup_count, 0, -1)] + [self.path]:
+            try:
+                with open(path, "rb") as file:
+                    for line in file:
+                        try:
+                            recent.append(AuditEntry.from_dict(json.loads(line)))
+                        except (ValueError, KeyError, TypeError):
+                            continue
+            except FileNotFoundError:
+                continue
+
+        self._file = open(self.path, "ab")
+        self._size = self._file.tell()
+        self._synced_at = time.monotonic()
+        return list(recent)
+
+    async def close(self) -> None:
+        """남은 기록을 모두 쓰고 동기화한 뒤 파일 닫기"""
+        self._closing.set()
+        if self._writer is not None:
+            self._queue.put_nowait(None)  # 대기 중인 쓰기 작업자 깨우기
+            await self._writer
+            self._writer = None
+        if self._file is not None:
+            await self._run(self._close_file)
+        self._executor.shutdown(wait=False)
+
+    def _close_file(self) -> None:
+        self._sync()
+        self._file.close()
+        self._file = None
+
+    # ==================== 쓰기 ====================
+
+    def record(self, entry: AuditEntry) -> None:
+        """기록 추가 (즉시 반환, 색인에는 바로 반영)"""
+        self.index.add(entry)
+        self._queue.put_nowait(entry)
+
+    async def _write_loop(self) -> None:
+        while not (self._closing.is_set() and self._queue.empty()):
+            try:
+                batch = [await asyncio.wait_for(self._queue.get(), self.fsync_interval)]
+            except asyncio.TimeoutError:
+                if self._dirty:
+                    try:
+                        await self._run(self._sync)  # 쓴 뒤 조용해진 경우에도 fsync_interval 안에 동기화
+                    except Exception as e:
+                        print(f"⚠️  감사 기록 동기화 실패: {e!r}")
+                continue
+
+            # 첫 기록이 들어오면 flush_interval 동안 더 모은 뒤 한 번에 씀 (종료 중이면 바로 씀)
+            try:
+                await asyncio.wait_for(self._closing.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            while len(batch) < self.batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            entries = [entry for entry in batch if entry is not None]
+            if not entries:
+                continue
+            try:
+                await self._run(self._write_batch, entries)
+            except Exception as e:
+                # 한 묶음을 쓰지 못해도 쓰기 작업자는 계속 실행 (멈추면 이후 기록이 쌓이기만 하고 종료 시 close()도 실패)
+                print(f"⚠️  감사 기록 저장 실패 ({len(entries)}건): {e!r}")
+
+    def _write_batch(self, entries: list[AuditEntry]) -> None:
+        data = b"".join(
+            json.dumps(entry.to_dict(), ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n"
+            for entry in entries
+        )
+        if self._size and self._size + len(data) > self.max_bytes:
+            self._rotate()
+        self._file.write(data)
+        self._file.flush()
+        self._size += len(data)
+        self._dirty = True
+        if time.monotonic() - self._synced_at >= self.fsync_interval:
+            self._sync()
+
+    def _sync(self) -> None:
+        if self._dirty:
+            os.fsync(self._file.fileno())
+            self._dirty = False
+        self._synced_at = time.monotonic()
+
+    def _rotate(self) -> None:
+        self._sync()
+        self._file.close()
+        if self.backup_count:
+            for n in range(self.backup_count - 1, 0, -1):
+                if os.path.exists(self._backup_path(n)):
+                    os.replace(self._backup_path(n), self._backup_path(n + 1))
+            os.replace(self.path, self._backup_path(1))
+            self._file = open(self.path, "ab")
+        else:
+            self._file = open(self.path, "wb")
+        self._size = 0
+
+    def _backup_path(self, n: int) -> str:
+        return f"{self.path}.{n}"
+
+    # ==================== 조회 ====================
+
+    def query(
+        self,
+        user_id: Optional[int] = None,
+        player: Optional[str] = None,
+        action: Optional[str] = None,
+        limit: int = 10
+    ) -> list[AuditEntry]:
+        """최근 기록 조회 (최신순, 메모리 색인만 사용)"""
+        return self.index.query(user_id=user_id, player=player, action=action, limit=limit)
@@ -0,0 +1,112 @@
+"""
+RCON 조회 명령어 캐시
+동일한 조회 요청을 하나의 RCON 호출로 합치고(single-flight) 결과를 TTL 동안 재사용
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Optional
+
+
+# 변경 명령어(첫 단어) → 무효화할 조회 명령어
+INVALIDATIONS: dict[str, tuple[str, ...]] = {
+    "whitelist": ("whitelist list",),
+    "op": ("list",),
+    "deop": ("list",),
+    "kick": ("list",),
+    "ban": ("list",),
+}
+
+DEFAULT_TTLS: dict[str, float] = {
+    "list": 5.0,
+    "whitelist list": 30.0,
+}
+
+
+def normalize_command(command: str) -> str:
+    """캐시 키로 쓰기 위해 공백과 대소문자, 선행 슬래시를 정리"""
+    return " ".join(command.lstrip("/").split()).lower()
+
+
+class QueryCache:
+    """
+    읽기 전용 RCON 명령어 캐시
+
+    Attributes:
+        ttls: 명령어별 캐시 유지 시간 (초). 목록에 없는 명령어는 캐시하지 않음
+    """
+
+    def __init__(self, ttls: Optional[dict[str, float]] = None):
+        source = DEFAULT_TTLS if ttls is None else ttls
+        self.ttls = {normalize_command(key): float(ttl) for key, ttl in source.items()}
+        self._entries: dict[str, tuple[float, Any]] = {}
+        self._inflight: dict[str, asyncio.Future] = {}
+
+    def is_cacheable(self, command: str) -> bool:
+        """캐시 대상 명령어 여부"""
+        return self.ttls.get(normalize_command(command), 0) > 0
+
+    async def get(self, command: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        캐시된 결과 반환, 없으면 fetch 실행
+
+        같은 명령어의 동시 요청은 진행 중인 하나의 fetch 결과를 함께 기다린다.
+        fetch에서 발생한 예외는 캐시하지 않고 기다리던 모든 호출자에게 전달한다.
+
+        Args:
+            command: RCON 명령어
+            fetch: 실제 RCON 호출 코루틴 함수
+
+        Returns:
+            Any: fetch 결과
+        """
+        key = normalize_command(command)
+        ttl = self.ttls.get(key, 0)
+        if ttl <= 0:
+            return await fetch()
+
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._load(key, ttl, fetch))
+            self._inflight[key] = future
+        # 한 호출자가 취소되어도 공유 중인 요청은 계속 진행
+        return await asyncio.shield(future)
+
+    async def _load(self, key: str, ttl: float, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        task = asyncio.current_task()
+        try:
+            value = await fetch()
+        except BaseException:
+            if self._inflight.get(key) is task:
+                del self._inflight[key]
+            raise
+        # 진행 중에 무효화되었다면 (요청이 교체되었거나 제거됨) 결과를 저장하지 않음
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+            self._entries[key] = (time.monotonic() + ttl, value)
+        return value
+
+    def invalidate(self, *commands: str) -> None:
+        """지정한 명령어의 캐시 및 진행 중 요청 연결 해제 (인자가 없으면 전체)"""
+        keys = [normalize_command(c) for c in commands] if commands else list(self.ttls)
+        for key in keys:
+            self._entries.pop(key, None)
+            self._inflight.pop(key, None)
+
+    def invalidate_for(self, command: str) -> None:
+        """
+        변경 명령어 실행 후 관련된 조회 캐시 무효화
+
+        Args:
+            command: 실행된 RCON 명령어
+        """
+        key = normalize_command(command)
+        if not key or key in self.ttls:
+            return
+        targets = INVALIDATIONS.get(key.split(" ", 1)[0])
+        if targets:
+            self.invalidate(*targets)
@@ -0,0 +1,130 @@
+"""
+설정 파일 읽기 / 검증 / 비교
+시작할 때와 실행 중 config.yml이 바뀌었을 때(핫 리로드) 같은 경로로 읽고 검증
+"""
+
+from typing import Any
+
+import yaml
+
+from utils.permissions import Authorizer
+from utils.status import STATUS_BACKENDS
+
+# 바뀌어도 재시작해야 적용되는 최상위 항목
+RESTART_KEYS = (
+    "token", "application_id", "gateway", "extensions", "command_sync", "metrics", "startup_report", "sharding",
+    "sessions", "audit",
+)
+
+
+class ConfigError(Exception):
+    """설정 파일을 읽거나 해석할 수 없음"""
+
+
+def read_config(config_path: str = "config.yml") -> dict:
+    """
+    YAML 설정 파일 읽기
+
+    Args:
+        config_path: 설정 파일 경로
+
+    Returns:
+        dict: 설정 딕셔너리
+
+    Raises:
+        ConfigError: 파일이 없거나 YAML 형식이 잘못된 경우
+    """
+    try:
+        with open(config_path, "r", encoding="utf-8") as config_file:
+            config = yaml.safe_load(config_file)
+    except FileNotFoundError as e:
+        raise ConfigError(f"{config_path} 파일을 찾을 수 없습니다.") from e
+    except yaml.YAMLError as e:
+        raise ConfigError(f"{config_path} 파일 파싱 실패 - {e}") from e
+    except OSError as e:
+        raise ConfigError(f"{config_path} 파일을 읽을 수 없습니다 - {e}") from e
+
+    if not isinstance(config, dict):
+        raise ConfigError(f"{config_path} 파일의 최상위 항목이 딕셔너리가 아닙니다.")
+    return config
+
+
+def validate_config(config: dict) -> bool:
+    """
+    설정 파일의 필수 항목 검증
+
+    Args:
+        config: 설정 딕셔너리
+
+    Returns:
+        bool: 검증 통과 여부
+    """
+    required_keys = ["token", "application_id"]
+    missing_keys = [key for key in required_keys if not config.get(key)]
+
+    if missing_keys:
+        print(f"❌ 오류: config.yml에 다음 항목이 누락되었습니다: {', '.join(missing_keys)}")
+        return False
+
+    # 권한 등급 설정 확인
+    try:
+        Authorizer(config)
+    except (ValueError, TypeError) as e:
+        print(f"❌ 오류: 권한 설정이 잘못되었습니다: {e}")
+        return False
+
+    # 상태 조회 방식 확인 (공통 설정과 서버별 설정)
+    rcon_config = config.get("minecraft_rcon") or {}
+    for label, settings in [("minecraft_rcon", rcon_config)] + [
+        (f"minecraft_servers.{entry.get('name', index)}", entry)
+        for index, entry in enumerate(config.get("minecraft_servers") or [])
+        if isinstance(entry, dict)
+    ]:
+        backend = settings.get("status_backend")
+        if backend is not None and backend not in STATUS_BACKENDS:
+            print(f"❌ 오류: {label}.status_backend는 {', '.join(STATUS_BACKENDS)} 중 하나여야 합니다 (현재: {backend})")
+            return False
+
+    # 샤딩 설정 확인
+    sharding = config.get("sharding") or {}
+    if sharding.get("enabled"):
+        shard_count = sharding.get("shard_count")
+        workers = sharding.get("workers", 1)
+        if sharding.get("shard_ids") is not None and not shard_count:
+            print("❌ 오류: sharding.shard_ids를 지정하려면 sharding.shard_count도 설정해야 합니다.")
+            return False
+        if workers > 1 and (not shard_count or shard_count < workers):
+            print("❌ 오류: sharding.workers가 2 이상이면 sharding.shard_count를 워커 수 이상으로 설정해야 합니다.")
+            return False
+
+    # 관리자 역할 확인 (경고만)
+    if not config.get("administrator_role_ids"):
+        print("⚠️  경고: administrator_role_ids가 설정되지 않았습니다.")
+        print("   관리자 전용 명령어를 사용하려면 config.yml에 역할 ID를 추가하세요.\n")
+
+    return True
+
+
+def diff_config(old: Any, new: Any, prefix: str = "") -> list[str]:
+    """
+    바뀐 설정 항목의 경로 목록 (값은 비밀번호/토큰이 있을 수 있으므로 포함하지 않음)
+
+    Args:
+        old: 이전 설정
+        new: 새 설정
+        prefix: 상위 항목 경로
+
+    Returns:
+        list[str]: 점으로 구분한 경로 (예: "minecraft_rcon.password"), 목록은 통째로 비교
+    """
+    if not isinstance(old, dict) or not isinstance(new, dict):
+        return [] if old == new else [prefix or "(전체)"]
+
+    changes = []
+    for key in sorted(old.keys() | new.keys(), key=str):
+        path = f"{prefix}.{key}" if prefix else str(key)
+        if key not in old or key not in new:
+            changes.append(path)
+        else:
+            changes.extend(diff_config(old[key], new[key], path))
+    return changes
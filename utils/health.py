@@ -0,0 +1,121 @@
+"""
+RCON 대상 서버 상태 추적
+연속 실패 시 회로를 열어 요청을 즉시 실패시키고, 지수적으로 늘어나는 간격으로 복구를 확인
+"""
+
+import time
+from typing import Optional
+
+from utils.rcon import RconError
+
+CLOSED = "closed"        # 정상: 모든 요청 허용
+OPEN = "open"            # 차단: 재확인 시각 전까지 요청 즉시 실패
+HALF_OPEN = "half_open"  # 재확인: 요청 하나만 시험 삼아 허용
+STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}  # 지표 값
+
+
+class CircuitOpenError(RconError):
+    """회로가 열려 있어 요청을 보내지 않고 실패"""
+
+
+class CircuitBreaker:
+    """
+    서버별 회로 차단기
+
+    Attributes:
+        state: 현재 상태 (CLOSED / OPEN / HALF_OPEN)
+        failures: 연속 실패 수
+        delay: 현재 재확인 간격 (초, 재확인이 실패할 때마다 두 배)
+        last_seen: 마지막 성공 시각 (monotonic, 성공한 적이 없으면 None)
+        last_error: 마지막 실패 사유
+    """
+
+    def __init__(self, failure_threshold: int = 2, base_delay: float = 2.0, max_delay: float = 60.0):
+        self.failure_threshold = max(1, failure_threshold)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.state = CLOSED
+        self.failures = 0
+        self.delay = base_delay
+        self.retry_at = 0.0
+        self.last_seen: Optional[float] = None
+        self.last_error: Optional[str] = None
+
+    @property
+    def is_closed(self) -> bool:
+        return self.state == CLOSED
+
+    @property
+    def retry_in(self) -> float:
+        """다음 재확인까지 남은 시간 (초)"""
+        if self.state == OPEN:
+            return max(0.0, self.retry_at - time.monotonic())
+        return self.base_delay
+
+    def check(self) -> None:
+        """
+        상태를 바꾸지 않고 요청 가능 여부만 확인 (대기열에 넣기 전 빠른 실패용)
+
+        Raises:
+            CircuitOpenError: 회로가 열려 있고 재확인 시각 전인 경우
+        """
+        if self.state == OPEN and time.monotonic() < self.retry_at:
+            raise CircuitOpenError(self.describe())
+
+    def before_request(self) -> None:
+        """
+        요청 전 호출
+        재확인 시각이 지났으면 HALF_OPEN으로 바꿔 이 요청을 시험 요청으로 허용한다.
+
+        Raises:
+            CircuitOpenError: 회로가 열려 있거나 다른 시험 요청이 진행 중인 경우
+        """
+        if self.state == CLOSED:
+            return
+        if self.state == OPEN and time.monotonic() >= self.retry_at:
+            self.state = HALF_OPEN
+            return
+        raise CircuitOpenError(self.describe())
+
+    def release(self) -> None:
+        """
+        요청을 보내지 못했을 때 호출 (잘못된 명령어 등 서버 상태와 무관한 실패)
+        결과를 기록하지 않고, 시험 요청이었다면 다음 요청이 바로 시험할 수 있게 자리를 돌려준다.
+        """
+        if self.state == HALF_OPEN:
+            self.state = OPEN
+            self.retry_at = time.monotonic()
+
+    def record_success(self) -> None:
+        self.state = CLOSED
+        self.failures = 0
+        self.delay = self.base_delay
+        self.last_seen = time.monotonic()
+        self.last_error = None
+
+    def record_failure(self, error: BaseException) -> None:
+        self.failures += 1
+        self.last_error = str(error) or type(error).__name__
+        if self.state == HALF_OPEN:
+            self.delay = min(self.delay * 2, self.max_delay)
+            self._open()
+        elif self.state == CLOSED and self.failures >= self.failure_threshold:
+            self.delay = self.base_delay
+            self._open()
+
+    def _open(self) -> None:
+        self.state = OPEN
+        self.retry_at = time.monotonic() + self.delay
+
+    def describe(self) -> str:
+        """상태 임베드에 표시할 설명 (예: "🔴 서버 응답 없음 (재시작 중이거나 꺼져 있음) · 마지막 응답 40초 전")"""
+        if self.state == CLOSED:
+            return "🟢 정상"
+
+        if self.last_seen is None:
+            seen = "응답 기록 없음"
+        else:
+            seen = f"마지막 응답 {int(time.monotonic() - self.last_seen)}초 전"
+        if self.state == HALF_OPEN:
+            return f"🟡 복구 확인 중 · {seen}"
+        return f"🔴 서버 응답 없음 (재시작 중이거나 꺼져 있음) · {seen} · {int(self.retry_in) + 1}초 후 재확인"
@@ -0,0 +1,252 @@
+"""
+워커 프로세스 간 통신 (Unix 소켓)
+샤드 그룹을 여러 프로세스로 나눠 실행할 때 첫 번째 워커가 RCON 연결 풀과 상태 스냅샷을 들고
+나머지 워커는 이 소켓으로 명령어 실행과 상태 조회를 요청한다.
+
+프레임: 4바이트 길이(빅 엔디언) + UTF-8 JSON
+요청: {"id": n, "op": "...", "args": {...}} / 응답: {"id": n, "result": ...} 또는 {"id": n, "error": {"type", "message"}}
+"""
+
+import asyncio
+import itertools
+import json
+import os
+import struct
+from typing import Any, Awaitable, Callable, Optional
+
+from utils.health import CircuitOpenError
+from utils.rcon import RconAuthError, RconError, RconPayloadError
+from utils.scheduler import QueueFullError
+
+MAX_FRAME_SIZE = 16 * 1024 * 1024
+_HEADER = struct.Struct(">I")
+
+# 원격 오류 종류 → 이쪽에서 다시 발생시킬 예외 (회로 차단/대기열/인증 실패/잘못된 명령어를 로컬과 똑같이 처리하기 위함)
+_REMOTE_ERRORS: dict[str, type[Exception]] = {
+    "CircuitOpenError": CircuitOpenError,
+    "QueueFullError": QueueFullError,
+    "RconAuthError": RconAuthError,
+    "RconPayloadError": RconPayloadError,
+}
+
+Handler = Callable[..., Awaitable[Any]]
+
+
+class IpcError(RconError):
+    """공유 연결 서버와 통신할 수 없거나 요청이 실패함"""
+
+
+async def _read_frame(reader: asyncio.StreamReader) -> Any:
+    (length,) = _HEADER.unpack(await reader.readexactly(_HEADER.size))
+    if length > MAX_FRAME_SIZE:
+        raise IpcError(f"메시지가 너무 큽니다 ({length}바이트)")
+    return json.loads(await reader.readexactly(length))
+
+
+def _frame(message: Any) -> bytes:
+    data = json.dumps(message, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return _HEADER.pack(len(data)) + data
+
+
+class IpcServer:
+    """
+    요청 처리 서버 (첫 번째 워커에서 실행)
+
+    연결마다 요청을 동시에 처리하며, 처리 함수는 op 이름으로 등록한다.
+
+    Attributes:
+        path: Unix 소켓 경로
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.handlers: dict[str, Handler] = {}
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._connections: dict[asyncio.Task, asyncio.StreamWriter] = {}
+
+    def register(self, op: str, handler: Handler) -> None:
+        self.handlers[op] = handler
+
+    def unregister(self, op: str) -> None:
+        self.handlers.pop(op, None)
+
+    async def start(self) -> None:
+        # 이전 실행이 남긴 소켓 파일 정리
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+        self._server = await asyncio.start_unix_server(self._handle_connection, path=self.path)
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+        # 처리 작업을 취소하지 않고 연결을 닫아 읽기 루프가 스스로 끝나게 함
+        for writer in list(self._connections.values()):
+            writer.close()
+        await asyncio.gather(*self._connections, return_exceptions=True)
+        if self._server is not None:
+            await self._server.wait_closed()
+            self._server = None
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        task = asyncio.current_task()
+        self._connections[task] = writer
+        write_lock = asyncio.Lock()
+        pending: set[asyncio.Task] = set()
+
+        async def respond(request: dict) -> None:
+            response = {"id": request.get("id")}
+            handler = self.handlers.get(request.get("op"))
+            try:
+                if handler is None:
+                    raise IpcError(f"알 수 없는 요청입니다: {request.get('op')}")
+                response["result"] = await handler(**(request.get("args") or {}))
+            except Exception as e:
+                response["error"] = {"type": type(e).__name__, "message": str(e)}
+            async with write_lock:
+                writer.write(_frame(response))
+                await writer.drain()
+
+        try:
+            while True:
+                request = await _read_frame(reader)
+                job = asyncio.create_task(respond(request))
+                pending.add(job)
+                job.add_done_callback(pending.discard)
+        except (asyncio.IncompleteReadError, ConnectionError, IpcError, ValueError):
+            pass
+        finally:
+            for job in pending:
+                job.cancel()
+            writer.close()
+            self._connections.pop(task, None)
+
+
+class IpcClient:
+    """
+    요청 클라이언트 (나머지 워커에서 사용)
+
+    연결 하나로 여러 요청을 동시에 보내고 응답은 id로 짝을 맞춘다.
+    연결이 끊기면 기다리던 요청을 모두 실패 처리하고 다음 요청 때 다시 연결한다.
+
+    Attributes:
+        path: Unix 소켓 경로
+        timeout: 요청 제한 시간 (초)
+    """
+
+    def __init__(self, path: str, timeout: float = 30.0):
+        self.path = path
+        self.timeout = timeout
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._reader_task: Optional[asyncio.Task] = None
+        self._pending: dict[int, tuple[asyncio.StreamWriter, asyncio.Future]] = {}
+        self._ids = itertools.count(1)
+        self._connect_lock = asyncio.Lock()
+
+    @property
+    def in_flight(self) -> int:
+        """응답을 기다리는 요청 수"""
+        return len(self._pending)
+
+    async def request(self, op: str, **args) -> Any:
+        """
+        요청을 보내고 결과를 기다림
+
+        Raises:
+            IpcError: 연결 실패 / 시간 초과 / 알 수 없는 원격 오류
+            CircuitOpenError / QueueFullError / RconAuthError: 원격에서 같은 오류가 발생한 경우
+        """
+        writer = await self._connect()
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = (writer, future)
+        try:
+            writer.write(_frame({"id": request_id, "op": op, "args": args}))
+            await writer.drain()
+            response = await asyncio.wait_for(future, self.timeout)
+        except asyncio.TimeoutError as e:
+            raise IpcError(f"공유 연결 서버 응답 시간 초과 ({op})") from e
+        except ConnectionError as e:
+            raise IpcError(f"공유 연결 서버와 연결이 끊겼습니다: {e}") from e
+        finally:
+            self._pending.pop(request_id, None)
+
+        error = response.get("error")
+        if error is not None:
+            raise _REMOTE_ERRORS.get(error.get("type"), IpcError)(error.get("message", ""))
+        return response.get("result")
+
+    async def _connect(self) -> asyncio.StreamWriter:
+        async with self._connect_lock:
+            if self._writer is not None and not self._writer.is_closing():
+                return self._writer
+            try:
+                reader, self._writer = await asyncio.open_unix_connection(self.path)
+            except OSError as e:
+                raise IpcError(f"공유 연결 서버에 연결할 수 없습니다 ({self.path}): {e}") from e
+            self._reader_task = asyncio.create_task(self._read_loop(reader, self._writer))
+            return self._writer
+
+    async def _read_loop(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        연결 하나의 응답을 읽어 요청에 전달
+        연결이 끊기면 이 연결로 보낸 요청만 실패시키고, 그 사이 새로 맺은 연결은 건드리지 않는다.
+        """
+        try:
+            while True:
+                response = await _read_frame(reader)
+                sent_on, future = self._pending.get(response.get("id"), (None, None))
+                if sent_on is writer and not future.done():
+                    future.set_result(response)
+        except (asyncio.IncompleteReadError, ConnectionError, IpcError, ValueError) as e:
+            error = IpcError(f"공유 연결 서버와 연결이 끊겼습니다: {e or type(e).__name__}")
+        finally:
+            writer.close()
+            if self._writer is writer:
+                self._writer = None
+        for sent_on, future in self._pending.values():
+            if sent_on is writer and not future.done():
+                future.set_exception(error)
+
+    async def close(self) -> None:
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            await asyncio.gather(self._reader_task, return_exceptions=True)
+            self._reader_task = None
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+
+class RemotePool:
+    """
+    RconPool 대신 공유 연결 서버로 명령어를 보내는 풀 (MinecraftServer의 pool 자리에 사용)
+
+    Attributes:
+        client: IPC 클라이언트
+        server: 공유 연결 서버 쪽 서버 이름
+    """
+
+    def __init__(self, client: IpcClient, server: str):
+        self.client = client
+        self.server = server
+        self.in_use = 0
+        self.idle_count = 0
+
+    async def command(self, command: str) -> str:
+        self.in_use += 1
+        try:
+            return await self.client.request("execute", server=self.server, command=command)
+        finally:
+            self.in_use -= 1
+
+    async def command_many(self, commands: list[str], window: int = 16) -> list[str]:
+        self.in_use += 1
+        try:
+            return await self.client.request("execute_many", server=self.server, commands=commands)
+        finally:
+            self.in_use -= 1
+
+    async def close(self) -> None:
+        pass  # 클라이언트는 봇이 닫음
@@ -0,0 +1,191 @@
+"""
+마인크래프트 서버 로그 추적
+logs/latest.log를 마지막으로 읽은 위치부터 이어 읽고, 채팅/접속/퇴장/사망 이벤트로 파싱
+"""
+
+import os
+import re
+import time
+from dataclasses import dataclass, field
+from typing import BinaryIO, Optional
+
+CHAT = "chat"
+JOIN = "join"
+LEAVE = "leave"
+DEATH = "death"
+EVENT_KINDS = (CHAT, JOIN, LEAVE, DEATH)
+
+# 예: "[12:34:56] [Server thread/INFO]: Steve joined the game"
+#     "[12:34:56] [Server thread/INFO] [minecraft/MinecraftServer]: <Steve> hi" (Forge)
+_LINE_PATTERN = re.compile(r"\[(?P<time>[\d:]+)\] \[Server thread/INFO\](?: \[[^\]]+\])?: (?P<message>.*)")
+_PLAYER = r"(?P<player>\.?[A-Za-z0-9_]{1,16})"
+_CHAT_PATTERN = re.compile(r"(?:\[Not Secure\] )?<" + _PLAYER + r"> (?P<text>.*)")
+_JOIN_PATTERN = re.compile(_PLAYER + r" joined the game")
+_LEAVE_PATTERN = re.compile(_PLAYER + r" left the game")
+_DEATH_PATTERN = re.compile(
+    _PLAYER + r" (?P<text>(?:"
+    r"was |died|drowned|blew up|hit the ground|fell |went up in flames|went off with a bang|burned to death|"
+    r"walked into|suffocated|starved to death|froze to death|experienced kinetic energy|withered away|"
+    r"tried to swim in lava|discovered the floor was lava|didn't want to live|left the confines|"
+    r"was squashed|was killed|was slain|was shot|was blown up|was pummeled|was impaled|was fireballed|"
+    r"was stung|was poked|was pricked|was skewered|was struck by lightning|was obliterated|was squished"
+    r").*)"
+)
+
+
+@dataclass
+class LogEvent:
+    """
+    로그에서 파싱한 이벤트
+
+    Attributes:
+        kind: 이벤트 종류 (chat / join / leave / death)
+        player: 플레이어 이름
+        text: 채팅 내용 또는 사망 메시지 (접속/퇴장은 빈 문자열)
+        logged_at: 로그에 기록된 시각 문자열 (HH:MM:SS)
+        received_at: 봇이 읽은 시각 (UNIX time)
+    """
+    kind: str
+    player: str
+    text: str = ""
+    logged_at: str = ""
+    received_at: float = field(default_factory=time.time)
+
+
+def parse_log_line(line: str) -> Optional[LogEvent]:
+    """
+    로그 한 줄 파싱
+
+    Args:
+        line: 로그 줄 (줄바꿈 제외)
+
+    Returns:
+        Optional[LogEvent]: 관심 있는 이벤트가 아니면 None
+    """
+    match = _LINE_PATTERN.match(line)
+    if not match:
+        return None
+    message, logged_at = match.group("message"), match.group("time")
+
+    if message.startswith("<") or message.startswith("[Not Secure]"):
+        chat = _CHAT_PATTERN.fullmatch(message)
+        return LogEvent(CHAT, chat.group("player"), chat.group("text"), logged_at) if chat else None
+    if message.endswith(" joined the game"):
+        join = _JOIN_PATTERN.fullmatch(message)
+        return LogEvent(JOIN, join.group("player"), logged_at=logged_at) if join else None
+    if message.endswith(" left the game"):
+        leave = _LEAVE_PATTERN.fullmatch(message)
+        return LogEvent(LEAVE, leave.group("player"), logged_at=logged_at) if leave else None
+    death = _DEATH_PATTERN.fullmatch(message)
+    if death:
+        return LogEvent(DEATH, death.group("player"), f"{death.group('player')} {death.group('text')}", logged_at)
+    return None
+
+
+class LogTailer:
+    """
+    로그 파일 추적기 (블로킹 파일 I/O이므로 asyncio.to_thread로 호출)
+
+    한 번에 읽는 양(chunk_size, max_bytes)과 미완성 줄 길이(max_line)를 제한하므로
+    로그 파일이 아무리 커도 메모리 사용량이 일정하다.
+    파일이 교체되면(로그 회전) 이전 파일의 남은 내용을 마저 읽고 새 파일을 처음부터 읽는다.
+
+    Attributes:
+        path: 로그 파일 경로
+        from_start: 처음 열 때 파일 처음부터 읽을지 여부 (기본값: 끝에서부터 새 줄만)
+    """
+
+    def __init__(
+        self,
+        path: str,
+        from_start: bool = False,
+        chunk_size: int = 64 * 1024,
+        max_bytes: int = 1024 * 1024,
+        max_line: int = 16 * 1024
+    ):
+        self.path = path
+        self.from_start = from_start
+        self.chunk_size = chunk_size
+        self.max_bytes = max_bytes
+        self.max_line = max_line
+        self._file: Optional[BinaryIO] = None
+        self._identity: Optional[tuple[int, int]] = None
+        self._partial = bytearray()
+        self._opened_once = False
+
+    def poll(self) -> list[LogEvent]:
+        """
+        마지막 위치 이후 새로 기록된 줄을 읽어 이벤트로 변환
+
+        Returns:
+            list[LogEvent]: 새 이벤트 (한 번에 최대 max_bytes만큼만 읽음)
+        """
+        if self._file is None and not self._open():
+            return []
+
+        try:
+            stat = os.stat(self.path)
+            identity = (stat.st_dev, stat.st_ino)
+        except FileNotFoundError:
+            stat, identity = None, self._identity
+
+        events = []
+        if identity != self._identity:
+            # 회전: 이전 파일의 남은 줄을 읽고 새 파일로 전환
+            events.extend(self._read(self.max_bytes))
+            self.close()
+            if not self._open():
+                return events
+        elif stat is not None and stat.st_size < self._file.tell():
+            # 같은 파일이 잘림 (copytruncate 방식 회전)
+            self._file.seek(0)
+            self._partial.clear()
+
+        events.extend(self._read(self.max_bytes))
+        return events
+
+    def _open(self) -> bool:
+        try:
+            self._file = open(self.path, "rb")
+        except FileNotFoundError:
+            return False
+        stat = os.fstat(self._file.fileno())
+        self._identity = (stat.st_dev, stat.st_ino)
+        if not self._opened_once and not self.from_start:
+            self._file.seek(0, os.SEEK_END)
+        self._opened_once = True
+        self._partial.clear()
+        return True
+
+    def _read(self, budget: int) -> list[LogEvent]:
+        events = []
+        while budget > 0:
+            chunk = self._file.read(min(self.chunk_size, budget))
+            if not chunk:
+                break
+            budget -= len(chunk)
+
+            start = 0
+            while True:
+                end = chunk.find(b"\n", start)
+                if end < 0:
+                    break
+                if self._partial:
+                    self._partial += chunk[start:end][:max(0, self.max_line - len(self._partial))]
+                    line = bytes(self._partial)
+                    self._partial.clear()
+                else:
+                    line = chunk[start:end][:self.max_line]
+                event = parse_log_line(line.decode("utf-8", errors="replace").rstrip("\r"))
+                if event is not None:
+                    events.append(event)
+                start = end + 1
+
+            # 줄바꿈 없이 끝난 부분은 다음 읽기까지 보관 (max_line을 넘는 부분은 버림)
+            self._partial += chunk[start:][:max(0, self.max_line - len(self._partial))]
+        return events
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
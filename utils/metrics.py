@@ -0,0 +1,270 @@
+"""
+성능 지표 수집
+지연 시간 히스토그램, 카운터, 게이지를 메모리에 보관하고 Prometheus 텍스트 형식으로 출력
+"""
+
+import bisect
+import functools
+import time
+from typing import Awaitable, Callable, Iterable, Optional, TypeVar
+
+import discord
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+T = TypeVar("T")
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+# ==================== 지표 타입 ====================
+
+class Counter:
+    """누적 카운터"""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labels: tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labels = labels
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = tuple(str(labels.get(name, "")) for name in self.labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def samples(self) -> Iterable[str]:
+        for key, value in self._values.items():
+            yield f"{self.name}{_format_labels(self.labels, key)} {_format_value(value)}"
+
+
+class Gauge:
+    """스크레이프 시점에 callback으로 값을 읽는 게이지"""
+
+    type_name = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: tuple[str, ...] = (),
+        callback: Optional[Callable[[], dict[tuple[str, ...], float]]] = None
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labels = labels
+        self.callback = callback
+
+    def values(self) -> dict[tuple[str, ...], float]:
+        return self.callback() if self.callback else {}
+
+    def samples(self) -> Iterable[str]:
+        for key, value in self.values().items():
+            yield f"{self.name}{_format_labels(self.labels, key)} {_format_value(value)}"
+
+
+class _HistogramSeries:
+    __slots__ = ("counts", "total", "count")
+
+    def __init__(self, size: int):
+        self.counts = [0] * size
+        self.total = 0.0
+        self.count = 0
+
+
+class Histogram:
+    """
+    버킷 히스토그램
+    값마다 버킷 카운트만 올리므로 관측 수와 관계없이 메모리가 일정하다.
+    """
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labels = labels
+        self.buckets = tuple(sorted(buckets))
+        self._series: dict[tuple[str, ...], _HistogramSeries] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = tuple(str(labels.get(name, "")) for name in self.labels)
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = _HistogramSeries(len(self.buckets) + 1)
+        series.counts[bisect.bisect_left(self.buckets, value)] += 1
+        series.total += value
+        series.count += 1
+
+    def series(self) -> dict[tuple[str, ...], _HistogramSeries]:
+        return self._series
+
+    def quantile(self, q: float, key: tuple[str, ...]) -> Optional[float]:
+        """
+        버킷 경계 사이를 선형 보간해 분위수 추정 (Prometheus histogram_quantile과 같은 방식)
+
+        Args:
+            q: 분위수 (0~1)
+            key: 레이블 값 튜플
+
+        Returns:
+            Optional[float]: 추정값 (관측이 없으면 None)
+        """
+        series = self._series.get(key)
+        if series is None or series.count == 0:
+            return None
+
+        rank = q * series.count
+        cumulative = 0
+        for index, count in enumerate(series.counts):
+            if cumulative + count >= rank and count:
+                if index == len(self.buckets):
+                    return self.buckets[-1]  # +Inf 버킷은 가장 큰 경계로 표시
+                lower = self.buckets[index - 1] if index else 0.0
+                upper = self.buckets[index]
+                return lower + (upper - lower) * (rank - cumulative) / count
+            cumulative += count
+        return self.buckets[-1]
+
+    def samples(self) -> Iterable[str]:
+        for key, series in self._series.items():
+            cumulative = 0
+            for bound, count in zip(self.buckets, series.counts):
+                cumulative += count
+                bucket_labels = _format_labels(self.labels, key, 'le="' + _format_value(bound) + '"')
+                yield f"{self.name}_bucket{bucket_labels} {cumulative}"
+            bucket_labels = _format_labels(self.labels, key, 'le="+Inf"')
+            yield f"{self.name}_bucket{bucket_labels} {series.count}"
+            yield f"{self.name}_sum{_format_labels(self.labels, key)} {_format_value(series.total)}"
+            yield f"{self.name}_count{_format_labels(self.labels, key)} {series.count}"
+
+
+# ==================== 레지스트리 ====================
+
+class MetricsRegistry:
+    """
+    지표 레지스트리
+    같은 이름으로 다시 등록하면 기존 지표를 반환하므로 Cog를 다시 로드해도 값이 유지된다.
+    """
+
+    def __init__(self):
+        self._metrics: dict[str, object] = {}
+
+    def counter(self, name: str, documentation: str, labels: tuple[str, ...] = ()) -> Counter:
+        return self._register(name, lambda: Counter(name, documentation, labels))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labels: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self._register(name, lambda: Histogram(name, documentation, labels, buckets))
+
+    def gauge(
+        self,
+        name: str,
+        documentation: str,
+        labels: tuple[str, ...] = (),
+        callback: Optional[Callable[[], dict[tuple[str, ...], float]]] = None
+    ) -> Gauge:
+        gauge = self._register(name, lambda: Gauge(name, documentation, labels))
+        gauge.callback = callback  # 다시 로드된 Cog의 callback으로 교체
+        return gauge
+
+    def _register(self, name: str, factory: Callable[[], T]) -> T:
+        metric = self._metrics.get(name)
+        if metric is None:
+            metric = self._metrics[name] = factory()
+        return metric
+
+    def unregister(self, name: str) -> None:
+        self._metrics.pop(name, None)
+
+    def histograms(self) -> list[Histogram]:
+        return [metric for metric in self._metrics.values() if isinstance(metric, Histogram)]
+
+    def get(self, name: str) -> Optional[object]:
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """Prometheus 텍스트 형식 출력"""
+        lines = []
+        for metric in self._metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.type_name}")
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+# ==================== 상호작용 계측 ====================
+
+def mark_first_response(interaction: discord.Interaction, handler: str) -> None:
+    """
+    상호작용의 첫 응답 시각 기록
+    Discord가 상호작용을 만든 시각부터 측정하므로 게이트웨이 전달 지연까지 포함된다.
+
+    Args:
+        interaction: 상호작용
+        handler: 핸들러 이름 (지표 레이블)
+    """
+    metrics = getattr(interaction.client, "metrics", None)
+    if metrics is None:
+        return
+    elapsed = (discord.utils.utcnow() - interaction.created_at).total_seconds()
+    metrics.histogram(
+        "interaction_first_response_seconds",
+        "상호작용 생성부터 첫 응답까지 걸린 시간",
+        ("handler",)
+    ).observe(max(elapsed, 0.0), handler=handler)
+
+
+def instrument_interaction(handler: str):
+    """
+    상호작용 핸들러 전체 실행 시간과 예외 수를 기록하는 데코레이터
+
+    Args:
+        handler: 핸들러 이름 (지표 레이블)
+    """
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs) -> T:
+            interaction = next((arg for arg in args if isinstance(arg, discord.Interaction)), None)
+            metrics = getattr(getattr(interaction, "client", None), "metrics", None)
+            started = time.perf_counter()
+            try:
+                return await func(*args, **kwargs)
+            except Exception:
+                if metrics is not None:
+                    metrics.counter(
+                        "interaction_errors_total", "상호작용 핸들러 예외 수", ("handler",)
+                    ).inc(handler=handler)
+                raise
+            finally:
+                if metrics is not None:
+                    metrics.histogram(
+                        "interaction_duration_seconds", "상호작용 핸들러 전체 실행 시간", ("handler",)
+                    ).observe(time.perf_counter() - started, handler=handler)
+        return wrapper
+    return decorator
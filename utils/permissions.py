@@ -0,0 +1,218 @@
+"""
+명령어 권한 확인
+관리자 역할과 config.yml의 권한 등급(tier)을 길드별 frozenset으로 미리 계산하고, 멤버별 판정 결과를 캐시
+"""
+
+import time
+from typing import Any, Awaitable, Callable, Optional, Union
+
+import discord
+from discord import app_commands
+
+ADMIN = "admin"          # administrator_role_ids (모든 등급의 권한을 가짐)
+EVERYONE = "everyone"    # 누구나 사용 가능
+
+
+def _role_ids(key: str, role_ids: Any) -> frozenset[int]:
+    """
+    설정의 역할 ID 목록을 정수 집합으로 변환
+
+    Raises:
+        ValueError: 숫자가 아닌 역할 ID가 있는 경우 (설정 키와 값을 알려줌)
+    """
+    if role_ids is None:
+        return frozenset()
+    if not isinstance(role_ids, list):
+        raise ValueError(f"{key}는 역할 ID 목록이어야 합니다")
+    ids = set()
+    for role_id in role_ids:
+        try:
+            ids.add(int(role_id))
+        except (TypeError, ValueError):
+            raise ValueError(f"{key}에 숫자가 아닌 역할 ID가 있습니다: {role_id!r}") from None
+    return frozenset(ids)
+
+
+class Authorizer:
+    """
+    역할 기반 권한 판정
+
+    명령어마다 필요한 등급을 설정에서 한 번만 읽어 두고, 멤버가 가진 등급 집합을
+    (길드 ID, 멤버 ID)별로 캐시하므로 명령어 확인은 딕셔너리 조회 두 번으로 끝난다.
+    멤버 역할이 바뀌거나(on_member_update) 역할이 삭제되면 캐시를 비운다.
+    members 인텐트가 없으면 멤버 이벤트가 오지 않으므로 cache_ttl이 지나면 다시 계산한다.
+
+    Attributes:
+        tier_roles: 등급 이름 → 역할 ID 집합 (admin은 administrator_role_ids)
+        command_tiers: 명령어/작업 이름 → 필요한 등급 (설정하지 않은 명령어는 admin)
+        cache_ttl: 멤버별 판정 결과 유지 시간 (초)
+        max_entries: 최대 캐시 멤버 수
+    """
+
+    def __init__(self, config: dict):
+        self.configure(config)
+
+    def configure(self, config: dict) -> None:
+        """
+        설정에서 등급과 명령어별 필요 등급을 읽고 캐시를 비움 (설정 다시 읽기 시에도 사용)
+
+        Raises:
+            ValueError: 예약된 등급 이름을 쓰거나 명령어에 알 수 없는 등급을 지정한 경우
+        """
+        permissions = config.get("permissions") or {}
+        tier_roles: dict[str, frozenset[int]] = {
+            ADMIN: _role_ids("administrator_role_ids", config.get("administrator_role_ids"))
+        }
+        for tier, role_ids in (permissions.get("tiers") or {}).items():
+            if tier in (ADMIN, EVERYONE):
+                raise ValueError(f"'{tier}'은(는) 예약된 등급 이름입니다")
+            tier_roles[tier] = _role_ids(f"permissions.tiers.{tier}", role_ids)
+
+        command_tiers: dict[str, str] = {}
+        for command, tier in (permissions.get("commands") or {}).items():
+            if tier != EVERYONE and tier not in tier_roles:
+                raise ValueError(f"명령어 '{command}'에 알 수 없는 등급이 설정되었습니다: {tier}")
+            command_tiers[command] = tier
+
+        # 검증이 끝난 뒤 한꺼번에 교체
+        self.tier_roles = tier_roles
+        self.command_tiers = command_tiers
+
+        self.cache_ttl = permissions.get("cache_ttl", 60.0)
+        self.max_entries = permissions.get("max_cached_members", 10000)
+        self._guild_tiers: dict[int, dict[str, frozenset[int]]] = {}
+        self._decisions: dict[tuple[int, int], tuple[float, frozenset[str]]] = {}
+
+    # ==================== 판정 ====================
+
+    def required_tier(self, command: str, default: str = ADMIN) -> str:
+        """명령어에 필요한 등급"""
+        return self.command_tiers.get(command, default)
+
+    def allowed(self, user: Union[discord.Member, discord.User], command: str, default: str = ADMIN) -> bool:
+        """
+        명령어 실행 권한 확인
+
+        Args:
+            user: 상호작용 사용자 (DM이면 User라서 관리 명령어는 항상 거부)
+            command: 명령어 또는 작업 이름 (예: "일괄등록", "whitelist_add")
+            default: 설정에 없는 명령어의 등급
+        """
+        tier = self.command_tiers.get(command, default)
+        if tier == EVERYONE:
+            return True
+        granted = self.tiers(user)
+        return ADMIN in granted or tier in granted
+
+    def tiers(self, user: Union[discord.Member, discord.User]) -> frozenset[str]:
+        """사용자가 가진 등급 집합 (캐시)"""
+        if not isinstance(user, discord.Member):
+            return frozenset()
+
+        key = (user.guild.id, user.id)
+        now = time.monotonic()
+        cached = self._decisions.get(key)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+
+        granted = frozenset(
+            tier for tier, role_ids in self._roles_for(user.guild).items()
+            if any(user.get_role(role_id) is not None for role_id in role_ids)
+        )
+        if len(self._decisions) >= self.max_entries:
+            self._decisions.pop(next(iter(self._decisions)))  # 가장 오래된 항목부터 제거
+        self._decisions.pop(key, None)
+        self._decisions[key] = (now + self.cache_ttl, granted)
+        return granted
+
+    def _roles_for(self, guild: discord.Guild) -> dict[str, frozenset[int]]:
+        """길드에 실제로 있는 역할만 남긴 등급별 역할 집합"""
+        roles = self._guild_tiers.get(guild.id)
+        if roles is None:
+            existing = {role.id for role in guild.roles}
+            roles = {tier: role_ids & existing for tier, role_ids in self.tier_roles.items()}
+            self._guild_tiers[guild.id] = roles
+        return roles
+
+    # ==================== 캐시 무효화 ====================
+
+    def invalidate_member(self, guild_id: int, member_id: int) -> None:
+        self._decisions.pop((guild_id, member_id), None)
+
+    def invalidate_guild(self, guild_id: int) -> None:
+        self._guild_tiers.pop(guild_id, None)
+        for key in [key for key in self._decisions if key[0] == guild_id]:
+            del self._decisions[key]
+
+    async def on_member_update(self, before: discord.Member, after: discord.Member) -> None:
+        if before.roles != after.roles:
+            self.invalidate_member(after.guild.id, after.id)
+
+    async def on_member_remove(self, member: discord.Member) -> None:
+        self.invalidate_member(member.guild.id, member.id)
+
+    async def on_guild_role_create(self, role: discord.Role) -> None:
+        self.invalidate_guild(role.guild.id)
+
+    async def on_guild_role_delete(self, role: discord.Role) -> None:
+        self.invalidate_guild(role.guild.id)
+
+    async def on_guild_remove(self, guild: discord.Guild) -> None:
+        self.invalidate_guild(guild.id)
+
+    def listeners(self) -> list[tuple[Callable[..., Awaitable[None]], str]]:
+        """봇에 등록할 (이벤트 처리 함수, 이벤트 이름) 목록"""
+        return [
+            (self.on_member_update, "on_member_update"),
+            (self.on_member_remove, "on_member_remove"),
+            (self.on_guild_role_create, "on_guild_role_create"),
+            (self.on_guild_role_delete, "on_guild_role_delete"),
+            (self.on_guild_remove, "on_guild_remove"),
+        ]
+
+    # ==================== 명령어 표시 ====================
+
+    def admin_only_commands(self, tree: app_commands.CommandTree) -> set[str]:
+        """Discord에서 관리자에게만 표시할(관리자 등급이 필요한) 명령어 이름"""
+        return {
+            command.qualified_name for command in tree.walk_commands()
+            if command.extras.get("permission") is not None
+            and self.required_tier(command.extras["permission"]) == ADMIN
+        }
+
+    def apply_default_permissions(self, tree: app_commands.CommandTree) -> None:
+        """
+        관리자 전용이 아닌 등급이 설정된 명령어는 Discord 기본 권한(관리자만 표시)을 해제하고,
+        다시 관리자 전용이 된 명령어는 되돌림
+        명령어 동기화 직전에 호출한다.
+        """
+        for command in tree.walk_commands():
+            permission = command.extras.get("permission")
+            if permission is None:
+                continue
+            if self.required_tier(permission) == ADMIN:
+                command.default_permissions = discord.Permissions(administrator=True)
+            else:
+                command.default_permissions = None
+
+
+def has_permission(command: Optional[str] = None):
+    """
+    권한 등급을 확인하는 데코레이터 (@app_commands.command 위에 사용)
+    기본적으로 Discord에서 관리자에게만 명령어가 보이도록 하고, 설정에서 다른 등급을 지정하면 동기화 시 해제된다.
+
+    Args:
+        command: 권한 설정 키 (기본값: 슬래시 명령어 이름)
+    """
+    def wrapper(func: app_commands.Command) -> app_commands.Command:
+        key = command or func.name
+
+        async def predicate(interaction: discord.Interaction) -> bool:
+            return interaction.client.authorizer.allowed(interaction.user, key)
+
+        func = app_commands.check(predicate)(func)
+        func.extras["permission"] = key
+        func.default_permissions = discord.Permissions(administrator=True)
+        return func
+
+    return wrapper
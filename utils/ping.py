@@ -0,0 +1,310 @@
+"""
+RCON 없이 서버 상태 조회
+Server List Ping(TCP, 멀티플레이 서버 목록과 같은 방식)과 GS4 Query(UDP, server.properties의 enable-query) 클라이언트
+"""
+
+import asyncio
+import json
+import random
+import re
+import struct
+import time
+from typing import Any
+
+from utils.status import ServerSnapshot
+
+PROTOCOL_VERSION = -1            # 상태 조회에는 프로토콜 버전이 필요 없음
+MAX_STATUS_PACKET = 1024 * 1024  # 상태 응답 최대 크기
+EMPTY_UUID = "00000000-0000-0000-0000-000000000000"  # 플러그인이 sample에 넣는 가짜 항목
+PONG_TIMEOUT = 1.0               # 핑/퐁 단계 제한 시간 (넘으면 상태 응답 왕복 시간 사용)
+
+QUERY_MAGIC = b"\xfe\xfd"
+QUERY_HANDSHAKE = 9
+QUERY_STAT = 0
+QUERY_PADDING = 11                             # 전체 상태 응답의 "splitnum\x00\x80\x00"
+QUERY_PLAYERS_MARKER = b"\x00\x01player_\x00\x00"
+
+_FORMATTING_CODES = re.compile(r"§.")
+
+
+class StatusError(Exception):
+    """상태 조회 응답 오류"""
+
+
+# ==================== 공통 ====================
+
+def _pack_varint(value: int) -> bytes:
+    value &= 0xFFFFFFFF
+    out = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def _unpack_varint(data: bytes, offset: int = 0) -> tuple[int, int]:
+    """
+    바이트열에서 VarInt 읽기
+
+    Returns:
+        tuple[int, int]: (값, 다음 오프셋)
+    """
+    result = 0
+    for shift in range(0, 35, 7):
+        if offset >= len(data):
+            raise StatusError("VarInt가 잘렸습니다")
+        byte = data[offset]
+        offset += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, offset
+    raise StatusError("VarInt가 너무 깁니다")
+
+
+async def _read_varint(reader: asyncio.StreamReader) -> int:
+    result = 0
+    for shift in range(0, 35, 7):
+        byte = (await reader.readexactly(1))[0]
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result
+    raise StatusError("VarInt가 너무 깁니다")
+
+
+def _pack_string(text: str) -> bytes:
+    data = text.encode("utf-8")
+    return _pack_varint(len(data)) + data
+
+
+def _packet(packet_id: int, payload: bytes = b"") -> bytes:
+    body = _pack_varint(packet_id) + payload
+    return _pack_varint(len(body)) + body
+
+
+def flatten_motd(description: Any) -> str:
+    """
+    MOTD(문자열 또는 채팅 컴포넌트)를 서식 코드 없는 한 줄 문자열로 변환
+
+    Args:
+        description: 상태 JSON의 description 값
+
+    Returns:
+        str: MOTD 텍스트
+    """
+    def collect(component: Any) -> str:
+        if isinstance(component, str):
+            return component
+        if isinstance(component, list):
+            return "".join(collect(part) for part in component)
+        if isinstance(component, dict):
+            return collect(component.get("text", "")) + collect(component.get("extra", []))
+        return ""
+
+    return " ".join(_FORMATTING_CODES.sub("", collect(description)).split())
+
+
+# ==================== Server List Ping ====================
+
+async def server_list_ping(host: str, port: int = 25565, timeout: float = 3.0) -> ServerSnapshot:
+    """
+    Server List Ping으로 상태 조회 (1.7 이상)
+
+    Args:
+        host: 서버 주소
+        port: 게임 포트
+        timeout: 전체 제한 시간 (초)
+
+    Returns:
+        ServerSnapshot: 인원, 플레이어 샘플(최대 12명), MOTD, 버전, 핑 지연 시간
+
+    Raises:
+        StatusError: 응답 형식 오류
+        OSError / asyncio.TimeoutError: 연결 실패 / 시간 초과
+    """
+    return await asyncio.wait_for(_server_list_ping(host, port, min(PONG_TIMEOUT, timeout / 3)), timeout)
+
+
+async def _server_list_ping(host: str, port: int, pong_timeout: float = PONG_TIMEOUT) -> ServerSnapshot:
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        handshake = _pack_varint(PROTOCOL_VERSION) + _pack_string(host) + struct.pack(">H", port) + _pack_varint(1)
+        started = time.perf_counter()
+        writer.write(_packet(0x00, handshake) + _packet(0x00))
+        await writer.drain()
+
+        length = await _read_varint(reader)
+        if not 0 < length <= MAX_STATUS_PACKET:
+            raise StatusError(f"상태 응답 길이가 잘못되었습니다 ({length})")
+        data = await reader.readexactly(length)
+        latency = time.perf_counter() - started
+
+        packet_id, offset = _unpack_varint(data)
+        if packet_id != 0x00:
+            raise StatusError(f"예상하지 못한 패킷입니다 ({packet_id:#x})")
+        size, offset = _unpack_varint(data, offset)
+        status = json.loads(data[offset:offset + size].decode("utf-8"))
+
+        # 핑/퐁 왕복 시간 (응답이 없거나 늦으면 상태 응답 왕복 시간 사용)
+        try:
+            latency = await asyncio.wait_for(_ping_pong(reader, writer), pong_timeout)
+        except (OSError, EOFError, asyncio.TimeoutError, StatusError):
+            pass
+    except EOFError as e:
+        # asyncio.IncompleteReadError 포함 (연결을 받은 뒤 응답 없이 닫음)
+        raise StatusError("서버가 상태 응답 전에 연결을 종료했습니다") from e
+    except (ValueError, UnicodeDecodeError) as e:
+        raise StatusError(f"상태 응답을 해석할 수 없습니다: {e}") from e
+    finally:
+        writer.close()
+
+    try:
+        return _parse_status(status, latency)
+    except (AttributeError, KeyError, TypeError, ValueError) as e:
+        raise StatusError(f"상태 응답 형식이 잘못되었습니다: {e}") from e
+
+
+async def _ping_pong(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> float:
+    """
+    핑/퐁 왕복 시간
+
+    Raises:
+        StatusError: 퐁 토큰이 보낸 값과 다른 경우
+    """
+    token = random.getrandbits(63)
+    started = time.perf_counter()
+    writer.write(_packet(0x01, struct.pack(">q", token)))
+    await writer.drain()
+    length = await _read_varint(reader)
+    pong = await reader.readexactly(length)
+    if pong[1:] != struct.pack(">q", token):
+        raise StatusError("퐁 응답이 잘못되었습니다")
+    return time.perf_counter() - started
+
+
+def _parse_status(status: Any, latency: float) -> ServerSnapshot:
+    """
+    상태 JSON을 스냅샷으로 변환
+
+    Raises:
+        AttributeError / KeyError / TypeError / ValueError: 예상한 형태가 아닌 경우
+    """
+    if not isinstance(status, dict):
+        raise TypeError("최상위 값이 객체가 아닙니다")
+    players = status.get("players") or {}
+    sample = [
+        entry["name"] for entry in players.get("sample") or []
+        if isinstance(entry, dict) and isinstance(entry.get("name"), str)
+        and entry["name"] and entry.get("id") != EMPTY_UUID and "§" not in entry["name"]
+    ]
+    version = status.get("version") or {}
+    return ServerSnapshot(
+        player_count=int(players.get("online", 0)),
+        max_players=int(players.get("max", 0)),
+        players=sample,
+        motd=flatten_motd(status.get("description", "")),
+        version=version.get("name") if isinstance(version, dict) else None,
+        latency=latency
+    )
+
+
+# ==================== GS4 Query ====================
+
+class _QueryProtocol(asyncio.DatagramProtocol):
+    def __init__(self):
+        self.responses: asyncio.Queue = asyncio.Queue()
+
+    def datagram_received(self, data: bytes, addr) -> None:
+        self.responses.put_nowait(data)
+
+    def error_received(self, exc: Exception) -> None:
+        self.responses.put_nowait(exc)
+
+
+async def query_status(host: str, port: int = 25565, timeout: float = 3.0) -> ServerSnapshot:
+    """
+    GS4 Query 전체 상태 조회 (server.properties에서 enable-query=true 필요)
+    Server List Ping과 달리 전체 플레이어 목록을 받을 수 있다.
+
+    Args:
+        host: 서버 주소
+        port: 쿼리 포트 (query.port, 기본값은 게임 포트와 같음)
+        timeout: 전체 제한 시간 (초)
+
+    Returns:
+        ServerSnapshot: 인원, 전체 플레이어 목록, MOTD, 버전, 핸드셰이크 왕복 시간
+
+    Raises:
+        StatusError: 응답 형식 오류
+        OSError / asyncio.TimeoutError: 연결 실패 / 시간 초과
+    """
+    return await asyncio.wait_for(_query_status(host, port), timeout)
+
+
+async def _query_status(host: str, port: int) -> ServerSnapshot:
+    loop = asyncio.get_running_loop()
+    transport, protocol = await loop.create_datagram_endpoint(_QueryProtocol, remote_addr=(host, port))
+    session = random.getrandbits(32) & 0x0F0F0F0F
+
+    async def exchange(packet_type: int, payload: bytes) -> bytes:
+        transport.sendto(QUERY_MAGIC + bytes([packet_type]) + struct.pack(">i", session) + payload)
+        while True:
+            data = await protocol.responses.get()
+            if isinstance(data, Exception):
+                raise data
+            if len(data) >= 5 and data[0] == packet_type and struct.unpack_from(">i", data, 1)[0] == session:
+                return data[5:]
+
+    try:
+        started = time.perf_counter()
+        challenge = await exchange(QUERY_HANDSHAKE, b"")
+        latency = time.perf_counter() - started
+        try:
+            token = int(challenge.split(b"\x00", 1)[0])
+        except ValueError as e:
+            raise StatusError("쿼리 핸드셰이크 응답이 잘못되었습니다") from e
+        data = await exchange(QUERY_STAT, struct.pack(">I", token & 0xFFFFFFFF) + b"\x00\x00\x00\x00")
+    finally:
+        transport.close()
+
+    info_part, marker, player_part = data[QUERY_PADDING:].partition(QUERY_PLAYERS_MARKER)
+    if not marker:
+        raise StatusError("쿼리 응답 형식이 잘못되었습니다")
+
+    fields = info_part.decode("utf-8", errors="replace").split("\x00")
+    info = dict(zip(fields[0::2], fields[1::2]))
+    players = [name for name in player_part.decode("utf-8", errors="replace").split("\x00") if name]
+    try:
+        player_count = int(info.get("numplayers", len(players)))
+        max_players = int(info.get("maxplayers", 0))
+    except ValueError as e:
+        raise StatusError("쿼리 응답의 인원 값이 잘못되었습니다") from e
+
+    return ServerSnapshot(
+        player_count=player_count,
+        max_players=max_players,
+        players=players,
+        motd=flatten_motd(info.get("hostname", "")),
+        version=info.get("version"),
+        latency=latency
+    )
+
+
+async def fetch_status(backend: str, host: str, port: int, timeout: float = 3.0) -> ServerSnapshot:
+    """
+    설정한 방식으로 상태 조회
+
+    Args:
+        backend: "ping" (Server List Ping) 또는 "query" (GS4 Query)
+        host: 서버 주소
+        port: 게임 포트 또는 쿼리 포트
+        timeout: 제한 시간 (초)
+    """
+    if backend == "query":
+        return await query_status(host, port, timeout)
+    if backend == "ping":
+        return await server_list_ping(host, port, timeout)
+    raise ValueError(f"알 수 없는 상태 조회 방식입니다: {backend}")
@@ -0,0 +1,469 @@
+"""
+비동기 RCON 클라이언트
+마인크래프트 RCON 프로토콜을 asyncio로 직접 구현하고 서버별 연결 풀을 제공
+"""
+
+import asyncio
+import itertools
+import struct
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+
+# ==================== 프로토콜 상수 ====================
+
+PACKET_TYPE_RESPONSE = 0   # SERVERDATA_RESPONSE_VALUE
+PACKET_TYPE_COMMAND = 2    # SERVERDATA_EXECCOMMAND / SERVERDATA_AUTH_RESPONSE
+PACKET_TYPE_AUTH = 3       # SERVERDATA_AUTH
+PACKET_TYPE_PING = 200     # 알 수 없는 타입: 서버가 메인 스레드를 거치지 않고 바로 응답
+
+AUTH_FAILED_ID = -1
+MAX_PAYLOAD_SIZE = 1446    # 클라이언트 → 서버 페이로드 최대 크기
+MAX_FRAGMENT_SIZE = 4096   # 서버 → 클라이언트 응답 조각 최대 크기 (이보다 긴 응답은 여러 패킷으로 나뉨)
+READ_CHUNK_SIZE = 65536
+
+_HEADER = struct.Struct("<iii")
+
+
+class RconError(Exception):
+    """RCON 통신 오류"""
+
+
+class RconAuthError(RconError):
+    """RCON 인증 실패"""
+
+
+class RconPayloadError(RconError):
+    """보낼 수 없는 페이로드 (너무 긴 명령어 등, 연결을 사용하기 전에 발생)"""
+
+
+def check_payload(payload: str) -> bytes:
+    """
+    페이로드 크기 확인
+
+    Returns:
+        bytes: UTF-8로 인코딩한 페이로드
+
+    Raises:
+        RconPayloadError: 인코딩한 크기가 MAX_PAYLOAD_SIZE를 넘는 경우
+    """
+    body = payload.encode("utf-8")
+    if len(body) > MAX_PAYLOAD_SIZE:
+        raise RconPayloadError(f"명령어가 너무 깁니다 ({len(body)} > {MAX_PAYLOAD_SIZE} bytes)")
+    return body
+
+
+def encode_packet(request_id: int, packet_type: int, payload: str) -> bytes:
+    """
+    RCON 패킷 직렬화
+
+    Args:
+        request_id: 요청 ID
+        packet_type: 패킷 타입
+        payload: 페이로드 문자열
+
+    Returns:
+        bytes: 길이 접두사가 포함된 패킷
+
+    Raises:
+        RconPayloadError: 페이로드가 MAX_PAYLOAD_SIZE를 넘는 경우
+    """
+    body = check_payload(payload)
+    return _HEADER.pack(len(body) + 10, request_id, packet_type) + body + b"\x00\x00"
+
+
+# ==================== 클라이언트 ====================
+
+class PacketReader:
+    """
+    버퍼 기반 RCON 패킷 리더
+
+    소켓에서 큰 덩어리로 읽어 하나의 bytearray에 모으고 오프셋으로 패킷을 잘라내므로
+    파이프라인 응답처럼 패킷이 연달아 올 때 패킷마다 readexactly를 두 번 기다리지 않는다.
+    """
+
+    def __init__(self, reader: asyncio.StreamReader):
+        self._reader = reader
+        self._buffer = bytearray()
+        self._offset = 0
+
+    async def _fill(self, size: int) -> None:
+        """버퍼에 읽지 않은 데이터가 size바이트 이상 쌓일 때까지 읽기"""
+        while len(self._buffer) - self._offset < size:
+            if self._offset:
+                # 이미 처리한 앞부분은 한 번에 버린다
+                del self._buffer[:self._offset]
+                self._offset = 0
+            chunk = await self._reader.read(READ_CHUNK_SIZE)
+            if not chunk:
+                raise RconError("서버가 RCON 연결을 종료했습니다")
+            self._buffer += chunk
+
+    async def read_packet(self) -> tuple[int, int, bytes]:
+        """
+        패킷 하나 읽기
+
+        Returns:
+            tuple[int, int, bytes]: (요청 ID, 패킷 타입, 본문)
+        """
+        await self._fill(4)
+        (length,) = struct.unpack_from("<i", self._buffer, self._offset)
+        if length < 10:
+            raise RconError(f"잘못된 RCON 패킷 길이: {length}")
+        await self._fill(4 + length)
+
+        start = self._offset + 4
+        request_id, packet_type = struct.unpack_from("<ii", self._buffer, start)
+        self._offset = start + length
+        with memoryview(self._buffer) as view:
+            body = bytes(view[start + 8:self._offset - 2])
+        return request_id, packet_type, body
+
+
+class RconClient:
+    """
+    단일 RCON 연결
+
+    한 연결에서는 한 번에 하나의 요청만 처리하며, 동시 요청은 내부 락으로 직렬화된다.
+    """
+
+    def __init__(self, host: str, port: int, password: str, timeout: float = 5.0):
+        self.host = host
+        self.port = port
+        self.password = password
+        self.timeout = timeout
+        self.last_used = 0.0
+        self._reader: Optional[PacketReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._lock = asyncio.Lock()
+        self._request_ids = itertools.count(1)
+
+    @property
+    def is_connected(self) -> bool:
+        """연결 유지 여부"""
+        return self._writer is not None and not self._writer.is_closing()
+
+    async def connect(self) -> None:
+        """TCP 연결 및 인증"""
+        try:
+            reader, self._writer = await asyncio.wait_for(
+                asyncio.open_connection(self.host, self.port),
+                timeout=self.timeout
+            )
+            self._reader = PacketReader(reader)
+            await asyncio.wait_for(self._authenticate(), timeout=self.timeout)
+        except BaseException:
+            await self.close()
+            raise
+        self.last_used = time.monotonic()
+
+    async def _authenticate(self) -> None:
+        request_id = self._next_id()
+        await self._send(request_id, PACKET_TYPE_AUTH, self.password)
+        while True:
+            response_id, packet_type, _ = await self._reader.read_packet()
+            # 일부 구현은 인증 응답 전에 빈 RESPONSE_VALUE 패킷을 먼저 보낸다
+            if packet_type != PACKET_TYPE_COMMAND:
+                continue
+            if response_id == AUTH_FAILED_ID:
+                raise RconAuthError("RCON 인증 실패: 비밀번호를 확인하세요")
+            if response_id == request_id:
+                return
+
+    async def command(self, command: str) -> str:
+        """
+        명령어 실행
+
+        Args:
+            command: 실행할 명령어
+
+        Returns:
+            str: 서버 응답
+        """
+        return await self._request(PACKET_TYPE_COMMAND, command)
+
+    async def command_many(self, commands: list[str], window: int = 16) -> list[str]:
+        """
+        여러 명령어를 한 연결에서 파이프라인으로 실행
+
+        요청마다 고유 ID를 붙여 응답을 기다리지 않고 연속 전송하며,
+        응답을 받지 못한 요청은 최대 window개까지만 유지한다.
+        마지막에 종료 표시용 요청을 보내, 그 응답이 오면 모든 응답 조각을 받은 것으로 본다.
+
+        Args:
+            commands: 실행할 명령어 목록
+            window: 동시에 응답 대기 중일 수 있는 최대 요청 수
+
+        Returns:
+            list[str]: 입력 순서대로 정렬된 서버 응답
+        """
+        if not self.is_connected:
+            raise RconError("RCON 연결이 닫혀 있습니다")
+        if not commands:
+            return []
+
+        # 연결을 건드리기 전에 모두 직렬화 (너무 긴 명령어가 있으면 멀쩡한 연결을 닫지 않고 실패)
+        packets = [
+            (request_id, encode_packet(request_id, PACKET_TYPE_COMMAND, command))
+            for request_id, command in ((self._next_id(), command) for command in commands)
+        ]
+        indexes = {request_id: index for index, (request_id, _) in enumerate(packets)}
+        window = max(1, window)
+        bodies = [bytearray() for _ in packets]
+        answered = [False] * len(packets)
+
+        async with self._lock:
+            try:
+                terminator_id = None
+                sent = 0
+                received = 0
+                while True:
+                    while sent < len(packets) and sent - received < window:
+                        self._writer.write(packets[sent][1])
+                        sent += 1
+                    if sent == len(packets) and terminator_id is None:
+                        terminator_id = self._next_id()
+                        self._writer.write(encode_packet(terminator_id, PACKET_TYPE_PING, ""))
+                    await self._writer.drain()
+
+                    response_id, _, body = await asyncio.wait_for(
+                        self._reader.read_packet(), timeout=self.timeout
+                    )
+                    if response_id == terminator_id:
+                        break
+                    index = indexes.get(response_id)
+                    if index is None:
+                        continue
+                    if not answered[index]:
+                        # 서버는 요청을 순서대로 처리하므로 첫 조각이 오면 이 요청은 처리된 것
+                        answered[index] = True
+                        received += 1
+                    bodies[index] += body
+            except BaseException:
+                await self.close()
+                raise
+
+        self.last_used = time.monotonic()
+        return [body.decode("utf-8", errors="replace") for body in bodies]
+
+    async def ping(self) -> None:
+        """연결 확인용 빈 요청 (서버 메인 스레드를 사용하지 않음)"""
+        await self._request(PACKET_TYPE_PING, "")
+
+    async def _request(self, packet_type: int, payload: str) -> str:
+        """
+        요청 하나를 보내고 응답 조합
+
+        응답 조각이 최대 크기(MAX_FRAGMENT_SIZE)로 꽉 차 있으면 뒤에 조각이 더 있을 수 있으므로
+        종료 표시용 요청(PACKET_TYPE_PING)을 보내고, 그 응답이 올 때까지 같은 ID의 조각을 이어 붙인다.
+        짧은 응답은 추가 왕복 없이 바로 반환한다.
+        """
+        if not self.is_connected:
+            raise RconError("RCON 연결이 닫혀 있습니다")
+        # 연결을 건드리기 전에 직렬화 (너무 긴 명령어는 연결을 닫지 않고 실패)
+        request_id = self._next_id()
+        packet = encode_packet(request_id, packet_type, payload)
+
+        async with self._lock:
+            try:
+                terminator_id = None
+                body = bytearray()
+                self._writer.write(packet)
+                await self._writer.drain()
+                while True:
+                    response_id, _, fragment = await asyncio.wait_for(
+                        self._reader.read_packet(), timeout=self.timeout
+                    )
+                    if response_id == terminator_id:
+                        break
+                    if response_id != request_id:
+                        continue
+                    body += fragment
+                    if terminator_id is None:
+                        if len(fragment) < MAX_FRAGMENT_SIZE:
+                            break
+                        terminator_id = self._next_id()
+                        await self._send(terminator_id, PACKET_TYPE_PING, "")
+            except BaseException:
+                # 응답 중간에 끊긴 연결은 재사용하지 않는다
+                await self.close()
+                raise
+
+        self.last_used = time.monotonic()
+        return body.decode("utf-8", errors="replace")
+
+    async def _send(self, request_id: int, packet_type: int, payload: str) -> None:
+        self._writer.write(encode_packet(request_id, packet_type, payload))
+        await self._writer.drain()
+
+    def _next_id(self) -> int:
+        # 인증 실패 ID(-1)와 겹치지 않도록 양의 31비트 범위에서 순환
+        request_id = next(self._request_ids) & 0x7FFFFFFF
+        return request_id or self._next_id()
+
+    async def close(self) -> None:
+        """연결 종료"""
+        writer, self._writer, self._reader = self._writer, None, None
+        if writer is None:
+            return
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except (ConnectionError, OSError):
+            pass
+
+
+# ==================== 연결 풀 ====================
+
+class RconPool:
+    """
+    서버별 RCON 연결 풀
+
+    인증된 연결을 재사용하고, 유휴 연결은 주기적으로 확인(keep-alive)하며,
+    끊어진 연결은 다음 요청 시 자동으로 다시 연결한다.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        password: str,
+        max_size: int = 2,
+        timeout: float = 5.0,
+        idle_timeout: float = 300.0,
+        keepalive_interval: float = 30.0
+    ):
+        self.host = host
+        self.port = port
+        self.password = password
+        self.max_size = max(1, max_size)
+        self.timeout = timeout
+        self.idle_timeout = idle_timeout
+        self.keepalive_interval = keepalive_interval
+        self._idle: deque[RconClient] = deque()
+        self._slots = asyncio.Semaphore(self.max_size)
+        self._in_use = 0
+        self._keepalive_task: Optional[asyncio.Task] = None
+        self._closed = False
+
+    @property
+    def in_use(self) -> int:
+        """사용 중인 연결 수"""
+        return self._in_use
+
+    @property
+    def idle_count(self) -> int:
+        """재사용 대기 중인 연결 수"""
+        return len(self._idle)
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[RconClient]:
+        """
+        인증된 연결 대여
+
+        Yields:
+            RconClient: 사용 가능한 연결
+        """
+        if self._closed:
+            raise RconError("RCON 연결 풀이 닫혔습니다")
+        self._ensure_keepalive()
+
+        async with self._slots:
+            client = await self._take_idle()
+            if client is None:
+                client = RconClient(self.host, self.port, self.password, self.timeout)
+                await client.connect()
+            self._in_use += 1
+            try:
+                yield client
+            finally:
+                self._in_use -= 1
+                if client.is_connected and not self._closed:
+                    self._idle.append(client)
+                else:
+                    await client.close()
+
+    async def _take_idle(self) -> Optional[RconClient]:
+        now = time.monotonic()
+        while self._idle:
+            client = self._idle.pop()
+            if client.is_connected and now - client.last_used < self.idle_timeout:
+                return client
+            await client.close()
+        return None
+
+    async def command(self, command: str) -> str:
+        """
+        풀의 연결로 명령어 실행
+        재사용한 연결이 끊어져 있었다면 새 연결로 한 번 재시도
+
+        Args:
+            command: 실행할 명령어
+
+        Returns:
+            str: 서버 응답
+        """
+        check_payload(command)  # 보낼 수 없는 명령어는 연결을 빌리지 않고 실패
+        for attempt in range(2):
+            reused = bool(self._idle)
+            try:
+                async with self.acquire() as client:
+                    return await client.command(command)
+            except (ConnectionError, RconError) as e:
+                if isinstance(e, (RconAuthError, RconPayloadError)) or not reused or attempt:
+                    raise
+        raise RconError("RCON 명령어 실행 실패")
+
+    async def command_many(self, commands: list[str], window: int = 16) -> list[str]:
+        """
+        풀의 연결 하나로 여러 명령어를 파이프라인 실행
+
+        Args:
+            commands: 실행할 명령어 목록
+            window: 동시에 응답 대기 중일 수 있는 최대 요청 수
+
+        Returns:
+            list[str]: 입력 순서대로 정렬된 서버 응답
+        """
+        for command in commands:
+            check_payload(command)
+        async with self.acquire() as client:
+            return await client.command_many(commands, window)
+
+    def _ensure_keepalive(self) -> None:
+        if self.keepalive_interval <= 0:
+            return
+        if self._keepalive_task is None or self._keepalive_task.done():
+            self._keepalive_task = asyncio.create_task(self._keepalive_loop())
+
+    async def _keepalive_loop(self) -> None:
+        while not self._closed:
+            await asyncio.sleep(self.keepalive_interval)
+            now = time.monotonic()
+            for client in list(self._idle):
+                if now - client.last_used < self.keepalive_interval:
+                    continue
+                try:
+                    self._idle.remove(client)
+                except ValueError:
+                    continue  # 그 사이 다른 요청이 가져감
+                try:
+                    await client.ping()
+                except (ConnectionError, RconError, asyncio.TimeoutError):
+                    await client.close()
+                    continue
+                if self._closed:
+                    await client.close()
+                else:
+                    self._idle.append(client)
+
+    async def close(self) -> None:
+        """모든 연결 종료"""
+        self._closed = True
+        if self._keepalive_task is not None:
+            self._keepalive_task.cancel()
+            self._keepalive_task = None
+        while self._idle:
+            await self._idle.pop().close()
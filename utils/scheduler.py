@@ -0,0 +1,223 @@
+"""
+서버별 RCON 명령어 스케줄러
+우선순위 큐(관리 명령어 > 공지 > 조회)와 토큰 버킷으로 서버에 보내는 명령어의 순서와 속도를 조절
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+from typing import Any, Awaitable, Callable
+
+from utils.cache import normalize_command
+from utils.rcon import RconError
+
+# 우선순위 (값이 작을수록 먼저 실행)
+ADMIN = 0          # 화이트리스트/OP/킬 등 관리 명령어와 직접 입력한 명령어
+ANNOUNCEMENT = 1   # 공지
+QUERY = 2          # 읽기 전용 조회
+PRIORITY_NAMES = {ADMIN: "admin", ANNOUNCEMENT: "announcement", QUERY: "query"}
+
+ANNOUNCEMENT_COMMANDS = ("say", "tellraw", "title", "me", "tell", "msg", "w")
+QUERY_COMMANDS = ("list", "whitelist list", "banlist", "seed", "time query", "data get", "help")
+
+
+class QueueFullError(RconError):
+    """대기열이 가득 차 명령어를 받을 수 없음"""
+
+
+def command_priority(command: str) -> int:
+    """
+    명령어 우선순위 분류
+
+    Args:
+        command: RCON 명령어
+
+    Returns:
+        int: ADMIN / ANNOUNCEMENT / QUERY
+    """
+    normalized = normalize_command(command)
+    if any(normalized == query or normalized.startswith(query + " ") for query in QUERY_COMMANDS):
+        return QUERY
+    if normalized.split(" ", 1)[0] in ANNOUNCEMENT_COMMANDS:
+        return ANNOUNCEMENT
+    return ADMIN
+
+
+class TokenBucket:
+    """
+    토큰 버킷 속도 제한
+    토큰이 부족하면 부족분을 빚으로 남기고 그만큼 기다리므로 동시에 호출해도 평균 속도가 rate를 넘지 않는다.
+
+    Attributes:
+        rate: 초당 토큰 수 (0 이하면 제한 없음)
+        burst: 최대 누적 토큰 수
+    """
+
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.burst = max(1.0, burst)
+        self.tokens = self.burst
+        self._updated = time.monotonic()
+
+    async def acquire(self, cost: float = 1.0) -> None:
+        if self.rate <= 0:
+            return
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        self.tokens -= cost
+        if self.tokens < 0:
+            await asyncio.sleep(-self.tokens / self.rate)
+
+
+class _Job:
+    __slots__ = ("priority", "sequence", "cost", "func", "future", "evicted")
+
+    def __init__(self, priority: int, sequence: int, cost: float, func: Callable[[], Awaitable[Any]], future: asyncio.Future):
+        self.priority = priority
+        self.sequence = sequence
+        self.cost = cost
+        self.func = func
+        self.future = future
+        self.evicted = False
+
+    def __lt__(self, other: "_Job") -> bool:
+        return (self.priority, self.sequence) < (other.priority, other.sequence)
+
+
+class CommandScheduler:
+    """
+    우선순위 명령어 대기열
+
+    작업자 concurrency개가 우선순위 순(같은 우선순위는 먼저 들어온 순)으로 작업을 꺼내
+    토큰을 받은 뒤 실행한다. 대기열이 가득 차면 더 낮은 우선순위의 가장 최근 작업을 밀어내고,
+    밀어낼 작업이 없으면 QueueFullError로 거절한다.
+
+    Attributes:
+        concurrency: 동시에 실행할 작업 수 (연결 풀 크기와 같게 설정)
+        max_depth: 최대 대기 작업 수
+    """
+
+    def __init__(self, concurrency: int = 2, rate: float = 50.0, burst: float = 50.0, max_depth: int = 100):
+        self.concurrency = max(1, concurrency)
+        self.max_depth = max(1, max_depth)
+        self.bucket = TokenBucket(rate, burst)
+        self._queue: list[_Job] = []
+        self._ready = asyncio.Semaphore(0)
+        self._sequence = itertools.count()
+        self._depth = {priority: 0 for priority in PRIORITY_NAMES}
+        self._workers: list[asyncio.Task] = []
+        self._running = 0
+        self._closed = False
+
+    @property
+    def depth(self) -> dict[int, int]:
+        """우선순위별 대기 작업 수"""
+        return dict(self._depth)
+
+    async def submit(self, priority: int, func: Callable[[], Awaitable[Any]], cost: float = 1.0) -> Any:
+        """
+        작업을 대기열에 넣고 결과를 기다림
+
+        Args:
+            priority: 우선순위 (ADMIN / ANNOUNCEMENT / QUERY)
+            func: 실행할 코루틴 함수
+            cost: 소모할 토큰 수 (파이프라인 실행 시 명령어 수)
+
+        Returns:
+            Any: func의 결과
+
+        Raises:
+            QueueFullError: 대기열이 가득 찬 경우
+        """
+        if self._closed:
+            raise RconError("명령어 대기열이 닫혔습니다")
+        if sum(self._depth.values()) >= self.max_depth and not self._evict_below(priority):
+            raise QueueFullError(self._busy_message())
+
+        job = _Job(priority, next(self._sequence), cost, func, asyncio.get_running_loop().create_future())
+        heapq.heappush(self._queue, job)
+        self._depth[priority] += 1
+        self._ready.release()
+        self._ensure_workers()
+        return await job.future
+
+    def _evict_below(self, priority: int) -> bool:
+        """priority보다 낮은 우선순위 중 가장 최근 작업을 거절하고 자리를 비움"""
+        candidates = [job for job in self._queue if not job.evicted and job.priority > priority]
+        if not candidates:
+            return False
+        victim = max(candidates)
+        victim.evicted = True
+        self._depth[victim.priority] -= 1
+        if not victim.future.done():
+            victim.future.set_exception(QueueFullError(self._busy_message()))
+        return True
+
+    def _busy_message(self) -> str:
+        return f"⏳ 서버가 바쁩니다. 잠시 후 다시 시도해주세요. (대기 중인 명령어 {sum(self._depth.values())}개)"
+
+    def _ensure_workers(self) -> None:
+        if not self._workers:
+            self._workers = [asyncio.create_task(self._worker()) for _ in range(self.concurrency)]
+
+    async def _worker(self) -> None:
+        while True:
+            await self._ready.acquire()
+            job = heapq.heappop(self._queue)
+            if job.evicted:
+                continue
+            self._depth[job.priority] -= 1
+            if job.future.done():
+                continue  # 기다리던 호출자가 취소됨
+
+            self._running += 1
+            try:
+                await self.bucket.acquire(job.cost)
+                if job.future.done():
+                    continue
+                try:
+                    result = await job.func()
+                except asyncio.CancelledError:
+                    # 종료로 작업자가 취소되면 실행 중이던 작업의 호출자도 기다리지 않도록 거절
+                    if not job.future.done():
+                        job.future.set_exception(RconError("명령어 대기열이 닫혔습니다"))
+                    raise
+                except Exception as e:
+                    if not job.future.done():
+                        job.future.set_exception(e)
+                else:
+                    if not job.future.done():
+                        job.future.set_result(result)
+            finally:
+                self._running -= 1
+
+    async def drain(self, timeout: float) -> bool:
+        """
+        새 작업을 받지 않고 대기 중인 작업과 실행 중인 작업이 끝날 때까지 기다림
+
+        Args:
+            timeout: 최대 대기 시간 (초)
+
+        Returns:
+            bool: 시간 안에 모두 끝났는지 여부
+        """
+        self._closed = True
+        deadline = time.monotonic() + timeout
+        while (sum(self._depth.values()) or self._running) and time.monotonic() < deadline:
+            await asyncio.sleep(0.05)
+        return not (sum(self._depth.values()) or self._running)
+
+    async def close(self) -> None:
+        """작업자를 멈추고 실행 중이거나 대기 중인 작업을 모두 거절"""
+        self._closed = True
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        for job in self._queue:
+            if not job.future.done():
+                job.future.set_exception(RconError("명령어 대기열이 닫혔습니다"))
+        self._queue.clear()
+        self._depth = {priority: 0 for priority in PRIORITY_NAMES}
@@ -0,0 +1,370 @@
+"""
+플레이어 접속 기록
+상태 스냅샷이나 로그 이벤트를 접속/퇴장으로 변환하고, 하나의 쓰기 작업자가 모아서 SQLite에 저장
+"""
+
+import asyncio
+import os
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Optional
+
+JOIN = "join"
+LEAVE = "leave"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY,
+    server TEXT NOT NULL,
+    player TEXT NOT NULL COLLATE NOCASE,
+    joined_at REAL NOT NULL,
+    left_at REAL
+);
+-- 접속 중인 세션만 담는 부분 인덱스 (퇴장 처리, 현재 접속 여부)
+CREATE INDEX IF NOT EXISTS idx_sessions_open ON sessions (player, server) WHERE left_at IS NULL;
+-- 기간별 순위 (퇴장 시각 범위 검색)
+CREATE INDEX IF NOT EXISTS idx_sessions_left ON sessions (left_at);
+
+-- 서버/플레이어별 누적 통계 (세션이 끝날 때마다 갱신하므로 순위와 마지막 접속은 기록 전체를 읽지 않음)
+CREATE TABLE IF NOT EXISTS player_stats (
+    server TEXT NOT NULL,
+    player TEXT NOT NULL COLLATE NOCASE,
+    total_seconds REAL NOT NULL DEFAULT 0,
+    session_count INTEGER NOT NULL DEFAULT 0,
+    last_seen REAL NOT NULL,
+    PRIMARY KEY (server, player)
+);
+CREATE INDEX IF NOT EXISTS idx_stats_playtime ON player_stats (server, total_seconds DESC);
+CREATE INDEX IF NOT EXISTS idx_stats_player ON player_stats (player);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value REAL NOT NULL
+);
+"""
+
+
+@dataclass
+class SessionChange:
+    """
+    접속 상태 변화
+
+    Attributes:
+        kind: join / leave
+        server: 서버 이름
+        player: 플레이어 이름
+        at: 발생 시각 (UNIX time)
+    """
+    kind: str
+    server: str
+    player: str
+    at: float
+
+
+class SessionTracker:
+    """
+    서버별 접속 중인 플레이어를 메모리에 들고 입력을 접속/퇴장 변화로 변환
+
+    로그 이벤트는 그대로 반영하고, 상태 스냅샷은 이전 목록과 비교해 차이만 반영한다.
+    스냅샷보다 늦게 로그 이벤트로 바뀐 플레이어는 스냅샷이 오래된 것이므로 건너뛴다.
+
+    Attributes:
+        online: 서버 이름 → {플레이어 이름: 접속 시각}
+    """
+
+    def __init__(self, grace: float = 300.0):
+        self.online: dict[str, dict[str, float]] = {}
+        self.grace = grace
+        self._changed_at: dict[tuple[str, str], float] = {}
+
+    def apply_event(self, server: str, kind: str, player: str, at: float) -> list[SessionChange]:
+        """
+        로그 이벤트 반영
+
+        Returns:
+            list[SessionChange]: 실제로 상태가 바뀐 경우의 변화 (이미 접속 중인데 접속 이벤트가 오면 빈 목록)
+        """
+        players = self.online.setdefault(server, {})
+        self._changed_at[(server, player)] = at
+        if kind == JOIN and player not in players:
+            players[player] = at
+            return [SessionChange(JOIN, server, player, at)]
+        if kind == LEAVE and player in players:
+            del players[player]
+            return [SessionChange(LEAVE, server, player, at)]
+        return []
+
+    def apply_snapshot(self, server: str, current: Iterable[str], at: float) -> list[SessionChange]:
+        """
+        전체 플레이어 목록 스냅샷을 이전 목록과 비교해 반영
+
+        Args:
+            server: 서버 이름
+            current: 접속 중인 전체 플레이어 (일부만 담긴 샘플은 넘기지 말 것)
+            at: 스냅샷 시각
+
+        Returns:
+            list[SessionChange]: 접속/퇴장 변화
+        """
+        players = self.online.setdefault(server, {})
+        current = set(current)
+        changes = []
+        for player in current - players.keys():
+            if self._changed_at.get((server, player), 0.0) <= at:
+                players[player] = at
+                changes.append(SessionChange(JOIN, server, player, at))
+        for player in players.keys() - current:
+            if self._changed_at.get((server, player), 0.0) <= at:
+                del players[player]
+                changes.append(SessionChange(LEAVE, server, player, at))
+
+        # 오래된 변경 시각은 더 이상 비교할 필요가 없으므로 정리 (메모리 일정 유지)
+        expired = [key for key, changed in self._changed_at.items() if at - changed > self.grace]
+        for key in expired:
+            del self._changed_at[key]
+        return changes
+
+    def close_all(self, at: float) -> list[SessionChange]:
+        """모든 접속 중인 세션을 퇴장 처리 (봇 종료 시)"""
+        changes = [
+            SessionChange(LEAVE, server, player, at)
+            for server, players in self.online.items() for player in players
+        ]
+        self.online.clear()
+        return changes
+
+
+class SessionStore:
+    """
+    SQLite 접속 기록 저장소
+
+    모든 쓰기는 record()로 대기열에 넣고, 쓰기 작업자 하나가 flush_interval 동안 모인 변화를
+    최대 batch_size개씩 한 트랜잭션으로 저장한다. 데이터베이스 연결은 전용 스레드 하나에서만 사용하며
+    조회도 같은 스레드에서 실행된다.
+
+    Attributes:
+        path: 데이터베이스 파일 경로
+        batch_size: 한 트랜잭션에 담을 최대 변화 수
+        flush_interval: 변화를 모으는 시간 (초)
+        heartbeat_interval: 접속 중인 세션이 있을 때 생존 시각을 기록하는 주기 (초)
+        writable: False면 조회만 함 (여러 워커 프로세스 중 기록을 맡지 않은 쪽)
+    """
+
+    def __init__(
+        self,
+        path: str,
+        batch_size: int = 500,
+        flush_interval: float = 2.0,
+        heartbeat_interval: float = 60.0,
+        writable: bool = True
+    ):
+        self.path = path
+        self.writable = writable
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.heartbeat_interval = heartbeat_interval
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sessions")
+        self._connection: Optional[sqlite3.Connection] = None
+        self._queue: asyncio.Queue[Optional[SessionChange]] = asyncio.Queue()
+        self._writer: Optional[asyncio.Task] = None
+        self._open_sessions = 0
+        self._closing = asyncio.Event()
+
+    async def _run(self, func: Callable[..., Any], *args) -> Any:
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    # ==================== 시작 / 종료 ====================
+
+    async def open(self) -> int:
+        """
+        데이터베이스를 열고 쓰기 작업자 시작
+
+        Returns:
+            int: 지난 실행에서 닫히지 않은 세션 수 (마지막 생존 시각으로 퇴장 처리됨)
+        """
+        recovered = await self._run(self._open)
+        if self.writable:
+            self._writer = asyncio.create_task(self._write_loop())
+        return recovered
+
+    def _open(self) -> int:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._connection = sqlite3.connect(self.path)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(_SCHEMA)
+        if not self.writable:
+            return 0
+
+        # 비정상 종료로 열린 채 남은 세션은 마지막 생존 시각에 끝난 것으로 처리
+        with self._connection:
+            row = self._connection.execute("SELECT value FROM meta WHERE key = 'heartbeat'").fetchone()
+            heartbeat = row[0] if row else None
+            dangling = self._connection.execute(
+                "SELECT server, player, joined_at FROM sessions WHERE left_at IS NULL"
+            ).fetchall()
+            for server, player, joined_at in dangling:
+                self._close_session(server, player, max(joined_at, heartbeat or joined_at))
+        return len(dangling)
+
+    async def close(self) -> None:
+        """남은 변화를 모두 저장하고 데이터베이스 닫기"""
+        self._closing.set()
+        if self._writer is not None:
+            self._queue.put_nowait(None)  # 대기 중인 쓰기 작업자 깨우기
+            await self._writer
+            self._writer = None
+        if self._connection is not None:
+            await self._run(self._connection.close)
+            self._connection = None
+        self._executor.shutdown(wait=False)
+
+    # ==================== 쓰기 ====================
+
+    def record(self, changes: Iterable[SessionChange]) -> None:
+        """변화를 쓰기 대기열에 추가 (즉시 반환)"""
+        for change in changes:
+            self._queue.put_nowait(change)
+
+    async def _write_loop(self) -> None:
+        while not (self._closing.is_set() and self._queue.empty()):
+            try:
+                batch = [await asyncio.wait_for(self._queue.get(), self.heartbeat_interval)]
+            except asyncio.TimeoutError:
+                if not self._open_sessions:
+                    continue
+                batch = []  # 생존 시각만 기록
+            else:
+                # 첫 변화가 들어오면 flush_interval 동안 더 모은 뒤 한 트랜잭션으로 저장 (종료 중이면 바로 저장)
+                try:
+                    await asyncio.wait_for(self._closing.wait(), self.flush_interval)
+                except asyncio.TimeoutError:
+                    pass
+                while len(batch) < self.batch_size and not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+
+            try:
+                await self._run(self._write_batch, batch)
+            except sqlite3.Error as e:
+                print(f"⚠️  접속 기록 저장 실패 ({len(batch)}건): {e}")
+
+    def _write_batch(self, batch: list[SessionChange]) -> None:
+        with self._connection:
+            for change in batch:
+                if change is None:
+                    continue
+                if change.kind == JOIN:
+                    self._open_session(change.server, change.player, change.at)
+                else:
+                    self._close_session(change.server, change.player, change.at)
+            self._connection.execute(
+                "INSERT INTO meta (key, value) VALUES ('heartbeat', ?) "
+                "ON CONFLICT (key) DO UPDATE SET value = excluded.value",
+                (time.time(),)
+            )
+            self._open_sessions = self._connection.execute(
+                "SELECT COUNT(*) FROM sessions WHERE left_at IS NULL"
+            ).fetchone()[0]
+
+    def _open_session(self, server: str, player: str, at: float) -> None:
+        # 이미 열린 세션이 있으면 (퇴장 기록 누락) 새 접속 시각에 닫고 다시 연다
+        self._close_session(server, player, at)
+        self._connection.execute(
+            "INSERT INTO sessions (server, player, joined_at) VALUES (?, ?, ?)",
+            (server, player, at)
+        )
+        self._connection.execute(
+            "INSERT INTO player_stats (server, player, last_seen) VALUES (?, ?, ?) "
+            "ON CONFLICT (server, player) DO UPDATE SET last_seen = MAX(last_seen, excluded.last_seen)",
+            (server, player, at)
+        )
+
+    def _close_session(self, server: str, player: str, at: float) -> None:
+        row = self._connection.execute(
+            "SELECT id, joined_at FROM sessions WHERE player = ? AND server = ? AND left_at IS NULL",
+            (player, server)
+        ).fetchone()
+        if row is None:
+            return
+        session_id, joined_at = row
+        left_at = max(at, joined_at)
+        self._connection.execute("UPDATE sessions SET left_at = ? WHERE id = ?", (left_at, session_id))
+        self._connection.execute(
+            "INSERT INTO player_stats (server, player, total_seconds, session_count, last_seen) VALUES (?, ?, ?, 1, ?) "
+            "ON CONFLICT (server, player) DO UPDATE SET "
+            "total_seconds = total_seconds + excluded.total_seconds, "
+            "session_count = session_count + 1, "
+            "last_seen = MAX(last_seen, excluded.last_seen)",
+            (server, player, left_at - joined_at, left_at)
+        )
+
+    # ==================== 조회 ====================
+
+    async def leaderboard(
+        self,
+        server: Optional[str] = None,
+        since: Optional[float] = None,
+        limit: int = 10
+    ) -> list[tuple[str, float]]:
+        """
+        플레이 시간 순위 (접속 중인 세션의 현재까지 시간 포함)
+
+        Args:
+            server: 서버 이름 (None이면 모든 서버 합계)
+            since: 이 시각 이후의 플레이 시간만 집계 (None이면 전체 누적)
+            limit: 최대 인원
+
+        Returns:
+            list[tuple[str, float]]: (플레이어, 플레이 시간(초)) 내림차순
+        """
+        return await self._run(self._leaderboard, server, since, limit, time.time())
+
+    def _leaderboard(self, server: Optional[str], since: Optional[float], limit: int, now: float) -> list[tuple[str, float]]:
+        server_filter = "" if server is None else "AND server = :server"
+        params = {"server": server, "since": since, "now": now, "limit": limit}
+
+        if since is None:
+            # 누적 통계 + 접속 중인 세션의 현재까지 시간
+            query = f"""
+                SELECT player, SUM(seconds) AS total FROM (
+                    SELECT player, total_seconds AS seconds FROM player_stats WHERE 1 {server_filter}
+                    UNION ALL
+                    SELECT player, :now - joined_at FROM sessions WHERE left_at IS NULL {server_filter}
+                )
+                GROUP BY player ORDER BY total DESC LIMIT :limit
+            """
+        else:
+            # 기간 안에 끝났거나 아직 열려 있는 세션만 인덱스로 찾아 기간 안의 시간만 합산
+            query = f"""
+                SELECT player, SUM(MIN(COALESCE(left_at, :now), :now) - MAX(joined_at, :since)) AS total FROM (
+                    SELECT player, joined_at, left_at FROM sessions WHERE left_at >= :since {server_filter}
+                    UNION ALL
+                    SELECT player, joined_at, left_at FROM sessions WHERE left_at IS NULL {server_filter}
+                )
+                GROUP BY player HAVING total > 0 ORDER BY total DESC LIMIT :limit
+            """
+        return [(player, float(total)) for player, total in self._connection.execute(query, params)]
+
+    async def last_seen(self, player: str) -> list[tuple[str, float, bool]]:
+        """
+        플레이어의 서버별 마지막 접속 (대소문자 구분 없음)
+
+        Returns:
+            list[tuple[str, float, bool]]: (서버, 마지막 접속 시각, 현재 접속 중 여부) 최근 순
+        """
+        return await self._run(self._last_seen, player)
+
+    def _last_seen(self, player: str) -> list[tuple[str, float, bool]]:
+        online = {
+            server for (server,) in self._connection.execute(
+                "SELECT server FROM sessions WHERE player = ? AND left_at IS NULL", (player,)
+            )
+        }
+        rows = self._connection.execute(
+            "SELECT server, last_seen FROM player_stats WHERE player = ? ORDER BY last_seen DESC", (player,)
+        ).fetchall()
+        return [(server, last_seen, server in online) for server, last_seen in rows]
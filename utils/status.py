@@ -0,0 +1,90 @@
+"""
+마인크래프트 서버 상태 스냅샷
+`list` 응답이나 Server List Ping / Query 결과를 한 번만 파싱해 구조화된 형태로 보관
+"""
+
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+
+
+# 상태 조회 방식 (ping: Server List Ping / query: GS4 Query / rcon: `list` 명령어)
+STATUS_BACKENDS = ("ping", "query", "rcon")
+
+# 예: "There are 2 of a max of 20 players online: player1, player2"
+#     "There are 2/20 players online:player1, player2" (구버전)
+_LIST_PATTERN = re.compile(
+    r"There are (\d+)(?: of a max of |/)(\d+) players online:\s*(.*)",
+    re.DOTALL
+)
+
+# 예: "There are 3 whitelisted player(s): a, b, c" / "There are no whitelisted players"
+_WHITELIST_PATTERN = re.compile(r"There (?:are|is) \d+ whitelisted players?(?:\(s\))?:\s*(.*)", re.DOTALL)
+
+
+@dataclass
+class ServerSnapshot:
+    """
+    서버 상태 스냅샷
+
+    Attributes:
+        player_count: 현재 접속 인원
+        max_players: 최대 인원
+        players: 접속 중인 플레이어 이름 목록 (Server List Ping은 최대 12명 샘플)
+        updated_at: 스냅샷 생성 시각 (UNIX time)
+        motd: 서버 설명 (RCON `list`로 만든 경우 None)
+        version: 서버 버전 이름
+        latency: 조회 왕복 시간 (초)
+    """
+    player_count: int
+    max_players: int
+    players: list[str] = field(default_factory=list)
+    updated_at: float = field(default_factory=time.time)
+    motd: Optional[str] = None
+    version: Optional[str] = None
+    latency: Optional[float] = None
+
+    @property
+    def age(self) -> float:
+        """스냅샷 경과 시간 (초)"""
+        return time.time() - self.updated_at
+
+
+def parse_list_response(response: str) -> Optional[ServerSnapshot]:
+    """
+    `list` 명령어 응답 파싱
+
+    Args:
+        response: RCON 응답 문자열
+
+    Returns:
+        Optional[ServerSnapshot]: 파싱 실패 시 None
+    """
+    match = _LIST_PATTERN.match(response.strip())
+    if not match:
+        return None
+
+    current_players, max_players, player_list = match.groups()
+    players = [name.strip() for name in player_list.split(",") if name.strip()]
+    return ServerSnapshot(
+        player_count=int(current_players),
+        max_players=int(max_players),
+        players=players
+    )
+
+
+def parse_whitelist_response(response: str) -> list[str]:
+    """
+    `whitelist list` 명령어 응답 파싱
+
+    Args:
+        response: RCON 응답 문자열
+
+    Returns:
+        list[str]: 화이트리스트에 등록된 플레이어 이름 (없거나 파싱 실패 시 빈 목록)
+    """
+    match = _WHITELIST_PATTERN.match(response.strip())
+    if not match:
+        return []
+    return [name.strip() for name in match.group(1).split(",") if name.strip()]
@@ -0,0 +1,72 @@
+"""
+시작 단계별 소요 시간 측정
+단계 이름과 소요 시간을 기록하고 JSON Lines 형식으로 저장해 시작 시간 회귀를 추적
+"""
+
+import json
+import os
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+
+class StartupTimer:
+    """
+    시작 단계 타이머
+
+    Attributes:
+        started_at: 측정 시작 시각 (perf_counter 기준)
+        phases: (단계 이름, 소요 시간 초) 목록
+    """
+
+    def __init__(self, started_at: Optional[float] = None):
+        self.started_at = time.perf_counter() if started_at is None else started_at
+        self.phases: list[tuple[str, float]] = []
+
+    def record(self, name: str, seconds: float) -> None:
+        """단계 소요 시간 기록"""
+        self.phases.append((name, seconds))
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """
+        with 블록의 소요 시간을 단계로 기록 (동기/비동기 코드 모두 사용 가능)
+
+        Args:
+            name: 단계 이름
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - started)
+
+    def report(self) -> dict:
+        """
+        측정 결과
+
+        Returns:
+            dict: timestamp, total_seconds, phases({name, seconds} 목록)
+        """
+        return {
+            "timestamp": time.time(),
+            "total_seconds": round(time.perf_counter() - self.started_at, 4),
+            "phases": [{"name": name, "seconds": round(seconds, 4)} for name, seconds in self.phases],
+        }
+
+    def write(self, path: str) -> dict:
+        """
+        측정 결과를 JSON Lines 파일에 한 줄로 추가
+
+        Args:
+            path: 저장 경로
+
+        Returns:
+            dict: 저장한 측정 결과
+        """
+        report = self.report()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with open(path, "a", encoding="utf-8") as report_file:
+            report_file.write(json.dumps(report, ensure_ascii=False) + "\n")
+        return report